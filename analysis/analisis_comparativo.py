@@ -1,14 +1,54 @@
 import numpy as np
-import matplotlib.pyplot as plt
 import pandas as pd
-from scipy import stats
 import os
 from datetime import datetime
-import seaborn as sns
 import re
+import sys
+import json
+import pickle
+import hashlib
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.cache_lectura import CacheLectura
+from utils.almacen import conectar_lectura, consultar_experimentos
+from figuras import tarea_figura, renderizar_tareas, PUNTOS_CONVERGENCIA
+from utils.convergencia import (leer_convergencia, expandir_cambios, indices_de_corrida, matriz_por_corrida,
+                                curva_por_evaluaciones, bandas_convergencia, comprimir_escalones, lttb, MARCA_CAMBIOS,
+                                EXTENSION as EXTENSION_CONVERGENCIA)
+
+
+# Cambiar al modificar el cálculo de comparar_algoritmos (invalida los resultados guardados)
+VERSION_ANALISIS = 1
+
+COLUMNAS_RESUMEN = ['indcorr', 'ebest', 'epop', 'mingl', 'genmax', 'genfin', 'motivo']
+COLUMNAS_DETALLE = ['gen', 'mingl', 'evals', 'corrida']
 
 # Funciones de lectura de archivos.
+def tabla_resumen(filepath):
+    """
+    Lee un archivo de resumen completo con el parser de pandas y devuelve columnas tipadas.
+    
+    Args:
+        filepath (str): Ruta al archivo resumen_*.txt.
+    
+    Returns:
+        pd.DataFrame: Una fila por corrida con las columnas de COLUMNAS_RESUMEN:
+            indcorr, genmax (int64), ebest, epop, mingl (float64), genfin (Int64,
+            nulo en archivos sin criterios de parada) y motivo (str o None).
+    
+    Note:
+        Omite líneas vacías, comentarios y líneas con menos de 5 valores.
+    """
+    
+    try:
+        df = pd.read_csv(filepath, sep=r'\s+', header=None, names=COLUMNAS_RESUMEN, comment='#',
+                         dtype={'motivo': object})
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame(columns=COLUMNAS_RESUMEN)
+    df = df.dropna(subset=COLUMNAS_RESUMEN[:5]).reset_index(drop=True)
+    return df.astype({'indcorr': 'int64', 'ebest': 'float64', 'epop': 'float64', 'mingl': 'float64',
+                      'genmax': 'int64', 'genfin': 'Int64', 'motivo': object})
+
 def read_resumen(filepath):
     """
     Lee un archivo de resumen y extrae los resultados de optimización.
@@ -26,55 +66,196 @@ def read_resumen(filepath):
             - epop (float): Valor de error de la población
             - mingl (float): Valor mínimo global
             - genmax (int): Valor máximo de generación
+            - genfin (int or None): Última generación ejecutada (columna opcional)
+            - motivo (str or None): Motivo de finalización de la corrida (columna opcional)
     
     Note:
         Omite líneas vacías y líneas con menos de 5 valores. Solo procesa
         líneas que coinciden con el formato esperado con exactamente 5 o más valores.
+        Los archivos anteriores a los criterios de parada no tienen las columnas
+        genfin y motivo; en ese caso se devuelven como None.
+        Para columnas tipadas usar tabla_resumen.
     """
     
-    results = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            if line.strip():
-                parts = line.strip().split()
-                if len(parts) >= 5:
-                    results.append({
-                        'indcorr': int(parts[0]),
-                        'ebest': float(parts[1]),
-                        'epop': float(parts[2]),
-                        'mingl': float(parts[3]),
-                        'genmax': int(parts[4])
-                    })
-    return results
+    df = tabla_resumen(filepath)
+    return df.astype(object).where(df.notna(), None).to_dict('records')
 
-def read_detalle(filepath):
+def tabla_detalle(filepath, expandir=True):
     """
-    Lee un archivo de detalle de convergencia y lo parsea en una lista de diccionarios.
-    Se espera que el archivo contenga líneas con tres valores separados por espacios:
-    número de generación, valor mínimo de makespan y número de evaluaciones.
+    Lee un archivo de detalle de convergencia con el parser de pandas.
+    Se espera que el archivo contenga líneas con tres o cuatro valores separados por espacios:
+    número de generación, valor mínimo de makespan, número de evaluaciones y, en archivos
+    nuevos, el índice de corrida. En archivos sin esa columna la corrida se infiere de los
+    reinicios del número de generación.
+    Las líneas que empiezan con '#' son comentarios o marcas de formato.
     
     Args:
         filepath (str): Ruta al archivo que contiene los datos de convergencia.
+        expandir (bool): Si el archivo está en modo por cambios (--detalle-cambios),
+            reconstruye la curva escalonada completa, con una fila por generación.
+            Con False devuelve solo los puntos registrados.
+    
+    Returns:
+        pd.DataFrame: Columnas gen, corrida (int64), mingl (float64) y evals (Int64).
+            Al expandir, evals es NA en las generaciones no registradas (ver
+            curvas_evaluaciones para la curva contra evaluaciones).
+    """
+    
+    modo_cambios = False
+    with open(filepath, 'r') as f:
+        for line in f:
+            if not line.startswith('#'):
+                break
+            modo_cambios = modo_cambios or line.strip() == MARCA_CAMBIOS
+    
+    try:
+        df = pd.read_csv(filepath, sep=r'\s+', header=None, names=COLUMNAS_DETALLE, comment='#')
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame(columns=COLUMNAS_DETALLE)
+    df = df.dropna(subset=COLUMNAS_DETALLE[:3])
+    
+    gens = df['gen'].to_numpy(dtype=np.int64)
+    mingls = df['mingl'].to_numpy(dtype=np.float64)
+    evals = df['evals'].to_numpy(dtype=np.float64)
+    con_corrida = len(df) > 0 and df['corrida'].notna().all()
+    corridas = indices_de_corrida(gens, df['corrida'].to_numpy(dtype=np.int64) if con_corrida else None)
+    
+    if modo_cambios and expandir and len(df) > 0:
+        corridas, gens, mingls, evals = expandir_cambios(gens, mingls, evals, corridas)
+    
+    return pd.DataFrame({'gen': gens.astype(np.int64), 'mingl': mingls.astype(np.float64),
+                         'evals': pd.array(np.rint(evals), dtype='Int64'), 'corrida': corridas.astype(np.int64)})
+
+def read_detalle(filepath, expandir=True):
+    """
+    Lee un archivo de detalle de convergencia y lo parsea en una lista de diccionarios
+    (ver tabla_detalle para el formato y la versión en columnas tipadas).
     
     Returns:
         list: Una lista de diccionarios donde cada diccionario contiene:
             - 'gen' (int): Número de generación
             - 'mingl' (float): Valor mínimo de makespan para esa generación
-            - 'evals' (int): Número de evaluaciones realizadas
+            - 'evals' (int): Número de evaluaciones realizadas (None en las
+              generaciones no registradas del modo por cambios)
+            - 'corrida' (int): Índice de corrida
     """
     
-    convergence = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            if line.strip():
-                parts = line.strip().split()
-                if len(parts) >= 3:
-                    convergence.append({
-                        'gen': int(parts[0]),
-                        'mingl': float(parts[1]),
-                        'evals': int(parts[2])
-                    })
-    return convergence
+    df = tabla_detalle(filepath, expandir)
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+def tabla_detalle_binario(filepath):
+    """
+    Lee un archivo de convergencia binario (detalle_*.evc) como DataFrame con las
+    mismas columnas que tabla_detalle, más 'avg' y 'tiempo'.
+    """
+    
+    return pd.DataFrame(leer_convergencia(filepath))
+
+def read_detalle_binario(filepath):
+    """
+    Lee un archivo de convergencia binario (detalle_*.evc, ver utils/convergencia.py)
+    con el mismo formato de salida que read_detalle.
+    
+    Args:
+        filepath (str): Ruta al archivo .evc.
+    
+    Returns:
+        list: Lista de diccionarios con 'gen', 'mingl' y 'evals', más 'corrida',
+            'avg' y 'tiempo' (segundos desde el inicio de la corrida).
+    """
+    
+    return tabla_detalle_binario(filepath).to_dict('records')
+
+def matriz_convergencia(convergencia, campo='mingl'):
+    """
+    Organiza los puntos de convergencia en una matriz (corridas, generaciones).
+    Las corridas detenidas antes por un criterio de parada conservan su último
+    valor en las generaciones restantes.
+    
+    Args:
+        convergencia (list | pd.DataFrame): Salida de tabla_detalle, read_detalle o
+            sus equivalentes binarios.
+        campo (str): Columna a organizar (por defecto 'mingl').
+    
+    Returns:
+        dict: 'corridas' (ids), 'generaciones' y 'matriz' (np.ndarray), o None si
+            no hay puntos.
+    """
+    
+    if convergencia is None or len(convergencia) == 0:
+        return None
+    df = pd.DataFrame(convergencia)
+    if 'corrida' not in df:
+        df['corrida'] = indices_de_corrida(df['gen'].to_numpy())
+    corridas, generaciones, matriz = matriz_por_corrida(df['corrida'].to_numpy(), df['gen'].to_numpy(),
+                                                        df[campo].to_numpy(dtype=np.float64, na_value=np.nan))
+    return {'corridas': corridas, 'generaciones': generaciones, 'matriz': matriz}
+
+def curvas_evaluaciones(convergencia):
+    """
+    Curva mejor global contra evaluaciones de cada corrida. Solo usa los puntos
+    con evals registrado: en el modo por cambios las generaciones intermedias no
+    tienen evals y no se interpolan.
+    
+    Args:
+        convergencia (list | pd.DataFrame): Salida de tabla_detalle, read_detalle o
+            sus equivalentes binarios.
+    
+    Returns:
+        dict: corrida -> (evals, mingl) como np.ndarray, o None si no hay puntos.
+    """
+    
+    if convergencia is None or len(convergencia) == 0:
+        return None
+    df = pd.DataFrame(convergencia)
+    if 'corrida' not in df:
+        df['corrida'] = indices_de_corrida(df['gen'].to_numpy())
+    return curva_por_evaluaciones(df['corrida'].to_numpy(), df['evals'].to_numpy(dtype=np.float64, na_value=np.nan),
+                                  df['mingl'].to_numpy())
+
+def estadisticas_resumen(tabla):
+    """
+    Estadísticas descriptivas de las corridas de una instancia.
+    
+    Args:
+        tabla (pd.DataFrame): Tabla de resumen (ver tabla_resumen).
+    
+    Returns:
+        dict: mingl (mejor, peor, media, std, mediana), genmax (media, std), ebest
+            medio y total de corridas.
+    """
+    
+    mingls = tabla['mingl'].to_numpy()
+    genmaxs = tabla['genmax'].to_numpy()
+    ebests = tabla['ebest'].to_numpy()
+    return {
+        'mingl_mejor': mingls.min(),
+        'mingl_peor': mingls.max(),
+        'mingl_media': np.mean(mingls),
+        'mingl_std': np.std(mingls),
+        'mingl_mediana': np.median(mingls),
+        'genmax_media': np.mean(genmaxs),
+        'genmax_std': np.std(genmaxs),
+        'ebest_media': np.mean(ebests),
+        'total_corridas': len(mingls)
+    }
+
+def huella_archivo(filepath):
+    """
+    Huella SHA-1 del contenido de un archivo, leído por bloques.
+    
+    Args:
+        filepath (str): Ruta al archivo.
+    
+    Returns:
+        str: Huella en hexadecimal.
+    """
+    
+    huella = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            huella.update(bloque)
+    return huella.hexdigest()
 
 def read_tiempo_ejecucion(filepath):
     """
@@ -90,6 +271,8 @@ def read_tiempo_ejecucion(filepath):
         dict: Un diccionario con dos claves:
             - 'instancia' (str): El nombre de la instancia extraído del archivo.
             - 'tiempo_segundos' (float): El tiempo de ejecución en segundos.
+            - 'memoria_pico_mib' (float): Pico de tracemalloc (None si la corrida no usó --memoria).
+            - 'rss_pico_mib' (float): RSS pico del proceso (None si no se registró).
     
     Note:
         La función espera que el archivo contenga líneas con patrones específicos:
@@ -101,6 +284,8 @@ def read_tiempo_ejecucion(filepath):
 
     tiempo = None
     instancia = None
+    memoria_pico = None
+    rss_pico = None
     
     with open(filepath, 'r') as f:
         for line in f:
@@ -112,8 +297,13 @@ def read_tiempo_ejecucion(filepath):
                 match = re.search(r'(\d+\.?\d*)\s*segundos?', line)
                 if match:
                     tiempo = float(match.group(1))
+            elif line.startswith('Memoria pico:'):
+                memoria_pico = float(line.split(':')[1].split()[0])
+            elif line.startswith('RSS pico:'):
+                rss_pico = float(line.split(':')[1].split()[0])
     
-    return {'instancia': instancia, 'tiempo_segundos': tiempo}
+    return {'instancia': instancia, 'tiempo_segundos': tiempo,
+            'memoria_pico_mib': memoria_pico, 'rss_pico_mib': rss_pico}
 
 # Clase analizador de tiempos
 class AnalizadorEvosocial:
@@ -125,6 +315,9 @@ class AnalizadorEvosocial:
     
     Atributos:
         directorio_salida (str): Directorio de salida para los resultados del análisis
+        cache (CacheLectura): Caché de archivos parseados en <directorio_salida>/cache (None si está desactivado)
+        incremental (bool): Reutiliza los resultados por instancia cuyas entradas no cambiaron
+            (según el manifiesto <directorio_salida>/manifiesto_analisis.json)
         datos_algoritmos (dict): Diccionario que almacena los datos de algoritmos cargados
         resultados_comparacion (dict): Diccionario que almacena los resultados de comparación
     
@@ -142,11 +335,19 @@ class AnalizadorEvosocial:
     y análisis de convergencia.
     """
     
-    def __init__(self, directorio_salida="analisis_resultados"):
+    def __init__(self, directorio_salida="analisis_resultados", usar_cache=True, incremental=True):
         self.directorio_salida = directorio_salida
         self.crear_directorios()
+        self.cache = CacheLectura(os.path.join(directorio_salida, 'cache')) if usar_cache else None
+        self.incremental = incremental
+        self.ruta_manifiesto = os.path.join(directorio_salida, 'manifiesto_analisis.json')
+        self.manifiesto = {}
+        if incremental and os.path.exists(self.ruta_manifiesto):
+            with open(self.ruta_manifiesto, 'r', encoding='utf-8') as f:
+                self.manifiesto = json.load(f)
         self.datos_algoritmos = {}
         self.resultados_comparacion = {}
+        self.huellas_comparacion = {}
     
     def crear_directorios(self):
         """
@@ -165,6 +366,13 @@ class AnalizadorEvosocial:
             path = os.path.join(self.directorio_salida, subdir)
             os.makedirs(path, exist_ok=True)
     
+    def _leer(self, lector, ruta):
+        """Aplica un lector a un archivo pasando por el caché de lecturas si está activo."""
+        
+        if self.cache is None:
+            return lector(ruta)
+        return self.cache.obtener(ruta, lector)
+    
     def cargar_resultados(self, nombre_algoritmo, directorio_base, instancias=None, prefijo="", sufijo=""):
         """
         Carga los resultados de un algoritmo desde archivos de texto en un directorio.
@@ -181,8 +389,9 @@ class AnalizadorEvosocial:
         Returns:
             None: Los resultados se almacenan en self.datos_algoritmos[nombre_algoritmo]
         El método crea una estructura con:
-        - Datos de resumen de cada corrida (makespan mínimo global)
-        - Datos de convergencia (si están disponibles)
+        - Datos de resumen de cada corrida (makespan mínimo global), como lista de
+          diccionarios ('resumen') y como DataFrame tipado ('tabla_resumen')
+        - Datos de convergencia (si están disponibles), como DataFrame tipado
         - Tiempos de ejecución (si están disponibles)
         - Estadísticas descriptivas (mínimo, máximo, media, desviación estándar, mediana)
         Los archivos esperados tienen el formato:
@@ -218,18 +427,24 @@ class AnalizadorEvosocial:
             nombre_completo = f"{prefijo}{nombre_instancia}{sufijo}"
             archivo_resumen = os.path.join(directorio_base, f"resumen_{nombre_completo}.txt")
             archivo_detalle = os.path.join(directorio_base, f"detalle_{nombre_completo}.txt")
+            archivo_detalle_binario = os.path.join(directorio_base, f"detalle_{nombre_completo}{EXTENSION_CONVERGENCIA}")
             archivo_tiempo = os.path.join(directorio_base, f"tiempo_ejecucion_{nombre_algoritmo}_{nombre_completo}.txt")
             
             datos_instancia = {
                 'resumen': [],
+                'tabla_resumen': None,
                 'convergencia': [],
+                'matriz_convergencia': None,
                 'tiempo_ejecucion': None,
+                'entradas': {},
                 'estadisticas': {}
             }
             
             # Cargar resumen
             if os.path.exists(archivo_resumen):
-                datos_instancia['resumen'] = read_resumen(archivo_resumen)
+                tabla = self._leer(tabla_resumen, archivo_resumen)
+                datos_instancia['tabla_resumen'] = tabla
+                datos_instancia['resumen'] = tabla.astype(object).where(tabla.notna(), None).to_dict('records')
                 print(f"    + {len(datos_instancia['resumen'])} corridas cargadas")
             else:
                 print(f"    X No encontrado: {archivo_resumen}")
@@ -237,39 +452,121 @@ class AnalizadorEvosocial:
             
             # Cargar convergencia
             if os.path.exists(archivo_detalle):
-                datos_instancia['convergencia'] = read_detalle(archivo_detalle)
+                datos_instancia['convergencia'] = self._leer(tabla_detalle, archivo_detalle)
                 print(f"    + {len(datos_instancia['convergencia'])} puntos de convergencia")
+            elif os.path.exists(archivo_detalle_binario):
+                datos_instancia['convergencia'] = self._leer(tabla_detalle_binario, archivo_detalle_binario)
+                print(f"    + {len(datos_instancia['convergencia'])} puntos de convergencia (binario)")
             else:
                 print(f"    !  Detalle no encontrado: {archivo_detalle}")
+            datos_instancia['matriz_convergencia'] = matriz_convergencia(datos_instancia['convergencia'])
             
             # Cargar tiempo de ejecución
             if os.path.exists(archivo_tiempo):
-                datos_instancia['tiempo_ejecucion'] = read_tiempo_ejecucion(archivo_tiempo)
+                datos_instancia['tiempo_ejecucion'] = self._leer(read_tiempo_ejecucion, archivo_tiempo)
                 tiempo = datos_instancia['tiempo_ejecucion']['tiempo_segundos']
                 print(f"    + Tiempo de ejecución: {tiempo:.2f} segundos ({tiempo/60:.2f} minutos)")
             else:
                 print(f"    !  Tiempo no encontrado: {archivo_tiempo}")
             
+            # Huellas de contenido de los archivos leídos (para el análisis incremental)
+            for archivo in (archivo_resumen, archivo_detalle, archivo_detalle_binario, archivo_tiempo):
+                if os.path.exists(archivo):
+                    datos_instancia['entradas'][os.path.basename(archivo)] = self._leer(huella_archivo, archivo)
+            
             # Calcular estadísticas
             if datos_instancia['resumen']:
-                mingls = [r['mingl'] for r in datos_instancia['resumen']]
-                genmaxs = [r['genmax'] for r in datos_instancia['resumen']]
-                ebests = [r['ebest'] for r in datos_instancia['resumen']]
-                
-                datos_instancia['estadisticas'] = {
-                    'mingl_mejor': min(mingls),
-                    'mingl_peor': max(mingls),
-                    'mingl_media': np.mean(mingls),
-                    'mingl_std': np.std(mingls),
-                    'mingl_mediana': np.median(mingls),
-                    'genmax_media': np.mean(genmaxs),
-                    'genmax_std': np.std(genmaxs),
-                    'ebest_media': np.mean(ebests),
-                    'total_corridas': len(mingls)
-                }
+                datos_instancia['estadisticas'] = estadisticas_resumen(tabla)
             
             datos_algoritmo['instancias'][nombre_instancia] = datos_instancia
         
+        self.datos_algoritmos[nombre_algoritmo] = datos_algoritmo
+        print(f"+ Carga completada: {len(datos_algoritmo['instancias'])} instancias")
+        if self.cache is not None:
+            print(f"  Caché de lectura: {self.cache.aciertos} aciertos, {self.cache.fallos} archivos parseados")
+        print()
+    
+    def cargar_resultados_sqlite(self, nombre_algoritmo, ruta_db, motor=None, instancias=None,
+                                 prefijo="", sufijo="", huella_config=None):
+        """
+        Carga los resultados de un algoritmo desde una base SQLite escrita por los motores
+        (--sqlite, ver utils/almacen.py), con la misma estructura que cargar_resultados.
+        Las instancias y corridas se obtienen por consultas indexadas en lugar de recorrer
+        un directorio y deducir nombres de archivo.
+        Args:
+            nombre_algoritmo (str): Nombre identificador del algoritmo
+            ruta_db (str): Archivo de la base SQLite
+            motor (str, optional): Motor a cargar ('puro' o 'deap'); por defecto nombre_algoritmo
+            instancias (list, optional): Nombres de instancias (sin prefijo ni sufijo). Si es
+            None, se cargan todas las del motor
+            prefijo (str, optional): Prefijo del nombre de instancia en la base
+            sufijo (str, optional): Sufijo del nombre de instancia en la base
+            huella_config (str, optional): Solo experimentos con esa configuración
+        Returns:
+            None: Los resultados se almacenan en self.datos_algoritmos[nombre_algoritmo]
+        Note:
+            Si hay varios experimentos para un mismo motor e instancia se usa el más reciente.
+        """
+        
+        motor = motor or nombre_algoritmo
+        print(f"- Cargando resultados de '{nombre_algoritmo}' desde: {ruta_db} (motor {motor})")
+        
+        if not os.path.exists(ruta_db):
+            print(f"X No encontrada: {ruta_db}")
+            return
+        
+        conexion = conectar_lectura(ruta_db)
+        try:
+            experimentos = {e['instancia']: e for e in consultar_experimentos(conexion, motor=motor,
+                                                                            huella_config=huella_config)}
+            if instancias is None:
+                instancias = [nombre[len(prefijo):len(nombre) - len(sufijo)] for nombre in experimentos
+                              if nombre.startswith(prefijo) and nombre.endswith(sufijo)]
+            
+            datos_algoritmo = {'instancias': {}}
+            for nombre_instancia in instancias:
+                print(f"  - Cargando instancia: {nombre_instancia}")
+                experimento = experimentos.get(f"{prefijo}{nombre_instancia}{sufijo}")
+                if experimento is None:
+                    print(f"    X Sin experimentos de {motor} para {prefijo}{nombre_instancia}{sufijo}")
+                    continue
+                id_exp = experimento['id']
+                
+                tabla = pd.read_sql_query(
+                    "SELECT corrida AS indcorr, ebest, epop, mingl, genmax, genfin, motivo "
+                    "FROM corridas WHERE experimento = ? ORDER BY corrida", conexion, params=(id_exp,))
+                if tabla.empty:
+                    print(f"    X Experimento {id_exp} sin corridas")
+                    continue
+                tabla = tabla.astype({'indcorr': 'int64', 'genmax': 'int64', 'genfin': 'Int64'})
+                convergencia = pd.read_sql_query(
+                    "SELECT gen, mingl, evals, corrida FROM convergencia WHERE experimento = ? "
+                    "ORDER BY corrida, gen", conexion, params=(id_exp,))
+                tiempo = conexion.execute(
+                    "SELECT segundos, memoria_pico_mib, rss_pico_mib FROM tiempos WHERE experimento = ?",
+                    (id_exp,)).fetchone()
+                
+                datos_instancia = {
+                    'resumen': tabla.astype(object).where(tabla.notna(), None).to_dict('records'),
+                    'tabla_resumen': tabla,
+                    'convergencia': convergencia,
+                    'matriz_convergencia': matriz_convergencia(convergencia),
+                    'tiempo_ejecucion': None,
+                    # Un experimento no cambia una vez escrito: su id y fecha identifican las entradas
+                    'entradas': {'sqlite': f"{os.path.abspath(ruta_db)}#{id_exp}@{experimento['fecha']}"},
+                    'estadisticas': estadisticas_resumen(tabla),
+                    'experimento': experimento
+                }
+                if tiempo is not None:
+                    datos_instancia['tiempo_ejecucion'] = {
+                        'instancia': experimento['instancia'], 'tiempo_segundos': tiempo[0],
+                        'memoria_pico_mib': tiempo[1], 'rss_pico_mib': tiempo[2]}
+                print(f"    + Experimento {id_exp}: {len(tabla)} corridas, {len(convergencia)} puntos de convergencia")
+                
+                datos_algoritmo['instancias'][nombre_instancia] = datos_instancia
+        finally:
+            conexion.close()
+        
         self.datos_algoritmos[nombre_algoritmo] = datos_algoritmo
         print(f"+ Carga completada: {len(datos_algoritmo['instancias'])} instancias\n")
     
@@ -307,6 +604,9 @@ class AnalizadorEvosocial:
         
         El método también almacena resultados en self.resultados_comparacion y llama
         a _guardar_resumen_estadistico para almacenamiento persistente.
+        En modo incremental, las instancias cuyos archivos de entrada (de ambos algoritmos)
+        tienen la misma huella de contenido que en el análisis anterior reutilizan el
+        resultado guardado en <directorio_salida>/cache sin recalcular ni imprimir el detalle.
         
         Raises:
             Imprime mensaje de error si los algoritmos no están cargados en self.datos_algoritmos
@@ -320,129 +620,234 @@ class AnalizadorEvosocial:
             return
         
         if instancias is None:
-            instancias = list(
+            instancias = sorted(
                 set(self.datos_algoritmos[algoritmo1]['instancias'].keys()) & 
                 set(self.datos_algoritmos[algoritmo2]['instancias'].keys())
             )
         
         resultados_comparacion = {}
         
+        clave = f"{algoritmo1}_vs_{algoritmo2}"
+        previos = self._leer_comparaciones(clave) if self.incremental else {}
+        huellas = {}
+        reutilizadas = 0
+        
         for nombre_instancia in instancias:
-            print(f"\n- Instancia: {nombre_instancia}")
-            print("-" * 50)
-            
-            # Obtener datos
-            datos1 = self.datos_algoritmos[algoritmo1]['instancias'][nombre_instancia]['resumen']
-            datos2 = self.datos_algoritmos[algoritmo2]['instancias'][nombre_instancia]['resumen']
-            
-            tiempo1 = self.datos_algoritmos[algoritmo1]['instancias'][nombre_instancia]['tiempo_ejecucion']
-            tiempo2 = self.datos_algoritmos[algoritmo2]['instancias'][nombre_instancia]['tiempo_ejecucion']
-            
-            mingls1 = [r['mingl'] for r in datos1]
-            mingls2 = [r['mingl'] for r in datos2]
-            genmaxs1 = [r['genmax'] for r in datos1]
-            genmaxs2 = [r['genmax'] for r in datos2]
-            
-            # Estadísticas
-            stats1 = {
-                'media': np.mean(mingls1),
-                'std': np.std(mingls1),
-                'mediana': np.median(mingls1),
-                'mejor': np.min(mingls1),
-                'peor': np.max(mingls1),
-                'genmax_media': np.mean(genmaxs1),
-                'tiempo_segundos': tiempo1['tiempo_segundos'] if tiempo1 else None
-            }
-            
-            stats2 = {
-                'media': np.mean(mingls2),
-                'std': np.std(mingls2),
-                'mediana': np.median(mingls2),
-                'mejor': np.min(mingls2),
-                'peor': np.max(mingls2),
-                'genmax_media': np.mean(genmaxs2),
-                'tiempo_segundos': tiempo2['tiempo_segundos'] if tiempo2 else None
-            }
-            
-            # Tests estadísticos
-            try:
-                if len(mingls1) == len(mingls2):
-                    stat_wilcoxon, p_wilcoxon = stats.wilcoxon(mingls1, mingls2, alternative='two-sided')
-                else:
-                    stat_wilcoxon, p_wilcoxon = 0, 1.0
-            except:
-                stat_wilcoxon, p_wilcoxon = 0, 1.0
-            
-            try:
-                stat_mannwhitney, p_mannwhitney = stats.mannwhitneyu(mingls1, mingls2, alternative='two-sided')
-            except:
-                stat_mannwhitney, p_mannwhitney = 0, 1.0
-            
-            # Calcular mejoras
-            mejora_media = ((stats1['media'] - stats2['media']) / stats1['media']) * 100
-            mejora_mejor = ((stats1['mejor'] - stats2['mejor']) / stats1['mejor']) * 100
-            mejora_genmax = ((stats1['genmax_media'] - stats2['genmax_media']) / stats1['genmax_media']) * 100
-            
-            # Mejora en tiempo
-            mejora_tiempo = None
-            if stats1['tiempo_segundos'] and stats2['tiempo_segundos']:
-                mejora_tiempo = ((stats1['tiempo_segundos'] - stats2['tiempo_segundos']) / stats1['tiempo_segundos']) * 100
-            
-            # Mostrar resultados
-            print(f"{algoritmo1:15} → Mejor: {stats1['mejor']:7.2f}  Media: {stats1['media']:7.2f} ± {stats1['std']:5.2f}")
-            if stats1['tiempo_segundos']:
-                print(f"{'':15}   Tiempo: {stats1['tiempo_segundos']:.2f}s ({stats1['tiempo_segundos']/60:.2f} min)")
-            
-            print(f"{algoritmo2:15} → Mejor: {stats2['mejor']:7.2f}  Media: {stats2['media']:7.2f} ± {stats2['std']:5.2f}")
-            if stats2['tiempo_segundos']:
-                print(f"{'':15}   Tiempo: {stats2['tiempo_segundos']:.2f}s ({stats2['tiempo_segundos']/60:.2f} min)")
-            
-            print(f"\nMejoras de {algoritmo2}:")
-            print(f"  Makespan Media:  {mejora_media:+6.2f}%")
-            print(f"  Makespan Mejor:  {mejora_mejor:+6.2f}%")
-            print(f"  GenMax:          {mejora_genmax:+6.2f}% (menos es mejor)")
-            if mejora_tiempo is not None:
-                print(f"  Tiempo:          {mejora_tiempo:+6.2f}% (menos es mejor)")
-            
-            print(f"\nTests estadísticos:")
-            print(f"  Wilcoxon p-value:     {p_wilcoxon:.4f}")
-            print(f"  Mann-Whitney p-value: {p_mannwhitney:.4f}")
-            
-            significativo = min(p_wilcoxon, p_mannwhitney) < 0.05
-            mejor_algoritmo = algoritmo2 if mejora_media > 0 else algoritmo1
-            
-            print(f"\n{'+' if significativo else 'x'} Resultado: {'Significativo' if significativo else 'No significativo'}")
-            print(f"  Mejor algoritmo (calidad): {mejor_algoritmo}")
-            
-            if mejora_tiempo is not None:
-                mejor_tiempo = algoritmo2 if mejora_tiempo > 0 else algoritmo1
-                print(f"  Mejor algoritmo (tiempo):  {mejor_tiempo}")
-            
-            # Guardar resultados
-            resultados_comparacion[nombre_instancia] = {
-                'algoritmo1': algoritmo1,
-                'algoritmo2': algoritmo2,
-                'stats1': stats1,
-                'stats2': stats2,
-                'mejora_media': mejora_media,
-                'mejora_mejor': mejora_mejor,
-                'mejora_genmax': mejora_genmax,
-                'mejora_tiempo': mejora_tiempo,
-                'p_wilcoxon': p_wilcoxon,
-                'p_mannwhitney': p_mannwhitney,
-                'significativo': significativo,
-                'mejor_algoritmo': mejor_algoritmo,
-                'mingls1': mingls1,
-                'mingls2': mingls2,
-                'genmaxs1': genmaxs1,
-                'genmaxs2': genmaxs2
-            }
+            # Reutilizar el resultado si las entradas de ambos algoritmos no cambiaron
+            huellas[nombre_instancia] = self._huella_instancia(algoritmo1, algoritmo2, nombre_instancia)
+            previo = previos.get(nombre_instancia)
+            if previo is not None and previo['huella'] == huellas[nombre_instancia]:
+                resultados_comparacion[nombre_instancia] = previo['resultado']
+                reutilizadas += 1
+                print(f"\n= Instancia sin cambios: {nombre_instancia} (resultado reutilizado)")
+                continue
+            resultados_comparacion[nombre_instancia] = self._comparar_instancia(algoritmo1, algoritmo2,
+                                                                                nombre_instancia)
         
-        self.resultados_comparacion[f"{algoritmo1}_vs_{algoritmo2}"] = resultados_comparacion
+        if reutilizadas:
+            print(f"\n- {reutilizadas}/{len(instancias)} instancias reutilizadas del análisis anterior")
+        self.huellas_comparacion[clave] = huellas
+        if self.incremental:
+            self._guardar_comparaciones(clave, resultados_comparacion, huellas)
+        
+        self.resultados_comparacion[clave] = resultados_comparacion
         self._guardar_resumen_estadistico(algoritmo1, algoritmo2, resultados_comparacion)
         
         return resultados_comparacion
     
+    def _comparar_instancia(self, algoritmo1, algoritmo2, nombre_instancia):
+        """
+        Calcula estadísticas, pruebas y mejoras de una instancia (ver comparar_algoritmos)
+        y las imprime.
+        Returns:
+            dict: Resultado de la comparación de la instancia.
+        """
+        
+        # scipy (~1 s de importación) solo se carga si hay instancias que recalcular
+        from scipy import stats
+
+        print(f"\n- Instancia: {nombre_instancia}")
+        print("-" * 50)
+        
+        # Obtener datos
+        datos1 = self.datos_algoritmos[algoritmo1]['instancias'][nombre_instancia]['resumen']
+        datos2 = self.datos_algoritmos[algoritmo2]['instancias'][nombre_instancia]['resumen']
+        
+        tiempo1 = self.datos_algoritmos[algoritmo1]['instancias'][nombre_instancia]['tiempo_ejecucion']
+        tiempo2 = self.datos_algoritmos[algoritmo2]['instancias'][nombre_instancia]['tiempo_ejecucion']
+        
+        mingls1 = [r['mingl'] for r in datos1]
+        mingls2 = [r['mingl'] for r in datos2]
+        genmaxs1 = [r['genmax'] for r in datos1]
+        genmaxs2 = [r['genmax'] for r in datos2]
+        
+        # Estadísticas
+        stats1 = {
+            'media': np.mean(mingls1),
+            'std': np.std(mingls1),
+            'mediana': np.median(mingls1),
+            'mejor': np.min(mingls1),
+            'peor': np.max(mingls1),
+            'genmax_media': np.mean(genmaxs1),
+            'tiempo_segundos': tiempo1['tiempo_segundos'] if tiempo1 else None
+        }
+        
+        stats2 = {
+            'media': np.mean(mingls2),
+            'std': np.std(mingls2),
+            'mediana': np.median(mingls2),
+            'mejor': np.min(mingls2),
+            'peor': np.max(mingls2),
+            'genmax_media': np.mean(genmaxs2),
+            'tiempo_segundos': tiempo2['tiempo_segundos'] if tiempo2 else None
+        }
+        
+        # Tests estadísticos
+        try:
+            if len(mingls1) == len(mingls2):
+                stat_wilcoxon, p_wilcoxon = stats.wilcoxon(mingls1, mingls2, alternative='two-sided')
+            else:
+                stat_wilcoxon, p_wilcoxon = 0, 1.0
+        except:
+            stat_wilcoxon, p_wilcoxon = 0, 1.0
+        
+        try:
+            stat_mannwhitney, p_mannwhitney = stats.mannwhitneyu(mingls1, mingls2, alternative='two-sided')
+        except:
+            stat_mannwhitney, p_mannwhitney = 0, 1.0
+        
+        # Calcular mejoras
+        mejora_media = ((stats1['media'] - stats2['media']) / stats1['media']) * 100
+        mejora_mejor = ((stats1['mejor'] - stats2['mejor']) / stats1['mejor']) * 100
+        mejora_genmax = ((stats1['genmax_media'] - stats2['genmax_media']) / stats1['genmax_media']) * 100
+        
+        # Mejora en tiempo
+        mejora_tiempo = None
+        if stats1['tiempo_segundos'] and stats2['tiempo_segundos']:
+            mejora_tiempo = ((stats1['tiempo_segundos'] - stats2['tiempo_segundos']) / stats1['tiempo_segundos']) * 100
+        
+        # Mostrar resultados
+        print(f"{algoritmo1:15} → Mejor: {stats1['mejor']:7.2f}  Media: {stats1['media']:7.2f} ± {stats1['std']:5.2f}")
+        if stats1['tiempo_segundos']:
+            print(f"{'':15}   Tiempo: {stats1['tiempo_segundos']:.2f}s ({stats1['tiempo_segundos']/60:.2f} min)")
+        
+        print(f"{algoritmo2:15} → Mejor: {stats2['mejor']:7.2f}  Media: {stats2['media']:7.2f} ± {stats2['std']:5.2f}")
+        if stats2['tiempo_segundos']:
+            print(f"{'':15}   Tiempo: {stats2['tiempo_segundos']:.2f}s ({stats2['tiempo_segundos']/60:.2f} min)")
+        
+        print(f"\nMejoras de {algoritmo2}:")
+        print(f"  Makespan Media:  {mejora_media:+6.2f}%")
+        print(f"  Makespan Mejor:  {mejora_mejor:+6.2f}%")
+        print(f"  GenMax:          {mejora_genmax:+6.2f}% (menos es mejor)")
+        if mejora_tiempo is not None:
+            print(f"  Tiempo:          {mejora_tiempo:+6.2f}% (menos es mejor)")
+        
+        print(f"\nTests estadísticos:")
+        print(f"  Wilcoxon p-value:     {p_wilcoxon:.4f}")
+        print(f"  Mann-Whitney p-value: {p_mannwhitney:.4f}")
+        
+        significativo = min(p_wilcoxon, p_mannwhitney) < 0.05
+        mejor_algoritmo = algoritmo2 if mejora_media > 0 else algoritmo1
+        
+        print(f"\n{'+' if significativo else 'x'} Resultado: {'Significativo' if significativo else 'No significativo'}")
+        print(f"  Mejor algoritmo (calidad): {mejor_algoritmo}")
+        
+        if mejora_tiempo is not None:
+            mejor_tiempo = algoritmo2 if mejora_tiempo > 0 else algoritmo1
+            print(f"  Mejor algoritmo (tiempo):  {mejor_tiempo}")
+        
+        return {
+            'algoritmo1': algoritmo1,
+            'algoritmo2': algoritmo2,
+            'stats1': stats1,
+            'stats2': stats2,
+            'mejora_media': mejora_media,
+            'mejora_mejor': mejora_mejor,
+            'mejora_genmax': mejora_genmax,
+            'mejora_tiempo': mejora_tiempo,
+            'p_wilcoxon': p_wilcoxon,
+            'p_mannwhitney': p_mannwhitney,
+            'significativo': significativo,
+            'mejor_algoritmo': mejor_algoritmo,
+            'mingls1': mingls1,
+            'mingls2': mingls2,
+            'genmaxs1': genmaxs1,
+            'genmaxs2': genmaxs2
+        }
+    
+    def _huella_instancia(self, algoritmo1, algoritmo2, nombre_instancia):
+        """Huella combinada de los archivos de entrada de una instancia en ambos algoritmos."""
+        
+        entradas = {alg: self.datos_algoritmos[alg]['instancias'][nombre_instancia]['entradas']
+                    for alg in (algoritmo1, algoritmo2)}
+        contenido = json.dumps([VERSION_ANALISIS, entradas], sort_keys=True)
+        return hashlib.sha1(contenido.encode('utf-8')).hexdigest()
+    
+    def _ruta_comparaciones(self, clave):
+        return os.path.join(self.directorio_salida, 'cache', f'comparaciones_{clave}.pkl')
+    
+    def _leer_comparaciones(self, clave):
+        """Resultados por instancia del análisis anterior: {instancia: {'huella', 'resultado'}}."""
+        
+        try:
+            with open(self._ruta_comparaciones(clave), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return {}
+    
+    def _guardar_comparaciones(self, clave, resultados, huellas):
+        """Guarda los resultados por instancia y sus huellas en el caché y en el manifiesto."""
+        
+        guardados = self._leer_comparaciones(clave)
+        guardados.update({nombre: {'huella': huellas[nombre], 'resultado': resultado}
+                          for nombre, resultado in resultados.items()})
+        ruta = self._ruta_comparaciones(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, 'wb') as f:
+            pickle.dump(guardados, f, protocol=pickle.HIGHEST_PROTOCOL)
+        
+        par = self.manifiesto.setdefault(clave, {'instancias': {}, 'artefactos': {}})
+        alg1, alg2 = clave.split('_vs_')
+        for nombre in resultados:
+            par['instancias'][nombre] = {
+                'huella': huellas[nombre],
+                'entradas': {alg: self.datos_algoritmos[alg]['instancias'][nombre]['entradas'] for alg in (alg1, alg2)},
+            }
+        self._guardar_manifiesto()
+    
+    def _guardar_manifiesto(self):
+        temporal = f"{self.ruta_manifiesto}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(self.manifiesto, f, indent=2, sort_keys=True)
+        os.replace(temporal, self.ruta_manifiesto)
+    
+    def _huella_par(self, clave):
+        """Huella de todas las instancias de una comparación (clave 'alg1_vs_alg2')."""
+        
+        return hashlib.sha1(json.dumps(self.huellas_comparacion.get(clave, {}), sort_keys=True).encode()).hexdigest()
+    
+    def _artefacto_vigente(self, clave, tipo):
+        """
+        Ruta del artefacto derivado (resumen estadístico, CSV) del análisis anterior si sus
+        entradas no cambiaron y el archivo existe; None si hay que regenerarlo.
+        """
+        
+        if not self.incremental:
+            return None
+        huella = self._huella_par(clave)
+        artefacto = self.manifiesto.get(clave, {}).get('artefactos', {}).get(tipo)
+        if artefacto and artefacto['huella'] == huella and os.path.exists(artefacto['ruta']):
+            return artefacto['ruta']
+        return None
+    
+    def _registrar_artefacto(self, clave, tipo, ruta):
+        if not self.incremental:
+            return
+        huella = self._huella_par(clave)
+        par = self.manifiesto.setdefault(clave, {'instancias': {}, 'artefactos': {}})
+        par['artefactos'][tipo] = {'huella': huella, 'ruta': ruta}
+        self._guardar_manifiesto()
+    
     def _guardar_resumen_estadistico(self, algoritmo1, algoritmo2, resultados):
         """
         Guarda un resumen estadístico comparativo entre dos algoritmos en un archivo de texto.
@@ -466,8 +871,15 @@ class AnalizadorEvosocial:
         - Tiempos promedio de ejecución y mejora porcentual
         - Detalle completo por cada instancia con todas las métricas comparativas
         El archivo se guarda en el directorio de salida con timestamp en el nombre.
+        Si ninguna instancia cambió desde el análisis anterior, se conserva el archivo existente.
         """
         
+        clave = f"{algoritmo1}_vs_{algoritmo2}"
+        vigente = self._artefacto_vigente(clave, 'resumen_estadistico')
+        if vigente:
+            print(f"\n= Resumen sin cambios: {vigente}")
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         ruta = os.path.join(self.directorio_salida, 'pruebas_estadisticas',
                            f'comparacion_{algoritmo1}_vs_{algoritmo2}_{timestamp}.txt')
@@ -531,9 +943,10 @@ class AnalizadorEvosocial:
                 f.write(f"  Mejor: {resultado['mejor_algoritmo']}\n")
                 f.write("=" * 50 + "\n\n")
         
+        self._registrar_artefacto(clave, 'resumen_estadistico', ruta)
         print(f"\n- Resumen guardado: {ruta}")
     
-    def crear_visualizaciones(self, algoritmo1, algoritmo2):
+    def crear_visualizaciones(self, algoritmo1, algoritmo2, renderizar=True):
         """
         Genera visualizaciones comparativas entre dos algoritmos de optimización.
         Crea un dashboard con múltiples gráficos que comparan el rendimiento de dos
@@ -543,8 +956,10 @@ class AnalizadorEvosocial:
         Args:
             algoritmo1 (str): Nombre del primer algoritmo a comparar
             algoritmo2 (str): Nombre del segundo algoritmo a comparar
+            renderizar (bool): Si es False, solo devuelve la tarea de la figura para
+                renderizarla junto con otras con renderizar_figuras
         Returns:
-            None: La función guarda las visualizaciones en archivo PNG y las muestra
+            dict: La tarea de la figura (ver figuras.py), o None si no hay datos
         Raises:
             Implicitamente muestra advertencias si no hay datos de comparación o
             si faltan datos de tiempo de ejecución
@@ -552,315 +967,50 @@ class AnalizadorEvosocial:
             - Requiere que los resultados de comparación estén previamente cargados
             - Genera archivos en el directorio de salida con timestamp
             - Incluye 6 subplots cuando hay datos de tiempo, 3 cuando no
+            - El dibujo se hace en figuras.figura_dashboard
         """
         
         clave = f"{algoritmo1}_vs_{algoritmo2}"
         
         if clave not in self.resultados_comparacion:
             print(f"X No hay resultados de comparación")
-            return
+            return None
         
         datos_comparacion = self.resultados_comparacion[clave]
         
-        # Preparar datos
-        datos_plot = []
-        datos_tiempo = []
-        
-        for nombre_instancia, resultado in datos_comparacion.items():
-            # Makespan
-            for valor in resultado['mingls1']:
-                datos_plot.append({
-                    'instancia': nombre_instancia,
-                    'algoritmo': algoritmo1,
-                    'makespan': valor,
-                })
-            
-            for valor in resultado['mingls2']:
-                datos_plot.append({
-                    'instancia': nombre_instancia,
-                    'algoritmo': algoritmo2,
-                    'makespan': valor,
-                })
-            
-            # Tiempos
-            if resultado['stats1']['tiempo_segundos']:
-                datos_tiempo.append({
-                    'instancia': nombre_instancia,
-                    'algoritmo': algoritmo1,
-                    'tiempo_segundos': resultado['stats1']['tiempo_segundos'],
-                    'tiempo_minutos': resultado['stats1']['tiempo_segundos'] / 60
-                })
-            
-            if resultado['stats2']['tiempo_segundos']:
-                datos_tiempo.append({
-                    'instancia': nombre_instancia,
-                    'algoritmo': algoritmo2,
-                    'tiempo_segundos': resultado['stats2']['tiempo_segundos'],
-                    'tiempo_minutos': resultado['stats2']['tiempo_segundos'] / 60
-                })
-        
-        df_makespan = pd.DataFrame(datos_plot)
-        df_tiempo = pd.DataFrame(datos_tiempo) if datos_tiempo else None
-        
         # Verificar si hay datos de tiempo
-        if df_tiempo is None or len(df_tiempo) == 0:
+        con_tiempo = [alg for alg, stats_alg in ((algoritmo1, 'stats1'), (algoritmo2, 'stats2'))
+                      if any(r[stats_alg]['tiempo_segundos'] for r in datos_comparacion.values())]
+        if not con_tiempo:
             print("!  ADVERTENCIA: No se encontraron datos de tiempo de ejecución.")
             print("    Verifica que los archivos tiempo_ejecucion_XXX.txt existan y tengan el formato correcto.")
             print("    Solo se generarán gráficos de makespan.\n")
         else:
-            print(f"+ Datos de tiempo cargados: {len(df_tiempo)} registros")
-            print(f"   Algoritmos con tiempo: {df_tiempo['algoritmo'].unique().tolist()}\n")
+            registros = sum(bool(r[s]['tiempo_segundos']) for r in datos_comparacion.values() for s in ('stats1', 'stats2'))
+            print(f"+ Datos de tiempo cargados: {registros} registros")
+            print(f"   Algoritmos con tiempo: {con_tiempo}\n")
         
-        # Crear figura con subplots
-        if df_tiempo is not None and len(df_tiempo) > 0:
-            fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        else:
-            fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-        
-        axes = axes.flatten()
-        
-        # 1. Boxplot de Makespan
-        sns.boxplot(data=df_makespan, x='instancia', y='makespan', hue='algoritmo', ax=axes[0])
-        axes[0].set_title(f'Distribución de Makespan', fontsize=14, fontweight='bold')
-        axes[0].set_xlabel('Instancia')
-        axes[0].set_ylabel('Makespan')
-        axes[0].tick_params(axis='x', rotation=45)
-        axes[0].legend(title='Algoritmo')
-        
-        # 2. Violin plot
-        sns.violinplot(data=df_makespan, x='instancia', y='makespan', hue='algoritmo', ax=axes[1])
-        axes[1].set_title('Distribución Detallada', fontsize=14, fontweight='bold')
-        axes[1].set_xlabel('Instancia')
-        axes[1].set_ylabel('Makespan')
-        axes[1].tick_params(axis='x', rotation=45)
-        axes[1].legend(title='Algoritmo')
-        
-        # 3. Barplot de mejoras en makespan (valores negativos = puro es mejor)
-        instancias = []
-        mejoras_makespan = []
-        for nombre, resultado in datos_comparacion.items():
-            instancias.append(nombre)
-            # Invertir el signo para que sea más intuitivo
-            # Positivo = algoritmo1 (puro) es mejor
-            mejora_invertida = -resultado['mejora_media']
-            mejoras_makespan.append(mejora_invertida)
-        
-        # Verde si puro (algoritmo1) es mejor, rojo si deap (algoritmo2) es mejor
-        colores = ['green' if x > 0 else 'red' for x in mejoras_makespan]
-        bars = axes[2].bar(instancias, mejoras_makespan, color=colores, alpha=0.7)
-        axes[2].set_title(f'Ventaja en Makespan: {algoritmo1} es Mejor', fontsize=14, fontweight='bold')
-        axes[2].set_xlabel('Instancia')
-        axes[2].set_ylabel(f'Ventaja de {algoritmo1} (%)')
-        axes[2].axhline(y=0, color='black', linestyle='-', linewidth=1)
-        axes[2].tick_params(axis='x', rotation=45)
-        axes[2].grid(True, alpha=0.3, axis='y')
-        
-        for bar, mejora in zip(bars, mejoras_makespan):
-            altura = bar.get_height()
-            if mejora > 0:
-                texto = f'{algoritmo1}\n+{mejora:.1f}%'
-            else:
-                texto = f'{algoritmo2}\n+{abs(mejora):.1f}%'
-            axes[2].text(bar.get_x() + bar.get_width()/2., altura,
-                        texto,
-                        ha='center', va='bottom' if altura > 0 else 'top', fontsize=8)
-        
-        # 4. Comparación de tiempos con barras apareadas LADO A LADO
-        if df_tiempo is not None and len(df_tiempo) > 0:
-            # Crear posiciones para barras grupadas
-            x = np.arange(len(instancias))
-            width = 0.35  # Ancho de cada barra
-            
-            # Extraer tiempos para cada algoritmo
-            tiempos_alg1 = []
-            tiempos_alg2 = []
-            
-            for nombre in instancias:
-                resultado = datos_comparacion[nombre]
-                
-                t1 = resultado['stats1']['tiempo_segundos']
-                t2 = resultado['stats2']['tiempo_segundos']
-                
-                # Convertir a minutos, manejar None
-                tiempo1_min = (t1 / 60) if t1 is not None else 0
-                tiempo2_min = (t2 / 60) if t2 is not None else 0
-                
-                tiempos_alg1.append(tiempo1_min)
-                tiempos_alg2.append(tiempo2_min)
-            
-            # Crear barras lado a lado
-            bars1 = axes[3].bar(x - width/2, tiempos_alg1, width, 
-                              label=algoritmo1, color='steelblue', alpha=0.8, edgecolor='black', linewidth=1)
-            bars2 = axes[3].bar(x + width/2, tiempos_alg2, width, 
-                              label=algoritmo2, color='coral', alpha=0.8, edgecolor='black', linewidth=1)
-            
-            # Añadir etiquetas de valor arriba de cada barra
-            for bar in bars1:
-                height = bar.get_height()
-                if height > 0:  # Solo mostrar si hay valor
-                    axes[3].text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                               f'{height:.1f}m',
-                               ha='center', va='bottom', fontsize=9, fontweight='bold')
-            
-            for bar in bars2:
-                height = bar.get_height()
-                if height > 0:  # Solo mostrar si hay valor
-                    axes[3].text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                               f'{height:.1f}m',
-                               ha='center', va='bottom', fontsize=9, fontweight='bold')
-            
-            # Configurar ejes
-            axes[3].set_title('Tiempo de Ejecución por Instancia', fontsize=14, fontweight='bold')
-            axes[3].set_xlabel('Instancia', fontsize=11)
-            axes[3].set_ylabel('Tiempo (minutos)', fontsize=11)
-            axes[3].set_xticks(x)
-            axes[3].set_xticklabels(instancias, rotation=45, ha='right')
-            #axes[3].legend(loc='upper right', framealpha=0.9)
-            axes[3].legend(loc='lower right', framealpha=0.9)
-            axes[3].grid(True, alpha=0.3, axis='y', linestyle='--')
-            axes[3].set_ylim(bottom=0)  # Empezar desde 0
-            
-            # Advertencia si hay valores en 0
-            if sum(tiempos_alg1) == 0 or sum(tiempos_alg2) == 0:
-                axes[3].text(0.5, 0.95, '! Algunos tiempos no se cargaron correctamente', 
-                           transform=axes[3].transAxes, ha='center', va='top',
-                           bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5),
-                           fontsize=9)
-            
-            # 5. Diferencia de tiempo absoluta (más intuitivo)
-            diferencias_tiempo = []
-            algoritmo_mas_rapido = []
-            
-            for nombre in instancias:
-                resultado = datos_comparacion[nombre]
-                t1 = resultado['stats1']['tiempo_segundos']  # puro
-                t2 = resultado['stats2']['tiempo_segundos']  # deap
-                
-                if t1 and t2:
-                    # Calcular diferencia absoluta
-                    diferencia_segundos = abs(t1 - t2)
-                    diferencias_tiempo.append(diferencia_segundos)
-                    
-                    # Determinar quién es más rápido
-                    if t1 < t2:
-                        algoritmo_mas_rapido.append(algoritmo1)  # puro más rápido
-                    else:
-                        algoritmo_mas_rapido.append(algoritmo2)  # deap más rápido
-                else:
-                    diferencias_tiempo.append(0)
-                    algoritmo_mas_rapido.append("N/A")
-            
-            # Colores: verde si puro es más rápido, rojo si deap es más rápido
-            colores_tiempo = ['green' if alg == algoritmo1 else 'red' for alg in algoritmo_mas_rapido]
-            
-            bars_tiempo = axes[4].bar(instancias, diferencias_tiempo, color=colores_tiempo, 
-                                     alpha=0.7, edgecolor='black', linewidth=1)
-            
-            axes[4].set_title('Diferencia de Tiempo entre Algoritmos', fontsize=14, fontweight='bold')
-            axes[4].set_xlabel('Instancia', fontsize=11)
-            axes[4].set_ylabel('Diferencia de Tiempo (segundos)', fontsize=11)
-            axes[4].set_xticks(range(len(instancias)))
-            axes[4].set_xticklabels(instancias, rotation=45, ha='right')
-            axes[4].grid(True, alpha=0.3, axis='y', linestyle='--')
-            axes[4].set_ylim(bottom=0)
-            
-            # Añadir etiquetas informativas arriba de cada barra
-            for i, (bar, diferencia, alg_rapido) in enumerate(zip(bars_tiempo, diferencias_tiempo, algoritmo_mas_rapido)):
-                if diferencia > 0 and alg_rapido != "N/A":
-                    altura = bar.get_height()
-                    
-                    # Calcular porcentaje de ventaja
-                    resultado = datos_comparacion[instancias[i]]
-                    t1 = resultado['stats1']['tiempo_segundos']
-                    t2 = resultado['stats2']['tiempo_segundos']
-                    
-                    if alg_rapido == algoritmo1:
-                        porcentaje = ((t2 - t1) / t2) * 100
-                    else:
-                        porcentaje = ((t1 - t2) / t1) * 100
-                    
-                    # Etiqueta más informativa
-                    etiqueta = f'{alg_rapido} más rápido\n+{diferencia:.0f}s ({porcentaje:.1f}%)'
-                    
-                    axes[4].text(bar.get_x() + bar.get_width()/2., altura + max(diferencias_tiempo)*0.001,
-                               etiqueta,
-                               ha='center', va='bottom', fontsize=8, fontweight='bold')
-            
-            # Leyenda personalizada
-            from matplotlib.patches import Patch
-            legend_elements = [
-                Patch(facecolor='green', edgecolor='black', label=f'{algoritmo1}'),
-                Patch(facecolor='red', edgecolor='black', label=f'{algoritmo2}')
-            ]
-            #axes[4].legend(handles=legend_elements, loc='upper right', framealpha=0.9)
-            axes[4].legend(handles=legend_elements, loc='lower right', framealpha=0.9)
-            
-            # 6. Scatter mejorado: Tiempo vs Calidad
-            colores_algoritmos = {'puro': 'blue', 'deap': 'orange'}
-            markers_algoritmos = {'puro': 'o', 'deap': 's'}
-            
-            for alg in [algoritmo1, algoritmo2]:
-                tiempos = []
-                medias = []
-                nombres_puntos = []
-                
-                for nombre in instancias:
-                    resultado = datos_comparacion[nombre]
-                    if alg == algoritmo1:
-                        if resultado['stats1']['tiempo_segundos']:
-                            tiempos.append(resultado['stats1']['tiempo_segundos'])
-                            medias.append(resultado['stats1']['media'])
-                            nombres_puntos.append(nombre)
-                    else:
-                        if resultado['stats2']['tiempo_segundos']:
-                            tiempos.append(resultado['stats2']['tiempo_segundos'])
-                            medias.append(resultado['stats2']['media'])
-                            nombres_puntos.append(nombre)
-                
-                if tiempos and medias:
-                    color = colores_algoritmos.get(alg, 'gray')
-                    marker = markers_algoritmos.get(alg, 'o')
-                    axes[5].scatter(tiempos, medias, label=alg, s=150, alpha=0.7, 
-                                  color=color, marker=marker, edgecolors='black', linewidth=1)
-                    
-                    # Añadir etiquetas de instancia
-                    for t, m, n in zip(tiempos, medias, nombres_puntos):
-                        axes[5].annotate(n, (t, m), textcoords="offset points", 
-                                       xytext=(0,5), ha='center', fontsize=8)
-            
-            axes[5].set_title('Trade-off: Tiempo vs Calidad (Menor es Mejor)', fontsize=14, fontweight='bold')
-            axes[5].set_xlabel('Tiempo de Ejecución (segundos)')
-            axes[5].set_ylabel('Makespan Promedio')
-            axes[5].legend(loc='best')
-            axes[5].grid(True, alpha=0.3)
-            
-            # Añadir región ideal (esquina inferior izquierda)
-            axes[5].annotate('Ideal\n(rápido y bueno)', 
-                           xy=(0.05, 0.05), xycoords='axes fraction',
-                           fontsize=10, color='green', alpha=0.5,
-                           bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.3))
-        else:
-            # Si no hay datos de tiempo, ocultar ejes extra
-            for i in range(3, 6):
-                axes[i].set_visible(False)
-        
-        plt.tight_layout()
-        
-        # Guardar
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         ruta = os.path.join(self.directorio_salida, 'visualizaciones',
                            f'{algoritmo1}_vs_{algoritmo2}_{timestamp}.png')
-        plt.savefig(ruta, dpi=300, bbox_inches='tight')
-        plt.show()
+        campos = ('mingls1', 'mingls2', 'stats1', 'stats2', 'mejora_media')
+        tarea = tarea_figura('dashboard', f'dashboard_{clave}', ruta,
+                             algoritmo1=algoritmo1, algoritmo2=algoritmo2,
+                             datos_comparacion={nombre: {c: resultado[c] for c in campos}
+                                                for nombre, resultado in datos_comparacion.items()})
         
-        print(f"- Visualizaciones guardadas: {ruta}")
+        if renderizar:
+            self.renderizar_figuras([tarea])
+        return tarea
     
-    def crear_graficos_convergencia(self, algoritmo1, algoritmo2, instancias=None):
+    def crear_graficos_convergencia(self, algoritmo1, algoritmo2, instancias=None, por_instancia=False,
+                                    renderizar=True):
         """
         Genera y guarda gráficos comparativos de convergencia entre dos algoritmos.
         Crea una visualización comparativa de las curvas de convergencia de dos algoritmos
         evolutivos para las instancias especificadas, mostrando la evolución del mejor
-        makespan global a lo largo de las generaciones.
+        makespan global a lo largo de las generaciones: mediana entre corridas (línea
+        continua), rango intercuartil (banda) y media (línea discontinua).
         Parameters:
         -----------
         algoritmo1 : str
@@ -870,77 +1020,91 @@ class AnalizadorEvosocial:
         instancias : list, optional
             Lista de nombres de instancias a visualizar. Si es None, usa todas las
             instancias disponibles del primer algoritmo.
+        por_instancia : bool, optional
+            Si es True, genera una figura por instancia (tareas independientes que se
+            renderizan en paralelo) en lugar de una grilla con todas.
+        renderizar : bool, optional
+            Si es False, solo devuelve las tareas para renderizar_figuras.
         Returns:
         --------
-        None
-        Outputs:
-        --------
-        - Genera una figura con subplots para cada instancia
-        - Guarda la figura como archivo PNG en el directorio de visualizaciones
-        - Muestra la figura en pantalla
-        - Imprime la ruta del archivo guardado
+        list[dict]
+            Tareas de las figuras (ver figuras.py)
         Notes:
         ------
         - La figura se organiza en una grilla de hasta 3 columnas
         - Los subplots vacíos se ocultan automáticamente
         - El nombre del archivo incluye timestamp para evitar sobrescritura
-        - Usa datos de convergencia almacenados en self.datos_algoritmos
+        - Las bandas se calculan aquí a partir de la matriz de convergencia por corrida;
+          el dibujo se hace en figuras.figura_convergencia
+        - Antes de crear la tarea, la mediana y el rango intercuartil (escalonados) se
+          reducen a los puntos de cambio y la media se submuestrea con LTTB, ambos
+          hasta PUNTOS_CONVERGENCIA (el ancho de la subgráfica en píxeles): el costo
+          de dibujo no depende de la cantidad de generaciones
         """
         
         if instancias is None:
             instancias = list(self.datos_algoritmos[algoritmo1]['instancias'].keys())
         
-        n_instancias = len(instancias)
-        cols = min(3, n_instancias)
-        rows = (n_instancias + cols - 1) // cols
-        
-        fig, axes = plt.subplots(rows, cols, figsize=(6*cols, 5*rows))
-        
-        if n_instancias == 1:
-            axes = np.array([axes])
-        axes = axes.flatten() if n_instancias > 1 else axes
-        
-        for i, nombre_instancia in enumerate(instancias):
-            if i >= len(axes):
-                break
-            
-            ax = axes[i] if n_instancias > 1 else axes[0]
-            
-            # Algoritmo 1
-            if nombre_instancia in self.datos_algoritmos[algoritmo1]['instancias']:
-                conv1 = self.datos_algoritmos[algoritmo1]['instancias'][nombre_instancia]['convergencia']
-                if conv1:
-                    gens1 = [c['gen'] for c in conv1]
-                    mingls1 = [c['mingl'] for c in conv1]
-                    ax.plot(gens1, mingls1, label=algoritmo1, linewidth=2, alpha=0.8)
-            
-            # Algoritmo 2
-            if nombre_instancia in self.datos_algoritmos[algoritmo2]['instancias']:
-                conv2 = self.datos_algoritmos[algoritmo2]['instancias'][nombre_instancia]['convergencia']
-                if conv2:
-                    gens2 = [c['gen'] for c in conv2]
-                    mingls2 = [c['mingl'] for c in conv2]
-                    ax.plot(gens2, mingls2, label=algoritmo2, linewidth=2, alpha=0.8)
-            
-            ax.set_title(f'Convergencia - {nombre_instancia}', fontweight='bold')
-            ax.set_xlabel('Generación')
-            ax.set_ylabel('Mejor Makespan Global')
-            ax.legend()
-            ax.grid(True, alpha=0.3)
-        
-        # Ocultar subplots vacíos
-        for i in range(n_instancias, len(axes)):
-            axes[i].set_visible(False)
-        
-        plt.tight_layout()
+        # Bandas por instancia y algoritmo (solo arreglos, sin objetos de matplotlib)
+        curvas = {}
+        for nombre_instancia in instancias:
+            curvas[nombre_instancia] = {}
+            for algoritmo in (algoritmo1, algoritmo2):
+                datos = self.datos_algoritmos[algoritmo]['instancias'].get(nombre_instancia)
+                if not datos or not datos.get('matriz_convergencia'):
+                    continue
+                conv = datos['matriz_convergencia']
+                bandas = bandas_convergencia(conv['matriz'])
+                generaciones, mediana, q1, q3 = comprimir_escalones(
+                    conv['generaciones'], bandas['mediana'], bandas['q1'], bandas['q3'],
+                    puntos=PUNTOS_CONVERGENCIA)
+                generaciones_media, media = lttb(conv['generaciones'], bandas['media'], PUNTOS_CONVERGENCIA)
+                curvas[nombre_instancia][algoritmo] = {
+                    'generaciones': generaciones,
+                    'mediana': mediana,
+                    'q1': q1,
+                    'q3': q3,
+                    'generaciones_media': generaciones_media,
+                    'media': media,
+                    'n_corridas': len(conv['corridas']),
+                }
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        ruta = os.path.join(self.directorio_salida, 'visualizaciones',
-                           f'convergencia_{algoritmo1}_vs_{algoritmo2}_{timestamp}.png')
-        plt.savefig(ruta, dpi=300, bbox_inches='tight')
-        plt.show()
+        grupos = [[nombre] for nombre in instancias] if por_instancia else [list(instancias)]
+        tareas = []
+        for grupo in grupos:
+            sufijo = f"_{grupo[0]}" if por_instancia else ""
+            ruta = os.path.join(self.directorio_salida, 'visualizaciones',
+                               f'convergencia_{algoritmo1}_vs_{algoritmo2}{sufijo}_{timestamp}.png')
+            tareas.append(tarea_figura('convergencia', f'convergencia_{algoritmo1}_vs_{algoritmo2}{sufijo}', ruta,
+                                       algoritmos=[algoritmo1, algoritmo2], instancias=grupo,
+                                       curvas={nombre: curvas[nombre] for nombre in grupo}))
         
-        print(f"- Convergencia guardada: {ruta}")
+        if renderizar:
+            self.renderizar_figuras(tareas)
+        return tareas
+    
+    def renderizar_figuras(self, tareas, procesos=None):
+        """
+        Renderiza tareas de figuras en un pool de procesos (backend Agg). Las figuras
+        cuyos datos no cambiaron desde la última vez (según el manifiesto en
+        visualizaciones/manifiesto_figuras.json) no se vuelven a dibujar.
+        Args:
+            tareas (list[dict]): Tareas de crear_visualizaciones / crear_graficos_convergencia.
+            procesos (int, optional): Procesos del pool (por defecto uno por CPU).
+        Returns:
+            list[str]: Rutas de las figuras, en el orden de las tareas.
+        """
+        
+        tareas = [t for t in tareas if t is not None]
+        ruta_manifiesto = os.path.join(self.directorio_salida, 'visualizaciones', 'manifiesto_figuras.json')
+        resultados = renderizar_tareas(tareas, ruta_manifiesto, procesos)
+        for clave, ruta, omitida in resultados:
+            if omitida:
+                print(f"= Sin cambios ({clave}): {ruta}")
+            else:
+                print(f"- Figura guardada ({clave}): {ruta}")
+        return [ruta for _, ruta, _ in resultados]
     
     def exportar_csv(self, algoritmo1, algoritmo2):
         """
@@ -960,6 +1124,7 @@ class AnalizadorEvosocial:
             - Valores p de pruebas estadísticas (Wilcoxon, Mann-Whitney)
             - Indicadores de significancia y mejor algoritmo
         El archivo se guarda en el directorio de salida con timestamp para evitar sobreescrituras.
+        Si ninguna instancia cambió desde el análisis anterior, devuelve el CSV existente.
         """
         
         clave = f"{algoritmo1}_vs_{algoritmo2}"
@@ -968,6 +1133,11 @@ class AnalizadorEvosocial:
             print(f"X No hay resultados")
             return
         
+        vigente = self._artefacto_vigente(clave, 'csv')
+        if vigente:
+            print(f"= CSV sin cambios: {vigente}")
+            return vigente
+        
         datos_comparacion = self.resultados_comparacion[clave]
         
         datos_csv = []
@@ -1004,13 +1174,14 @@ class AnalizadorEvosocial:
         
         df = pd.DataFrame(datos_csv)
         df.to_csv(ruta, index=False)
+        self._registrar_artefacto(clave, 'csv', ruta)
         
         print(f"- CSV exportado: {ruta}")
         return ruta
 
 
 # Funcion para ejecutar el análisis 
-def analizar_corridas():
+def analizar_corridas(ruta_sqlite=None):
     """
     Analiza y compara los resultados de ejecuciones de algoritmos evolutivos.
     Esta función realiza un análisis comparativo entre los resultados obtenidos
@@ -1023,6 +1194,10 @@ def analizar_corridas():
     4. Crea gráficos de convergencia
     5. Exporta los datos a formato CSV
     Los resultados se guardan en el directorio 'analisis_comparativo'
+    
+    Args:
+        ruta_sqlite (str, optional): Base SQLite de los motores (--sqlite). Si se indica,
+            los resultados se leen de la base en lugar de los directorios puro/ y deap/
     """
     
     print("- Análisis de resultados con tiempos")
@@ -1031,32 +1206,32 @@ def analizar_corridas():
     # Crear analizador
     analizador = AnalizadorEvosocial(directorio_salida="analisis_comparativo")
     
-    # Cargar resultados Python puro
-    print("- Cargando Python Puro...")
-    analizador.cargar_resultados(
-        nombre_algoritmo="puro",
-        directorio_base="puro",
-        instancias=["swv06", "swv07", "swv08"],
-        prefijo="converted_"
-    )
-    
-    # Cargar resultados DEAP
-    print("- Cargando DEAP...")
-    analizador.cargar_resultados(
-        nombre_algoritmo="deap",
-        directorio_base="deap",
-        instancias=["swv06", "swv07", "swv08"],
-        prefijo="converted_"
-    )
+    for nombre, titulo in (("puro", "Python Puro"), ("deap", "DEAP")):
+        print(f"- Cargando {titulo}...")
+        if ruta_sqlite:
+            analizador.cargar_resultados_sqlite(
+                nombre_algoritmo=nombre,
+                ruta_db=ruta_sqlite,
+                instancias=["swv06", "swv07", "swv08"],
+                prefijo="converted_"
+            )
+        else:
+            analizador.cargar_resultados(
+                nombre_algoritmo=nombre,
+                directorio_base=nombre,
+                instancias=["swv06", "swv07", "swv08"],
+                prefijo="converted_"
+            )
     
     # Comparar
     print("- Comparando algoritmos...")
     analizador.comparar_algoritmos("puro", "deap")
     
-    # Visualizar
+    # Visualizar (todas las figuras en un pool de procesos)
     print("\n- Generando visualizaciones...")
-    analizador.crear_visualizaciones("puro", "deap")
-    analizador.crear_graficos_convergencia("puro", "deap")
+    tareas = [analizador.crear_visualizaciones("puro", "deap", renderizar=False)]
+    tareas += analizador.crear_graficos_convergencia("puro", "deap", renderizar=False)
+    analizador.renderizar_figuras(tareas)
     
     # Exportar
     print("\n- Exportando datos...")
@@ -1066,5 +1241,10 @@ def analizar_corridas():
     print(f"- Resultados en: {analizador.directorio_salida}/")
 
 if __name__ == "__main__":
-    analizar_corridas()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Análisis comparativo de los motores Evosocial")
+    parser.add_argument('--sqlite', default=None, metavar='RUTA',
+                        help="Leer los resultados de una base SQLite en lugar de los directorios puro/ y deap/")
+    analizar_corridas(parser.parse_args().sqlite)
     
\ No newline at end of file
@@ -0,0 +1,458 @@
+"""
+Renderizado de figuras del análisis comparativo como tareas independientes.
+
+Cada figura se describe con una tarea (tipo, clave, ruta y datos simples, sin
+objetos de matplotlib), de modo que puede dibujarse en otro proceso. Los
+workers usan el backend Agg e importan matplotlib y seaborn solo al dibujar;
+el proceso principal no los importa.
+
+renderizar_tareas() reparte las tareas en un pool de procesos y mantiene un
+manifiesto (JSON) con la huella de los datos de cada figura: si la huella de
+una clave no cambió y su archivo sigue existiendo, la figura no se vuelve a
+dibujar.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Cambiar al modificar el dibujo de alguna figura (invalida el manifiesto)
+VERSION_FIGURAS = 2
+DPI = 300
+
+# Ancho de cada subgráfica de convergencia; las curvas se reducen a este ancho en
+# píxeles antes de crear la tarea (ver crear_graficos_convergencia)
+ANCHO_CONVERGENCIA = 6
+PUNTOS_CONVERGENCIA = ANCHO_CONVERGENCIA * DPI
+
+
+def tarea_figura(tipo, clave, ruta, **datos):
+    """
+    Describe una figura a renderizar.
+    Args:
+        tipo (str): Tipo de figura (clave de RENDERIZADORES).
+        clave (str): Identificador estable de la figura, para el manifiesto.
+        ruta (str): Archivo PNG de salida.
+        **datos: Argumentos del renderizador (datos serializables con pickle).
+    """
+    return {'tipo': tipo, 'clave': clave, 'ruta': ruta, 'datos': datos}
+
+
+def huella_tarea(tarea):
+    """Huella SHA-1 del tipo y los datos de una tarea (no depende de la ruta)."""
+    contenido = pickle.dumps((VERSION_FIGURAS, tarea['tipo'], tarea['datos']), protocol=4)
+    return hashlib.sha1(contenido).hexdigest()
+
+
+def _pyplot():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def figura_dashboard(ruta, algoritmo1, algoritmo2, datos_comparacion):
+    """
+    Dashboard de comparación: distribución de makespan, ventaja por instancia y,
+    si hay tiempos, tiempos de ejecución y trade-off tiempo vs calidad.
+    Args:
+        datos_comparacion (dict): Por instancia, 'mingls1', 'mingls2', 'stats1',
+            'stats2' y 'mejora_media' (ver comparar_algoritmos).
+    """
+
+    plt = _pyplot()
+    import numpy as np
+    import pandas as pd
+    import seaborn as sns
+
+    # Preparar datos
+    datos_plot = []
+    datos_tiempo = []
+
+    for nombre_instancia, resultado in datos_comparacion.items():
+        # Makespan
+        for valor in resultado['mingls1']:
+            datos_plot.append({
+                'instancia': nombre_instancia,
+                'algoritmo': algoritmo1,
+                'makespan': valor,
+            })
+
+        for valor in resultado['mingls2']:
+            datos_plot.append({
+                'instancia': nombre_instancia,
+                'algoritmo': algoritmo2,
+                'makespan': valor,
+            })
+
+        # Tiempos
+        if resultado['stats1']['tiempo_segundos']:
+            datos_tiempo.append({
+                'instancia': nombre_instancia,
+                'algoritmo': algoritmo1,
+                'tiempo_segundos': resultado['stats1']['tiempo_segundos'],
+                'tiempo_minutos': resultado['stats1']['tiempo_segundos'] / 60
+            })
+
+        if resultado['stats2']['tiempo_segundos']:
+            datos_tiempo.append({
+                'instancia': nombre_instancia,
+                'algoritmo': algoritmo2,
+                'tiempo_segundos': resultado['stats2']['tiempo_segundos'],
+                'tiempo_minutos': resultado['stats2']['tiempo_segundos'] / 60
+            })
+
+    df_makespan = pd.DataFrame(datos_plot)
+    df_tiempo = pd.DataFrame(datos_tiempo) if datos_tiempo else None
+    
+    # Crear figura con subplots
+    if df_tiempo is not None and len(df_tiempo) > 0:
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    else:
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+
+    axes = axes.flatten()
+
+    # 1. Boxplot de Makespan
+    sns.boxplot(data=df_makespan, x='instancia', y='makespan', hue='algoritmo', ax=axes[0])
+    axes[0].set_title('Distribución de Makespan', fontsize=14, fontweight='bold')
+    axes[0].set_xlabel('Instancia')
+    axes[0].set_ylabel('Makespan')
+    axes[0].tick_params(axis='x', rotation=45)
+    axes[0].legend(title='Algoritmo')
+
+    # 2. Violin plot
+    sns.violinplot(data=df_makespan, x='instancia', y='makespan', hue='algoritmo', ax=axes[1])
+    axes[1].set_title('Distribución Detallada', fontsize=14, fontweight='bold')
+    axes[1].set_xlabel('Instancia')
+    axes[1].set_ylabel('Makespan')
+    axes[1].tick_params(axis='x', rotation=45)
+    axes[1].legend(title='Algoritmo')
+
+    # 3. Barplot de mejoras en makespan (valores negativos = puro es mejor)
+    instancias = []
+    mejoras_makespan = []
+    for nombre, resultado in datos_comparacion.items():
+        instancias.append(nombre)
+        # Invertir el signo para que sea más intuitivo
+        # Positivo = algoritmo1 (puro) es mejor
+        mejora_invertida = -resultado['mejora_media']
+        mejoras_makespan.append(mejora_invertida)
+
+    # Verde si puro (algoritmo1) es mejor, rojo si deap (algoritmo2) es mejor
+    colores = ['green' if x > 0 else 'red' for x in mejoras_makespan]
+    bars = axes[2].bar(instancias, mejoras_makespan, color=colores, alpha=0.7)
+    axes[2].set_title(f'Ventaja en Makespan: {algoritmo1} es Mejor', fontsize=14, fontweight='bold')
+    axes[2].set_xlabel('Instancia')
+    axes[2].set_ylabel(f'Ventaja de {algoritmo1} (%)')
+    axes[2].axhline(y=0, color='black', linestyle='-', linewidth=1)
+    axes[2].tick_params(axis='x', rotation=45)
+    axes[2].grid(True, alpha=0.3, axis='y')
+
+    for bar, mejora in zip(bars, mejoras_makespan):
+        altura = bar.get_height()
+        if mejora > 0:
+            texto = f'{algoritmo1}\n+{mejora:.1f}%'
+        else:
+            texto = f'{algoritmo2}\n+{abs(mejora):.1f}%'
+        axes[2].text(bar.get_x() + bar.get_width()/2., altura,
+                    texto,
+                    ha='center', va='bottom' if altura > 0 else 'top', fontsize=8)
+
+    # 4. Comparación de tiempos con barras apareadas LADO A LADO
+    if df_tiempo is not None and len(df_tiempo) > 0:
+        # Crear posiciones para barras grupadas
+        x = np.arange(len(instancias))
+        width = 0.35  # Ancho de cada barra
+
+        # Extraer tiempos para cada algoritmo
+        tiempos_alg1 = []
+        tiempos_alg2 = []
+
+        for nombre in instancias:
+            resultado = datos_comparacion[nombre]
+
+            t1 = resultado['stats1']['tiempo_segundos']
+            t2 = resultado['stats2']['tiempo_segundos']
+
+            # Convertir a minutos, manejar None
+            tiempo1_min = (t1 / 60) if t1 is not None else 0
+            tiempo2_min = (t2 / 60) if t2 is not None else 0
+
+            tiempos_alg1.append(tiempo1_min)
+            tiempos_alg2.append(tiempo2_min)
+
+        # Crear barras lado a lado
+        bars1 = axes[3].bar(x - width/2, tiempos_alg1, width, 
+                          label=algoritmo1, color='steelblue', alpha=0.8, edgecolor='black', linewidth=1)
+        bars2 = axes[3].bar(x + width/2, tiempos_alg2, width, 
+                          label=algoritmo2, color='coral', alpha=0.8, edgecolor='black', linewidth=1)
+
+        # Añadir etiquetas de valor arriba de cada barra
+        for bar in bars1:
+            height = bar.get_height()
+            if height > 0:  # Solo mostrar si hay valor
+                axes[3].text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                           f'{height:.1f}m',
+                           ha='center', va='bottom', fontsize=9, fontweight='bold')
+
+        for bar in bars2:
+            height = bar.get_height()
+            if height > 0:  # Solo mostrar si hay valor
+                axes[3].text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                           f'{height:.1f}m',
+                           ha='center', va='bottom', fontsize=9, fontweight='bold')
+
+        # Configurar ejes
+        axes[3].set_title('Tiempo de Ejecución por Instancia', fontsize=14, fontweight='bold')
+        axes[3].set_xlabel('Instancia', fontsize=11)
+        axes[3].set_ylabel('Tiempo (minutos)', fontsize=11)
+        axes[3].set_xticks(x)
+        axes[3].set_xticklabels(instancias, rotation=45, ha='right')
+        #axes[3].legend(loc='upper right', framealpha=0.9)
+        axes[3].legend(loc='lower right', framealpha=0.9)
+        axes[3].grid(True, alpha=0.3, axis='y', linestyle='--')
+        axes[3].set_ylim(bottom=0)  # Empezar desde 0
+
+        # Advertencia si hay valores en 0
+        if sum(tiempos_alg1) == 0 or sum(tiempos_alg2) == 0:
+            axes[3].text(0.5, 0.95, '! Algunos tiempos no se cargaron correctamente', 
+                       transform=axes[3].transAxes, ha='center', va='top',
+                       bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.5),
+                       fontsize=9)
+
+        # 5. Diferencia de tiempo absoluta (más intuitivo)
+        diferencias_tiempo = []
+        algoritmo_mas_rapido = []
+
+        for nombre in instancias:
+            resultado = datos_comparacion[nombre]
+            t1 = resultado['stats1']['tiempo_segundos']  # puro
+            t2 = resultado['stats2']['tiempo_segundos']  # deap
+
+            if t1 and t2:
+                # Calcular diferencia absoluta
+                diferencia_segundos = abs(t1 - t2)
+                diferencias_tiempo.append(diferencia_segundos)
+
+                # Determinar quién es más rápido
+                if t1 < t2:
+                    algoritmo_mas_rapido.append(algoritmo1)  # puro más rápido
+                else:
+                    algoritmo_mas_rapido.append(algoritmo2)  # deap más rápido
+            else:
+                diferencias_tiempo.append(0)
+                algoritmo_mas_rapido.append("N/A")
+
+        # Colores: verde si puro es más rápido, rojo si deap es más rápido
+        colores_tiempo = ['green' if alg == algoritmo1 else 'red' for alg in algoritmo_mas_rapido]
+
+        bars_tiempo = axes[4].bar(instancias, diferencias_tiempo, color=colores_tiempo, 
+                                 alpha=0.7, edgecolor='black', linewidth=1)
+
+        axes[4].set_title('Diferencia de Tiempo entre Algoritmos', fontsize=14, fontweight='bold')
+        axes[4].set_xlabel('Instancia', fontsize=11)
+        axes[4].set_ylabel('Diferencia de Tiempo (segundos)', fontsize=11)
+        axes[4].set_xticks(range(len(instancias)))
+        axes[4].set_xticklabels(instancias, rotation=45, ha='right')
+        axes[4].grid(True, alpha=0.3, axis='y', linestyle='--')
+        axes[4].set_ylim(bottom=0)
+
+        # Añadir etiquetas informativas arriba de cada barra
+        for i, (bar, diferencia, alg_rapido) in enumerate(zip(bars_tiempo, diferencias_tiempo, algoritmo_mas_rapido)):
+            if diferencia > 0 and alg_rapido != "N/A":
+                altura = bar.get_height()
+
+                # Calcular porcentaje de ventaja
+                resultado = datos_comparacion[instancias[i]]
+                t1 = resultado['stats1']['tiempo_segundos']
+                t2 = resultado['stats2']['tiempo_segundos']
+
+                if alg_rapido == algoritmo1:
+                    porcentaje = ((t2 - t1) / t2) * 100
+                else:
+                    porcentaje = ((t1 - t2) / t1) * 100
+
+                # Etiqueta más informativa
+                etiqueta = f'{alg_rapido} más rápido\n+{diferencia:.0f}s ({porcentaje:.1f}%)'
+
+                axes[4].text(bar.get_x() + bar.get_width()/2., altura + max(diferencias_tiempo)*0.001,
+                           etiqueta,
+                           ha='center', va='bottom', fontsize=8, fontweight='bold')
+
+        # Leyenda personalizada
+        from matplotlib.patches import Patch
+        legend_elements = [
+            Patch(facecolor='green', edgecolor='black', label=f'{algoritmo1}'),
+            Patch(facecolor='red', edgecolor='black', label=f'{algoritmo2}')
+        ]
+        #axes[4].legend(handles=legend_elements, loc='upper right', framealpha=0.9)
+        axes[4].legend(handles=legend_elements, loc='lower right', framealpha=0.9)
+
+        # 6. Scatter mejorado: Tiempo vs Calidad
+        colores_algoritmos = {'puro': 'blue', 'deap': 'orange'}
+        markers_algoritmos = {'puro': 'o', 'deap': 's'}
+
+        for alg in [algoritmo1, algoritmo2]:
+            tiempos = []
+            medias = []
+            nombres_puntos = []
+
+            for nombre in instancias:
+                resultado = datos_comparacion[nombre]
+                if alg == algoritmo1:
+                    if resultado['stats1']['tiempo_segundos']:
+                        tiempos.append(resultado['stats1']['tiempo_segundos'])
+                        medias.append(resultado['stats1']['media'])
+                        nombres_puntos.append(nombre)
+                else:
+                    if resultado['stats2']['tiempo_segundos']:
+                        tiempos.append(resultado['stats2']['tiempo_segundos'])
+                        medias.append(resultado['stats2']['media'])
+                        nombres_puntos.append(nombre)
+
+            if tiempos and medias:
+                color = colores_algoritmos.get(alg, 'gray')
+                marker = markers_algoritmos.get(alg, 'o')
+                axes[5].scatter(tiempos, medias, label=alg, s=150, alpha=0.7, 
+                              color=color, marker=marker, edgecolors='black', linewidth=1)
+
+                # Añadir etiquetas de instancia
+                for t, m, n in zip(tiempos, medias, nombres_puntos):
+                    axes[5].annotate(n, (t, m), textcoords="offset points", 
+                                   xytext=(0,5), ha='center', fontsize=8)
+
+        axes[5].set_title('Trade-off: Tiempo vs Calidad (Menor es Mejor)', fontsize=14, fontweight='bold')
+        axes[5].set_xlabel('Tiempo de Ejecución (segundos)')
+        axes[5].set_ylabel('Makespan Promedio')
+        axes[5].legend(loc='best')
+        axes[5].grid(True, alpha=0.3)
+
+        # Añadir región ideal (esquina inferior izquierda)
+        axes[5].annotate('Ideal\n(rápido y bueno)', 
+                       xy=(0.05, 0.05), xycoords='axes fraction',
+                       fontsize=10, color='green', alpha=0.5,
+                       bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.3))
+    else:
+        # Si no hay datos de tiempo, ocultar ejes extra
+        for i in range(3, 6):
+            axes[i].set_visible(False)
+
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+def figura_convergencia(ruta, algoritmos, instancias, curvas):
+    """
+    Curvas de convergencia por instancia: mediana entre corridas (escalones),
+    rango intercuartil (banda) y media (línea discontinua) de cada algoritmo.
+    Args:
+        algoritmos (list[str]): Algoritmos a dibujar, en orden.
+        instancias (list[str]): Una subgráfica por instancia (grilla de hasta 3 columnas).
+        curvas (dict): curvas[instancia][algoritmo] con 'generaciones', 'mediana',
+            'q1', 'q3' (escalonadas: el valor vale hasta la generación siguiente),
+            'generaciones_media', 'media' y 'n_corridas'; las combinaciones sin
+            datos se omiten.
+    """
+
+    import numpy as np
+    plt = _pyplot()
+
+    n_instancias = len(instancias)
+    cols = min(3, n_instancias)
+    rows = (n_instancias + cols - 1) // cols
+    
+    fig, axes = plt.subplots(rows, cols, figsize=(ANCHO_CONVERGENCIA*cols, 5*rows))
+    axes = np.atleast_1d(axes).flatten()
+    
+    for ax, nombre_instancia in zip(axes, instancias):
+        for algoritmo in algoritmos:
+            curva = curvas.get(nombre_instancia, {}).get(algoritmo)
+            if curva is None:
+                continue
+            n_corridas = curva['n_corridas']
+            linea, = ax.plot(curva['generaciones'], curva['mediana'], drawstyle='steps-post',
+                             linewidth=2, alpha=0.8, label=f"{algoritmo} (mediana, {n_corridas} corridas)")
+            if n_corridas > 1:
+                ax.fill_between(curva['generaciones'], curva['q1'], curva['q3'], step='post',
+                                color=linea.get_color(), alpha=0.2, linewidth=0)
+                ax.plot(curva.get('generaciones_media', curva['generaciones']), curva['media'],
+                        color=linea.get_color(), linestyle='--', linewidth=1, alpha=0.7)
+        
+        ax.set_title(f'Convergencia - {nombre_instancia}', fontweight='bold')
+        ax.set_xlabel('Generación')
+        ax.set_ylabel('Mejor Makespan Global')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    # Ocultar subplots vacíos
+    for ax in axes[n_instancias:]:
+        ax.set_visible(False)
+    
+    plt.tight_layout()
+    plt.savefig(ruta, dpi=DPI, bbox_inches='tight')
+    plt.close(fig)
+    return ruta
+
+
+RENDERIZADORES = {
+    'dashboard': figura_dashboard,
+    'convergencia': figura_convergencia,
+}
+
+
+def renderizar_tarea(tarea):
+    """Dibuja una tarea y devuelve la ruta del archivo generado."""
+    return RENDERIZADORES[tarea['tipo']](tarea['ruta'], **tarea['datos'])
+
+
+def renderizar_tareas(tareas, ruta_manifiesto=None, procesos=None):
+    """
+    Renderiza un conjunto de tareas, en paralelo si hay más de una.
+    Args:
+        tareas (list[dict]): Tareas creadas con tarea_figura.
+        ruta_manifiesto (str, optional): Manifiesto de huellas; sin él se dibuja todo.
+        procesos (int, optional): Procesos del pool (por defecto uno por CPU,
+            sin superar la cantidad de tareas). Con 1 se dibuja en este proceso.
+    Returns:
+        list[tuple[str, str, bool]]: (clave, ruta, omitida) por tarea, en orden;
+        si la figura se omitió, ruta es el archivo ya existente.
+    """
+
+    manifiesto = {}
+    if ruta_manifiesto and os.path.exists(ruta_manifiesto):
+        with open(ruta_manifiesto, 'r', encoding='utf-8') as f:
+            manifiesto = json.load(f)
+
+    resultados = {}
+    pendientes = []
+    for tarea in tareas:
+        huella = huella_tarea(tarea)
+        previa = manifiesto.get(tarea['clave'])
+        if previa and previa['huella'] == huella and os.path.exists(previa['ruta']):
+            resultados[tarea['clave']] = (previa['ruta'], True)
+        else:
+            pendientes.append((tarea, huella))
+
+    if pendientes:
+        procesos = min(procesos or os.cpu_count() or 1, len(pendientes))
+        if procesos <= 1:
+            rutas = [renderizar_tarea(tarea) for tarea, _ in pendientes]
+        else:
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                rutas = list(pool.map(renderizar_tarea, [tarea for tarea, _ in pendientes]))
+        for (tarea, huella), ruta in zip(pendientes, rutas):
+            resultados[tarea['clave']] = (ruta, False)
+            manifiesto[tarea['clave']] = {'huella': huella, 'ruta': ruta}
+
+    if ruta_manifiesto and pendientes:
+        temporal = f"{ruta_manifiesto}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(manifiesto, f, indent=2, sort_keys=True)
+        os.replace(temporal, ruta_manifiesto)
+
+    return [(tarea['clave'], *resultados[tarea['clave']]) for tarea in tareas]
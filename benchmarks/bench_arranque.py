@@ -0,0 +1,184 @@
+"""
+Tiempo de arranque de la línea de comandos unificada (evosocial.py).
+
+Cada caso se ejecuta en un proceso nuevo y se mide su tiempo de pared: ayuda,
+estadísticas de un resumen, evaluar una permutación, convertir una instancia,
+cotas y la ayuda de 'resolver deap'. Como referencia se miden el piso del
+intérprete (python -c pass) y la importación anticipada de todas las
+dependencias pesadas, que es lo que pagaría cada comando si la CLI las
+importara al inicio. Una ejecución extra con -X importtime registra qué
+módulos pesados cargó cada caso.
+
+El JSON tiene el mismo esquema que bench_operadores.py (motor 'cli', un
+kernel por caso), así que comparar_bench.py sirve de compuerta.
+
+Uso:
+    python benchmarks/bench_arranque.py
+    python benchmarks/bench_arranque.py --repeticiones 20 --casos ayuda,evaluar --salida arranque.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import importlib.util
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.motores import RAIZ
+from utils.generador import generar_instancia
+from utils.conversion import convertir_lote
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_operadores import metadatos
+
+CLI = os.path.join(RAIZ, 'evosocial.py')
+MODULOS_PESADOS = ('numpy', 'pandas', 'scipy', 'matplotlib', 'seaborn', 'deap')
+# Importaciones de una CLI que cargara todo al inicio (las que falten se omiten)
+IMPORTACION_ANTICIPADA = ('numpy', 'pandas', 'scipy.stats', 'matplotlib.pyplot', 'seaborn', 'deap.base')
+
+
+def preparar_casos(directorio):
+    """
+    Genera los archivos de entrada en un directorio temporal y arma los casos.
+    Returns:
+        list[tuple[str, list[str]]]: (nombre, comando) por caso.
+    """
+
+    origen = generar_instancia(20, 5, 1, directorio, formato='jsplib')['jsplib']
+    instancia = convertir_lote([origen], directorio, procesos=1)[0]['ruta']
+    resumen = os.path.join(directorio, 'resumen_bench.txt')
+    with open(resumen, 'w') as f:
+        for corrida in range(30):
+            f.write(f"{corrida:2d} 20.00 40.00 {1300 + corrida:7.2f} {100 + corrida:4d} {200:4d} maxgen\n")
+
+    disponibles = [m for m in IMPORTACION_ANTICIPADA if importlib.util.find_spec(m.split('.')[0])]
+    py = sys.executable
+    return [
+        ('python', [py, '-c', 'pass']),
+        ('importacion_anticipada', [py, '-c', 'import ' + ', '.join(disponibles)]),
+        ('ayuda', [py, CLI, '--help']),
+        ('estadisticas', [py, CLI, 'estadisticas', resumen]),
+        ('evaluar', [py, CLI, 'evaluar', instancia]),
+        ('convertir', [py, CLI, 'convertir', origen, '--salida', directorio, '--forzar', '-q', '--procesos', '1']),
+        ('cotas', [py, CLI, 'cotas', instancia]),
+        ('resolver_deap_ayuda', [py, CLI, 'resolver', 'deap', '--help']),
+    ]
+
+
+def modulos_cargados(comando):
+    """Módulos pesados (de MODULOS_PESADOS) que importa un comando, según -X importtime."""
+
+    proceso = subprocess.run([comando[0], '-X', 'importtime', *comando[1:]], capture_output=True, text=True)
+    cargados = set()
+    for linea in proceso.stderr.splitlines():
+        if linea.startswith('import time:') and '|' in linea:
+            nombre = linea.rsplit('|', 1)[1].strip().split('.')[0]
+            if nombre in MODULOS_PESADOS:
+                cargados.add(nombre)
+    return sorted(cargados)
+
+
+def medir_proceso(comando, repeticiones, calentamiento):
+    """
+    Mide el tiempo de pared de un comando en procesos nuevos.
+    Returns:
+        dict: Estadísticos y muestras (segundos por ejecución), o None si el comando falla.
+    """
+
+    muestras = []
+    for i in range(calentamiento + repeticiones):
+        t0 = time.perf_counter()
+        proceso = subprocess.run(comando, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        dt = time.perf_counter() - t0
+        if proceso.returncode != 0:
+            return None
+        if i >= calentamiento:
+            muestras.append(dt)
+
+    q1, mediana, q3 = np.percentile(muestras, [25, 50, 75])
+    return {
+        'numero': 1,
+        'mediana_s': float(mediana),
+        'q1_s': float(q1),
+        'q3_s': float(q3),
+        'iqr_s': float(q3 - q1),
+        'ops_seg': float(1.0 / mediana) if mediana > 0 else float('inf'),
+        'muestras_s': [float(m) for m in muestras],
+    }
+
+
+def ejecutar_arranque(casos, repeticiones=10, calentamiento=1):
+    """
+    Mide todos los casos.
+    Returns:
+        list[dict]: Un registro por caso.
+    """
+
+    resultados = []
+    piso = None
+    for nombre, comando in casos:
+        medicion = medir_proceso(comando, repeticiones, calentamiento)
+        if medicion is None:
+            print(f"! Caso '{nombre}' falló: {' '.join(comando)}")
+            continue
+        cargados = modulos_cargados(comando)
+        if nombre == 'python':
+            piso = medicion['mediana_s']
+        sobre_piso = medicion['mediana_s'] - piso if piso is not None else 0.0
+        print(f"  {nombre:24} mediana: {medicion['mediana_s'] * 1e3:8.1f} ms  "
+              f"IQR: {medicion['iqr_s'] * 1e3:6.1f} ms  sobre python: {sobre_piso * 1e3:8.1f} ms  "
+              f"pesados: {', '.join(cargados) or '-'}")
+        resultados.append({
+            'motor': 'cli',
+            'kernel': nombre,
+            'tamano': '-',
+            'jobs': 0,
+            'maquinas': 0,
+            'comando': [os.path.relpath(c, RAIZ) if os.path.isabs(c) and c != sys.executable else c
+                        for c in comando[1:]],
+            'modulos_pesados': cargados,
+            'sobre_piso_s': float(sobre_piso),
+            **medicion,
+        })
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de arranque de los subcomandos de evosocial.py")
+    parser.add_argument('--repeticiones', type=int, default=10, help="Ejecuciones medidas por caso")
+    parser.add_argument('--calentamiento', type=int, default=1, help="Ejecuciones de calentamiento descartadas")
+    parser.add_argument('--casos', default=None, help="Subconjunto de casos separados por coma")
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida")
+    args = parser.parse_args(argv)
+    args.objetivo_s = 0.0
+    args.semilla = 1
+
+    salida = args.salida
+    if salida is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        salida = os.path.join(RAIZ, 'benchmarks', 'resultados', f'bench_arranque_{timestamp}.json')
+
+    print("- Tiempo de arranque de evosocial.py")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory(prefix='bench_arranque_') as directorio:
+        casos = preparar_casos(directorio)
+        if args.casos:
+            elegidos = {c.strip() for c in args.casos.split(',')}
+            casos = [c for c in casos if c[0] in elegidos or c[0] == 'python']
+        resultados = ejecutar_arranque(casos, args.repeticiones, args.calentamiento)
+
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump({'meta': metadatos(args), 'resultados': resultados}, f, indent=2)
+    print(f"\n- Resultados guardados: {salida}")
+    return salida
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Estudio de escalado: corridas cortas de punta a punta de ambos motores sobre
+instancias de Taillard generadas con semilla.
+
+Por cada (motor, tamaño) ejecuta evoso (Python puro) o algoritmo_evosocial_deap
+(DEAP) con pocas generaciones, mide el tiempo de pared por corrida y, en una
+corrida adicional bajo tracemalloc, el pico de memoria. Los resultados usan el
+mismo esquema JSON que bench_operadores.py.
+
+Uso:
+    python benchmarks/bench_escalado.py
+    python benchmarks/bench_escalado.py --tamanos 50x10,500x20 --generaciones 5 --popsize 20
+"""
+
+import io
+import os
+import sys
+import json
+import random
+import argparse
+import tracemalloc
+import contextlib
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.motores import cargar_motor, RAIZ
+from utils.generador import generar_flow_shop
+from utils.cotas import cota_inferior, cota_superior
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_operadores import parsear_tamanos, medir, metadatos
+
+TAMANOS_DEFECTO = "20x5,50x10,100x20,200x20"
+KERNELS = {'puro': 'evoso', 'deap': 'algoritmo_evosocial_deap'}
+
+
+def preparar_corrida_puro(puro, tiempos, parametros):
+    """
+    Configura el motor puro para corridas sin archivos de salida.
+    Returns:
+        callable: Función sin argumentos que ejecuta una corrida y devuelve las evaluaciones.
+    """
+
+    maquinas, jobs = tiempos.shape
+    puro.configurar_dimensiones(maquinas, jobs)
+    puro.Cmj.array[:, :] = tiempos
+    puro.upperb, puro.lowerb = cota_superior(tiempos), cota_inferior(tiempos)
+    puro.popsize = parametros['popsize']
+    puro.maxgen = parametros['maxgen']
+    puro.pcross = parametros['pcross']
+    puro.pmutacion = parametros['pmutacion']
+    puro.indcorr = 0
+    puro.Det = open(os.devnull, 'w')
+    puro.Resum = open(os.devnull, 'w')
+
+    def corrida():
+        with contextlib.redirect_stdout(io.StringIO()):
+            puro.evoso('', '')
+        return puro.evals
+
+    return corrida
+
+
+def preparar_corrida_deap(deap_motor, tiempos, parametros):
+    """
+    Arma la instancia y el toolbox DEAP.
+    Returns:
+        callable: Función sin argumentos que ejecuta una corrida y devuelve las evaluaciones.
+    """
+
+    maquinas, jobs = tiempos.shape
+    instancia = {
+        'nombre': f'escalado_{jobs}x{maquinas}',
+        'jobs': jobs,
+        'maquinas': maquinas,
+        'tiempos': tiempos.T.tolist(),
+        'orden_maquinas': [list(range(maquinas)) for _ in range(jobs)],
+        'upper_bound': cota_superior(tiempos),
+        'lower_bound': cota_inferior(tiempos),
+    }
+    toolbox = deap_motor.configurar_deap(instancia)
+
+    def corrida():
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultado = deap_motor.algoritmo_evosocial_deap(instancia, parametros, toolbox)
+        return resultado['historial_convergencia'][-1]['evals']
+
+    return corrida
+
+
+def memoria_pico(funcion):
+    """
+    Ejecuta funcion() bajo tracemalloc.
+    Returns:
+        tuple[float, object]: (pico de memoria en KiB, valor retornado)
+    """
+
+    tracemalloc.start()
+    try:
+        resultado = funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024, resultado
+
+
+def ejecutar_escalado(tamanos, motores, parametros, repeticiones=5, calentamiento=1, semilla=12345):
+    """
+    Ejecuta las corridas cortas sobre la grilla de tamaños.
+    Args:
+        tamanos (list[tuple[int, int]]): Lista de (jobs, maquinas).
+        motores (list[str]): Motores a medir ('puro', 'deap').
+        parametros (dict): popsize, maxgen, pcross y pmutacion de cada corrida.
+        repeticiones (int): Corridas medidas por motor y tamaño.
+        calentamiento (int): Corridas descartadas antes de medir.
+        semilla (int): Semilla de Taillard de las instancias y de los operadores.
+    Returns:
+        list[dict]: Un registro por (motor, tamaño).
+    """
+
+    preparadores = {'puro': preparar_corrida_puro, 'deap': preparar_corrida_deap}
+    resultados = []
+
+    for nombre_motor in motores:
+        try:
+            motor = cargar_motor(nombre_motor)
+        except ImportError as e:
+            print(f"! Motor '{nombre_motor}' no disponible: {e}")
+            continue
+
+        for jobs, maquinas in tamanos:
+            random.seed(semilla)
+            np.random.seed(semilla)
+            tiempos = generar_flow_shop(jobs, maquinas, semilla)
+            corrida = preparadores[nombre_motor](motor, tiempos, parametros)
+
+            # objetivo_s=0: una corrida por muestra
+            medicion = medir(corrida, repeticiones, calentamiento, 0.0)
+            pico_kib, evaluaciones = memoria_pico(corrida)
+            evals_seg = evaluaciones / medicion['mediana_s'] if medicion['mediana_s'] > 0 else 0.0
+            print(f"  {nombre_motor:5} {jobs:4d}x{maquinas:<3d} "
+                  f"mediana: {medicion['mediana_s']:9.4f} s  "
+                  f"IQR: {medicion['iqr_s']:8.4f} s  "
+                  f"evals/seg: {evals_seg:10.1f}  "
+                  f"pico: {pico_kib:10.1f} KiB")
+            resultados.append({
+                'motor': nombre_motor,
+                'kernel': KERNELS[nombre_motor],
+                'tamano': f"{jobs}x{maquinas}",
+                'jobs': jobs,
+                'maquinas': maquinas,
+                **medicion,
+                'evaluaciones': evaluaciones,
+                'evals_seg': evals_seg,
+                'memoria_pico_kib': pico_kib,
+            })
+
+    return resultados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Estudio de escalado con corridas cortas de ambos motores")
+    parser.add_argument('--tamanos', default=TAMANOS_DEFECTO,
+                        help=f"Grilla de tamaños JOBSxMAQUINAS separados por coma (defecto: {TAMANOS_DEFECTO})")
+    parser.add_argument('--motores', default='puro,deap', help="Motores a medir (defecto: puro,deap)")
+    parser.add_argument('--generaciones', type=int, default=5, help="Generaciones por corrida")
+    parser.add_argument('--popsize', type=int, default=20, help="Tamaño de población")
+    parser.add_argument('--pcross', type=float, default=0.8)
+    parser.add_argument('--pmutacion', type=float, default=0.05)
+    # Con 5 muestras por lado la prueba de comparar_bench.py puede llegar a p < 0.01
+    parser.add_argument('--repeticiones', type=int, default=5, help="Corridas medidas por motor y tamaño")
+    parser.add_argument('--calentamiento', type=int, default=1, help="Corridas de calentamiento descartadas")
+    parser.add_argument('--semilla', type=int, default=12345)
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida")
+    args = parser.parse_args(argv)
+    args.objetivo_s = 0.0
+
+    salida = args.salida
+    if salida is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        salida = os.path.join(RAIZ, 'benchmarks', 'resultados', f'bench_escalado_{timestamp}.json')
+
+    parametros = {
+        'popsize': args.popsize,
+        'maxgen': args.generaciones,
+        'pcross': args.pcross,
+        'pmutacion': args.pmutacion,
+    }
+
+    print("- Estudio de escalado (corridas cortas)")
+    print("=" * 60)
+    resultados = ejecutar_escalado(
+        parsear_tamanos(args.tamanos),
+        [m.strip() for m in args.motores.split(',')],
+        parametros,
+        repeticiones=args.repeticiones,
+        calentamiento=args.calentamiento,
+        semilla=args.semilla,
+    )
+
+    meta = metadatos(args)
+    meta.update(parametros)
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'resultados': resultados}, f, indent=2)
+    print(f"\n- Resultados guardados: {salida}")
+    return salida
+
+
+if __name__ == "__main__":
+    main()
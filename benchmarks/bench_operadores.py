@@ -0,0 +1,288 @@
+"""
+Micro-benchmarks de decodificadores y operadores genéticos de ambos motores.
+
+Mide gen_scheduler, ind_aleatorio, crossox y mutshift (Python puro) y
+decodificar_jsp_correcto, order_crossover_deap y mutacion_shift_deap (DEAP) sobre
+una grilla de tamaños de instancia, con calentamiento y repeticiones, y guarda
+los resultados en JSON (mediana, IQR, ops/seg y muestras crudas).
+
+Uso:
+    python benchmarks/bench_operadores.py
+    python benchmarks/bench_operadores.py --tamanos 20x5,100x20 --repeticiones 20
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.motores import cargar_motor, RAIZ
+from utils.generador import generar_flow_shop
+
+TAMANOS_DEFECTO = "20x5,50x10,100x20,200x20,500x20"
+KERNELS = {
+    'puro': ['gen_scheduler', 'ind_aleatorio', 'crossox', 'mutshift'],
+    'deap': ['decodificar_jsp_correcto', 'order_crossover_deap', 'mutacion_shift_deap'],
+}
+
+
+def parsear_tamanos(texto):
+    """
+    Convierte una lista 'JxM,JxM,...' en tuplas (jobs, maquinas).
+    Args:
+        texto (str): Tamaños separados por coma, por ejemplo '20x5,50x10'.
+    Returns:
+        list[tuple[int, int]]: Lista de (jobs, maquinas).
+    """
+
+    tamanos = []
+    for item in texto.split(','):
+        jobs, maquinas = item.lower().strip().split('x')
+        tamanos.append((int(jobs), int(maquinas)))
+    return tamanos
+
+
+def generar_tiempos(jobs, maquinas, semilla):
+    """
+    Genera una matriz de tiempos (máquinas × jobs) con el generador de Taillard,
+    de modo que cada tamaño sea reproducible entre máquinas y versiones.
+    Args:
+        jobs (int): Cantidad de jobs.
+        maquinas (int): Cantidad de máquinas.
+        semilla (int): Semilla del generador.
+    Returns:
+        np.ndarray: Matriz de tiempos de forma (maquinas, jobs).
+    """
+
+    return generar_flow_shop(jobs, maquinas, semilla)
+
+
+def preparar_puro(puro, tiempos):
+    """
+    Redimensiona el motor puro y carga la matriz de tiempos en Cmj.
+    Returns:
+        dict: Callables sin argumentos por kernel.
+    """
+
+    maquinas, jobs = tiempos.shape
+    puro.configurar_dimensiones(maquinas, jobs)
+    puro.Cmj.array[:, :] = tiempos
+    puro.pmutacion = 0.05
+
+    p1 = puro.ind_aleatorio().cromosoma
+    p2 = puro.ind_aleatorio().cromosoma
+    cmj = puro.Cmj
+
+    def crossox():
+        puro.indchild = 0
+        puro.crossox(p1, p2)
+
+    def ind_aleatorio():
+        # ind_aleatorio ya no evalúa: se suma evaluar para conservar lo que mide el kernel
+        ind = puro.ind_aleatorio()
+        puro.evaluar(ind)
+        return ind
+
+    return {
+        'gen_scheduler': lambda: puro.gen_scheduler(p1, cmj),
+        'ind_aleatorio': ind_aleatorio,
+        'crossox': crossox,
+        'mutshift': lambda: puro.mutshift(p2),
+    }
+
+
+def preparar_deap(deap_motor, tiempos):
+    """
+    Arma la instancia en formato DEAP y configura el toolbox.
+    Returns:
+        dict: Callables sin argumentos por kernel.
+    """
+
+    maquinas, jobs = tiempos.shape
+    instancia = {
+        'nombre': f'bench_{jobs}x{maquinas}',
+        'jobs': jobs,
+        'maquinas': maquinas,
+        'tiempos': tiempos.T.tolist(),
+        'orden_maquinas': [list(range(maquinas)) for _ in range(jobs)],
+        'upper_bound': 0,
+        'lower_bound': 0,
+    }
+    toolbox = deap_motor.configurar_deap(instancia)
+    ind1 = toolbox.individual()
+    ind2 = toolbox.individual()
+
+    return {
+        'decodificar_jsp_correcto': lambda: deap_motor.decodificar_jsp_correcto(ind1, instancia),
+        'order_crossover_deap': lambda: deap_motor.order_crossover_deap(ind1, ind2),
+        # pmut=1.0 para medir la mutación efectiva y no el sorteo
+        'mutacion_shift_deap': lambda: deap_motor.mutacion_shift_deap(ind2, pmut=1.0),
+    }
+
+
+def calibrar(funcion, objetivo_s):
+    """
+    Determina cuántas llamadas por repetición se necesitan para que una
+    repetición dure al menos objetivo_s segundos (similar a timeit.autorange).
+    """
+
+    numero = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            funcion()
+        if time.perf_counter() - t0 >= objetivo_s:
+            return numero
+        numero *= 2
+
+
+def medir(funcion, repeticiones, calentamiento, objetivo_s):
+    """
+    Mide el tiempo por llamada de una función.
+    Args:
+        funcion (callable): Función sin argumentos a medir.
+        repeticiones (int): Muestras a registrar.
+        calentamiento (int): Repeticiones descartadas antes de medir.
+        objetivo_s (float): Duración mínima de cada repetición.
+    Returns:
+        dict: numero de llamadas por muestra, estadísticos y muestras (segundos por llamada).
+    """
+
+    numero = calibrar(funcion, objetivo_s)
+    muestras = []
+    for i in range(calentamiento + repeticiones):
+        t0 = time.perf_counter()
+        for _ in range(numero):
+            funcion()
+        dt = (time.perf_counter() - t0) / numero
+        if i >= calentamiento:
+            muestras.append(dt)
+
+    q1, mediana, q3 = np.percentile(muestras, [25, 50, 75])
+    return {
+        'numero': numero,
+        'mediana_s': float(mediana),
+        'q1_s': float(q1),
+        'q3_s': float(q3),
+        'iqr_s': float(q3 - q1),
+        'ops_seg': float(1.0 / mediana) if mediana > 0 else float('inf'),
+        'muestras_s': [float(m) for m in muestras],
+    }
+
+
+def ejecutar_benchmarks(tamanos, motores, kernels=None, repeticiones=10, calentamiento=2,
+                        objetivo_s=0.02, semilla=12345):
+    """
+    Ejecuta los micro-benchmarks sobre la grilla de tamaños.
+    Args:
+        tamanos (list[tuple[int, int]]): Lista de (jobs, maquinas).
+        motores (list[str]): Motores a medir ('puro', 'deap').
+        kernels (list[str], optional): Subconjunto de kernels a medir.
+        repeticiones (int): Muestras por kernel y tamaño.
+        calentamiento (int): Repeticiones de calentamiento descartadas.
+        objetivo_s (float): Duración mínima de cada muestra.
+        semilla (int): Semilla para instancias y operadores.
+    Returns:
+        list[dict]: Un registro por (motor, kernel, tamaño).
+    """
+
+    preparadores = {'puro': preparar_puro, 'deap': preparar_deap}
+    resultados = []
+
+    for nombre_motor in motores:
+        try:
+            motor = cargar_motor(nombre_motor)
+        except ImportError as e:
+            print(f"! Motor '{nombre_motor}' no disponible: {e}")
+            continue
+
+        for jobs, maquinas in tamanos:
+            random.seed(semilla)
+            np.random.seed(semilla)
+            tiempos = generar_tiempos(jobs, maquinas, semilla)
+            funciones = preparadores[nombre_motor](motor, tiempos)
+
+            for kernel in KERNELS[nombre_motor]:
+                if kernels and kernel not in kernels:
+                    continue
+                medicion = medir(funciones[kernel], repeticiones, calentamiento, objetivo_s)
+                print(f"  {nombre_motor:5} {kernel:26} {jobs:4d}x{maquinas:<3d} "
+                      f"mediana: {medicion['mediana_s'] * 1e6:11.2f} us  "
+                      f"IQR: {medicion['iqr_s'] * 1e6:9.2f} us  "
+                      f"ops/seg: {medicion['ops_seg']:11.1f}")
+                resultados.append({
+                    'motor': nombre_motor,
+                    'kernel': kernel,
+                    'tamano': f"{jobs}x{maquinas}",
+                    'jobs': jobs,
+                    'maquinas': maquinas,
+                    **medicion,
+                })
+
+    return resultados
+
+
+def metadatos(args):
+    """Información del entorno y de la configuración del benchmark."""
+
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'procesador': platform.processor(),
+        'numpy': np.__version__,
+        'repeticiones': args.repeticiones,
+        'calentamiento': args.calentamiento,
+        'objetivo_s': args.objetivo_s,
+        'semilla': args.semilla,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks de decodificadores y operadores genéticos")
+    parser.add_argument('--tamanos', default=TAMANOS_DEFECTO,
+                        help=f"Grilla de tamaños JOBSxMAQUINAS separados por coma (defecto: {TAMANOS_DEFECTO})")
+    parser.add_argument('--motores', default='puro,deap', help="Motores a medir (defecto: puro,deap)")
+    parser.add_argument('--kernels', default=None, help="Subconjunto de kernels separados por coma")
+    parser.add_argument('--repeticiones', type=int, default=10, help="Muestras por kernel y tamaño")
+    parser.add_argument('--calentamiento', type=int, default=2, help="Repeticiones de calentamiento descartadas")
+    parser.add_argument('--objetivo-s', type=float, default=0.02,
+                        help="Duración mínima de cada muestra en segundos")
+    parser.add_argument('--semilla', type=int, default=12345)
+    parser.add_argument('--salida', default=None, help="Archivo JSON de salida")
+    args = parser.parse_args(argv)
+
+    salida = args.salida
+    if salida is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        salida = os.path.join(RAIZ, 'benchmarks', 'resultados', f'bench_operadores_{timestamp}.json')
+
+    print("- Micro-benchmarks de operadores")
+    print("=" * 60)
+    resultados = ejecutar_benchmarks(
+        parsear_tamanos(args.tamanos),
+        [m.strip() for m in args.motores.split(',')],
+        kernels=args.kernels.split(',') if args.kernels else None,
+        repeticiones=args.repeticiones,
+        calentamiento=args.calentamiento,
+        objetivo_s=args.objetivo_s,
+        semilla=args.semilla,
+    )
+
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, 'w', encoding='utf-8') as f:
+        json.dump({'meta': metadatos(args), 'resultados': resultados}, f, indent=2)
+    print(f"\n- Resultados guardados: {salida}")
+    return salida
+
+
+if __name__ == "__main__":
+    main()
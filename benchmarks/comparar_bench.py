@@ -0,0 +1,187 @@
+"""
+Compuerta de regresiones de rendimiento: compara dos archivos de resultados de
+benchmarks (bench_operadores.py o bench_escalado.py), por ejemplo una línea base
+versionada y la corrida actual.
+
+Para cada (motor, kernel, tamaño) presente en ambos archivos compara las muestras
+crudas con la prueba U de Mann-Whitney (unilateral) y la razón de medianas
+actual / base. Un kernel se marca como regresión solo si la diferencia es
+significativa y además supera el umbral relativo, de modo que el ruido de
+medición no dispare falsos positivos.
+
+Códigos de salida:
+    0  sin regresiones
+    1  al menos una regresión
+    2  archivos inválidos o sin kernels en común
+
+Uso:
+    python benchmarks/comparar_bench.py base.json actual.json
+    python benchmarks/comparar_bench.py base.json actual.json --umbral 0.05 --alfa 0.01
+"""
+
+import sys
+import json
+import argparse
+
+import numpy as np
+from scipy import stats
+
+# Veredictos posibles por kernel
+REGRESION = 'REGRESION'
+MEJORA = 'mejora'
+SIN_CAMBIO = 'sin cambio'
+NO_CONCLUYENTE = 'no concluyente'
+
+
+def cargar_resultados(ruta):
+    """
+    Lee un archivo JSON de benchmarks.
+    Args:
+        ruta (str): Ruta del archivo.
+    Returns:
+        tuple[dict, dict]: (meta, registros indexados por (motor, kernel, tamano))
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado.
+    """
+
+    with open(ruta, 'r', encoding='utf-8') as f:
+        datos = json.load(f)
+    if 'resultados' not in datos:
+        raise ValueError(f"{ruta}: falta la clave 'resultados'")
+
+    registros = {}
+    for registro in datos['resultados']:
+        clave = (registro['motor'], registro['kernel'], registro['tamano'])
+        registros[clave] = registro
+    return datos.get('meta', {}), registros
+
+
+def comparar_kernel(base, actual, umbral, alfa):
+    """
+    Compara las muestras de un kernel entre la base y la corrida actual.
+    Args:
+        base (dict): Registro de la línea base (con 'muestras_s').
+        actual (dict): Registro actual (con 'muestras_s').
+        umbral (float): Cambio relativo mínimo de la mediana para considerarlo relevante.
+        alfa (float): Nivel de significancia de la prueba.
+    Returns:
+        dict: razon (mediana actual / base), p-valores y veredicto.
+    """
+
+    muestras_base = np.asarray(base['muestras_s'], dtype=float)
+    muestras_actual = np.asarray(actual['muestras_s'], dtype=float)
+    mediana_base = float(np.median(muestras_base))
+    mediana_actual = float(np.median(muestras_actual))
+    razon = mediana_actual / mediana_base if mediana_base > 0 else float('inf')
+
+    # H1: la corrida actual es más lenta (p_lento) o más rápida (p_rapido)
+    p_lento = stats.mannwhitneyu(muestras_actual, muestras_base, alternative='greater').pvalue
+    p_rapido = stats.mannwhitneyu(muestras_actual, muestras_base, alternative='less').pvalue
+
+    if razon > 1 + umbral:
+        veredicto = REGRESION if p_lento < alfa else NO_CONCLUYENTE
+    elif razon < 1 - umbral:
+        veredicto = MEJORA if p_rapido < alfa else NO_CONCLUYENTE
+    else:
+        veredicto = SIN_CAMBIO
+
+    return {
+        'mediana_base_s': mediana_base,
+        'mediana_actual_s': mediana_actual,
+        'razon': razon,
+        'p_lento': float(p_lento),
+        'p_rapido': float(p_rapido),
+        'veredicto': veredicto,
+    }
+
+
+def comparar(registros_base, registros_actual, umbral=0.10, alfa=0.05):
+    """
+    Compara todos los kernels en común.
+    Returns:
+        tuple[list[dict], list[tuple], list[tuple]]: (comparaciones, claves solo
+        en la base, claves solo en la corrida actual)
+    """
+
+    comunes = sorted(set(registros_base) & set(registros_actual),
+                     key=lambda c: (c[0], c[1], registros_base[c]['jobs'], registros_base[c]['maquinas']))
+    comparaciones = []
+    for clave in comunes:
+        resultado = comparar_kernel(registros_base[clave], registros_actual[clave], umbral, alfa)
+        motor, kernel, tamano = clave
+        comparaciones.append({'motor': motor, 'kernel': kernel, 'tamano': tamano, **resultado})
+
+    solo_base = sorted(set(registros_base) - set(registros_actual))
+    solo_actual = sorted(set(registros_actual) - set(registros_base))
+    return comparaciones, solo_base, solo_actual
+
+
+def formatear_tiempo(segundos):
+    """Formatea un tiempo en la unidad más legible (us, ms o s)."""
+
+    if segundos < 1e-3:
+        return f"{segundos * 1e6:9.2f} us"
+    if segundos < 1:
+        return f"{segundos * 1e3:9.2f} ms"
+    return f"{segundos:9.3f} s "
+
+
+def imprimir_reporte(comparaciones, solo_base, solo_actual, umbral, alfa):
+    """Imprime la tabla de comparación por kernel."""
+
+    print(f"- Comparación de benchmarks (umbral: {umbral:.0%}, alfa: {alfa})")
+    print("=" * 100)
+    print(f"  {'motor':5} {'kernel':26} {'tamaño':>8} {'base':>12} {'actual':>12} "
+          f"{'cambio':>8} {'p':>8}  veredicto")
+    for c in comparaciones:
+        p = c['p_lento'] if c['razon'] >= 1 else c['p_rapido']
+        print(f"  {c['motor']:5} {c['kernel']:26} {c['tamano']:>8} "
+              f"{formatear_tiempo(c['mediana_base_s'])} {formatear_tiempo(c['mediana_actual_s'])} "
+              f"{c['razon'] - 1:+8.1%} {p:8.4f}  {c['veredicto']}")
+
+    for clave in solo_base:
+        print(f"! Solo en la base: {' '.join(clave)}")
+    for clave in solo_actual:
+        print(f"! Solo en la corrida actual: {' '.join(clave)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detecta regresiones de rendimiento entre dos corridas de benchmarks")
+    parser.add_argument('base', help="JSON de la línea base")
+    parser.add_argument('actual', help="JSON de la corrida actual")
+    parser.add_argument('--umbral', type=float, default=0.10,
+                        help="Enlentecimiento relativo de la mediana tolerado (defecto: 0.10)")
+    parser.add_argument('--alfa', type=float, default=0.05, help="Nivel de significancia (defecto: 0.05)")
+    parser.add_argument('--salida', default=None, help="Guardar la comparación en JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        meta_base, registros_base = cargar_resultados(args.base)
+        meta_actual, registros_actual = cargar_resultados(args.actual)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error leyendo resultados: {e}")
+        return 2
+
+    comparaciones, solo_base, solo_actual = comparar(registros_base, registros_actual, args.umbral, args.alfa)
+    if not comparaciones:
+        print("Error: los archivos no tienen kernels en común")
+        return 2
+
+    if meta_base.get('python') != meta_actual.get('python'):
+        print(f"! Versiones de Python distintas: {meta_base.get('python')} vs {meta_actual.get('python')}")
+    imprimir_reporte(comparaciones, solo_base, solo_actual, args.umbral, args.alfa)
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump({'umbral': args.umbral, 'alfa': args.alfa, 'comparaciones': comparaciones}, f, indent=2)
+
+    regresiones = [c for c in comparaciones if c['veredicto'] == REGRESION]
+    print(f"\n- {len(regresiones)} regresiones, "
+          f"{sum(c['veredicto'] == MEJORA for c in comparaciones)} mejoras, "
+          f"{sum(c['veredicto'] == NO_CONCLUYENTE for c in comparaciones)} no concluyentes "
+          f"de {len(comparaciones)} kernels")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+Línea de comandos unificada de Evosocial.
+
+    python evosocial.py resolver puro --instancia converted_swv06.txt -v
+    python evosocial.py resolver deap --generar 50x10:1
+    python evosocial.py convertir JSPLIB/instances --salida instancias/importadas
+    python evosocial.py cotas instancias/*.txt
+    python evosocial.py evaluar converted_swv06.txt --orden 3,1,2,...
+    python evosocial.py estadisticas jssp_puro/resumen_converted_swv06.txt
+    python evosocial.py estadisticas --sqlite resultados.db
+    python evosocial.py bench operadores --tamanos 20x5
+    python evosocial.py analizar
+    python evosocial.py analizar --sqlite ../resultados.db
+
+Cada subcomando importa sus dependencias recién al ejecutarse. El despacho,
+--help y estadisticas usan solo la biblioteca estándar; numpy se carga en
+convertir, cotas y evaluar; deap en 'resolver deap'; pandas en analizar, y
+scipy solo al comparar instancias. benchmarks/bench_arranque.py mide el
+tiempo de arranque de cada subcomando.
+
+'resolver' y 'analizar' se ejecutan desde el directorio del motor o del
+análisis, como los scripts originales: las rutas relativas que se les pasan
+(--datos, --sqlite, ...) son relativas a ese directorio.
+"""
+
+import os
+import sys
+import argparse
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, RAIZ)
+
+BENCHMARKS = {
+    'operadores': 'bench_operadores',
+    'escalado': 'bench_escalado',
+    'comparar': 'comparar_bench',
+    'arranque': 'bench_arranque',
+}
+
+
+def _en_directorio(directorio, funcion, *argumentos):
+    """Ejecuta funcion(*argumentos) con directorio como directorio de trabajo."""
+
+    anterior = os.getcwd()
+    os.chdir(directorio)
+    try:
+        return funcion(*argumentos)
+    finally:
+        os.chdir(anterior)
+
+
+def _resolver(args):
+    from utils.motores import cargar_motor
+
+    motor = cargar_motor(args.motor)
+    return _en_directorio(os.path.join(RAIZ, f'jssp_{args.motor}'), motor.main, args.argumentos)
+
+
+def _convertir(args):
+    from utils.conversion import main
+    return main(args.argumentos)
+
+
+def _cotas(args):
+    from utils.cotas import main
+    return main(args.argumentos)
+
+
+def _ruta_instancia(instancia):
+    """La ruta tal cual si existe; si no, dentro de instancias/ (como los motores)."""
+
+    if os.path.exists(instancia):
+        return instancia
+    return os.path.join(RAIZ, 'instancias', instancia)
+
+
+def _evaluar(args):
+    import numpy as np
+    from utils.cotas import leer_instancia, makespan_permutacion, cota_inferior
+    from utils.conversion import leer_compilada, ruta_compilada
+
+    ruta = _ruta_instancia(args.instancia)
+    compilada = ruta_compilada(ruta)
+    if os.path.exists(compilada) and os.path.getmtime(compilada) >= os.path.getmtime(ruta):
+        upperb, lowerb, tiempos = leer_compilada(compilada)
+    else:
+        upperb, lowerb, tiempos = leer_instancia(ruta)
+    jobs = tiempos.shape[1]
+
+    if args.orden:
+        orden = np.array(args.orden.replace(',', ' ').split(), dtype=np.int64) - 1
+        if np.sort(orden).tolist() != list(range(jobs)):
+            print(f"! El orden debe ser una permutación de 1..{jobs}", file=sys.stderr)
+            return 2
+    else:
+        orden = np.arange(jobs)
+
+    makespan = makespan_permutacion(tiempos, orden)
+    cota = cota_inferior(tiempos)
+    print(f"Instancia: {os.path.basename(ruta)} ({jobs} jobs x {tiempos.shape[0]} máquinas)")
+    print(f"Makespan: {makespan}")
+    print(f"Cotas del archivo: [{lowerb}, {upperb}]  cota inferior calculada: {cota}  "
+          f"gap: {100.0 * (makespan - cota) / cota:.2f}%")
+    return 0
+
+
+def _estadisticas_corridas(nombre, corridas):
+    """Imprime mingl (mín, mediana, media, desvío, máx), genmax medio y motivos de fin."""
+
+    from statistics import mean, median, pstdev
+    from collections import Counter
+
+    mingls = [c['mingl'] for c in corridas]
+    genmaxs = [c['genmax'] for c in corridas if c['genmax'] is not None]
+    motivos = Counter(c['motivo'] for c in corridas if c['motivo'])
+    print(f"{nombre:<32} {len(mingls):>4} {min(mingls):>9.1f} {median(mingls):>9.1f} {mean(mingls):>9.1f} "
+          f"{pstdev(mingls):>8.2f} {max(mingls):>9.1f} {mean(genmaxs) if genmaxs else float('nan'):>8.1f}  "
+          f"{', '.join(f'{m}:{k}' for m, k in sorted(motivos.items()))}")
+
+
+def _leer_corridas_resumen(ruta):
+    """Corridas de un resumen_*.txt (5 columnas, o 7 con genfin y motivo)."""
+
+    corridas = []
+    with open(ruta, 'r') as f:
+        for linea in f:
+            campos = linea.split()
+            if len(campos) < 5 or campos[0].startswith('#'):
+                continue
+            corridas.append({'mingl': float(campos[3]), 'genmax': int(campos[4]),
+                             'motivo': campos[6] if len(campos) > 6 else None})
+    return corridas
+
+
+def _estadisticas(args):
+    print(f"{'origen':<32} {'n':>4} {'min':>9} {'mediana':>9} {'media':>9} {'desvío':>8} {'max':>9} "
+          f"{'genmax':>8}  motivos")
+
+    for ruta in args.resumenes:
+        corridas = _leer_corridas_resumen(ruta)
+        if corridas:
+            _estadisticas_corridas(os.path.basename(ruta), corridas)
+        else:
+            print(f"! {ruta}: sin corridas", file=sys.stderr)
+
+    if args.sqlite:
+        from utils.almacen import conectar_lectura, consultar_experimentos
+
+        try:
+            conexion = conectar_lectura(args.sqlite)
+        except FileNotFoundError as e:
+            print(f"! {e}", file=sys.stderr)
+            return 1
+        for experimento in consultar_experimentos(conexion, args.motor, args.instancia, ultimo=not args.todos):
+            filas = conexion.execute("SELECT mingl, genmax, motivo FROM corridas WHERE experimento = ? "
+                                     "ORDER BY corrida", (experimento['id'],)).fetchall()
+            if filas:
+                nombre = f"{experimento['motor']}/{experimento['instancia']}#{experimento['id']}"
+                _estadisticas_corridas(nombre, [dict(zip(('mingl', 'genmax', 'motivo'), f)) for f in filas])
+        conexion.close()
+    return 0
+
+
+def _bench(args):
+    import importlib
+
+    directorio = os.path.join(RAIZ, 'benchmarks')
+    if directorio not in sys.path:
+        sys.path.insert(0, directorio)
+    return importlib.import_module(BENCHMARKS[args.benchmark]).main(args.argumentos)
+
+
+def _analizar(args):
+    directorio = os.path.join(RAIZ, 'analysis')
+    if directorio not in sys.path:
+        sys.path.insert(0, directorio)
+    import analisis_comparativo
+
+    return _en_directorio(directorio, analisis_comparativo.analizar_corridas, args.sqlite)
+
+
+def crear_parser():
+    """Parser de la línea de comandos (sin importar ningún subcomando)."""
+
+    parser = argparse.ArgumentParser(prog='evosocial', description="Evosocial: resolver, convertir, medir y analizar")
+    subcomandos = parser.add_subparsers(dest='comando', required=True, metavar='COMANDO')
+
+    resolver = subcomandos.add_parser('resolver', help="Ejecutar un motor (argumentos del main.py del motor)")
+    resolver.add_argument('motor', choices=['puro', 'deap'])
+    resolver.add_argument('argumentos', nargs=argparse.REMAINDER, help="Argumentos del motor (ver --help)")
+    resolver.set_defaults(funcion=_resolver)
+
+    for nombre, funcion, ayuda in (('convertir', _convertir, "Convertir instancias JSPLIB/OR-Library/Taillard"),
+                                   ('cotas', _cotas, "Cotas del makespan de instancias convertidas")):
+        # Todos los argumentos (incluido --help) pasan al script; ver main()
+        sub = subcomandos.add_parser(nombre, help=ayuda, add_help=False)
+        sub.set_defaults(funcion=funcion, pasante=True)
+
+    evaluar = subcomandos.add_parser('evaluar', help="Makespan de una permutación de jobs")
+    evaluar.add_argument('instancia', help="Archivo de instancia (o nombre dentro de instancias/)")
+    evaluar.add_argument('--orden', default=None,
+                         help="Permutación de jobs en base 1 separada por comas o espacios (defecto: 1..n)")
+    evaluar.set_defaults(funcion=_evaluar)
+
+    estadisticas = subcomandos.add_parser('estadisticas', help="Estadísticas de corridas (resumen_*.txt o SQLite)")
+    estadisticas.add_argument('resumenes', nargs='*', help="Archivos resumen_*.txt")
+    estadisticas.add_argument('--sqlite', default=None, metavar='RUTA', help="Base de resultados (--sqlite de los motores)")
+    estadisticas.add_argument('--motor', default=None, help="Filtrar la base por motor")
+    estadisticas.add_argument('--instancia', default=None, help="Filtrar la base por instancia")
+    estadisticas.add_argument('--todos', action='store_true', help="Todos los experimentos, no solo el último")
+    estadisticas.set_defaults(funcion=_estadisticas)
+
+    bench = subcomandos.add_parser('bench', help="Benchmarks (argumentos del script de benchmarks/)")
+    bench.add_argument('benchmark', choices=sorted(BENCHMARKS))
+    bench.add_argument('argumentos', nargs=argparse.REMAINDER)
+    bench.set_defaults(funcion=_bench)
+
+    analizar = subcomandos.add_parser('analizar', help="Análisis comparativo (analysis/analisis_comparativo.py)")
+    analizar.add_argument('--sqlite', default=None, metavar='RUTA',
+                          help="Leer los resultados de una base SQLite en lugar de los directorios puro/ y deap/")
+    analizar.set_defaults(funcion=_analizar)
+
+    return parser
+
+
+def main(argv=None):
+    parser = crear_parser()
+    args, resto = parser.parse_known_args(argv)
+    if getattr(args, 'pasante', False):
+        args.argumentos = resto
+    elif resto:
+        parser.error(f"argumentos no reconocidos: {' '.join(resto)}")
+    return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
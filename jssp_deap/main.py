@@ -1,10 +1,28 @@
 import os
 import random
+import argparse
 import numpy as np
 from deap import base, creator, tools
-import copy
+import sys
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.instrumentacion import CronometroFases, MonitorMemoria, lineas_memoria, ruta_companera, rss_pico_kib
+from utils.perfilado import perfilar
+from utils.generador import generar_instancia, parsear_especificacion
+from utils.registro import log, configurar_verbosidad, INFO, GENERACION
+from utils.eventos import EscritorEventos
+from utils.metricas import ServidorMetricas
+from utils.convergencia import EscritorConvergencia, EXTENSION as EXTENSION_CONVERGENCIA, MARCA_CAMBIOS
+from utils.almacen import AlmacenResultados
+from utils.heuristicas import neh, MemeticaReina
+from utils.duplicados import FiltroDuplicados
+from utils.adaptacion import ControlOperadores, METODOS as METODOS_CONTROL
+
+
+# Motivos de finalización de una corrida (se registran en el resumen)
+MOTIVOS_FIN = ('maxgen', 'tiempo', 'evaluaciones', 'estancamiento', 'lowerb', 'objetivo')
+
 
 # Lectura de parámetros desde DATOS.DAT
 def leer_parametros(archivo="DATOS.DAT"):
@@ -35,12 +53,12 @@ def leer_parametros(archivo="DATOS.DAT"):
         'popsize': int(lineas[4].strip())
     }
     
-    print("- Parámetros cargados:")
-    print(f"   Corridas: {parametros['cantcorr']}")
-    print(f"   P. Mutación: {parametros['pmutacion']}")
-    print(f"   P. Crossover: {parametros['pcross']}")
-    print(f"   Max Generaciones: {parametros['maxgen']}")
-    print(f"   Tamaño Población: {parametros['popsize']}")
+    log(INFO, "- Parámetros cargados:")
+    log(INFO, f"   Corridas: {parametros['cantcorr']}")
+    log(INFO, f"   P. Mutación: {parametros['pmutacion']}")
+    log(INFO, f"   P. Crossover: {parametros['pcross']}")
+    log(INFO, f"   Max Generaciones: {parametros['maxgen']}")
+    log(INFO, f"   Tamaño Población: {parametros['popsize']}")
     
     return parametros
 
@@ -103,9 +121,9 @@ def leer_instancia_jsp(archivo):
         'lower_bound': lower_bound
     }
     
-    print(f"- Instancia cargada: {instancia['nombre']}")
-    print(f"   Jobs: {num_jobs}, Máquinas: {num_maquinas}")
-    print(f"   Bounds: [{lower_bound}, {upper_bound}]")
+    log(INFO, f"- Instancia cargada: {instancia['nombre']}")
+    log(INFO, f"   Jobs: {num_jobs}, Máquinas: {num_maquinas}")
+    log(INFO, f"   Bounds: [{lower_bound}, {upper_bound}]")
     
     return instancia
 
@@ -128,7 +146,7 @@ def configurar_deap(instancia):
             - population initialization
             - evaluation function
             - crossover operator (order_crossover_deap)
-            - mutation operator (mutacion_shift_deap)
+            - mutation operators (mutacion_shift_deap, and mutacion_swap_deap as mutate_swap)
     Note:
         Clears any previous DEAP configuration before setting up new components.
         Individual representation: permutation of jobs repeated machines times.
@@ -190,7 +208,9 @@ def configurar_deap(instancia):
     
     toolbox.register("evaluate", evaluar_jsp)
     toolbox.register("mate", order_crossover_deap)
-    toolbox.register("mutate", mutacion_shift_deap, pmut=0.05)
+    # La probabilidad de mutación (pmutacion) se sortea en mutar, antes de copiar al individuo
+    toolbox.register("mutate", mutacion_shift_deap, pmut=1.0)
+    toolbox.register("mutate_swap", mutacion_swap_deap, pmut=1.0)
     
     return toolbox
 
@@ -359,6 +379,7 @@ def mutacion_shift_deap(individual, pmut=0.05):
     Este operador de mutación selecciona un segmento contiguo aleatorio del individuo,
     lo remueve, y lo inserta en una posición aleatoria diferente. La operación se
     realiza con probabilidad pmut, y solo si el individuo tiene longitud > 3.
+    Con pmut >= 1 no se sortea (ver mutar).
     Args:
         individual (list): El cromosoma individual a mutar
         pmut (float): Probabilidad de mutación (por defecto: 0.05)
@@ -366,7 +387,7 @@ def mutacion_shift_deap(individual, pmut=0.05):
         tuple: Una tupla que contiene el individuo mutado
     """
     
-    if random.random() < pmut and len(individual) > 3:
+    if (pmut >= 1.0 or random.random() < pmut) and len(individual) > 3:
         size = len(individual)
         
         # Seleccionar segmento aleatorio
@@ -384,6 +405,106 @@ def mutacion_shift_deap(individual, pmut=0.05):
     
     return individual,
 
+def mutacion_swap_deap(individual, pmut=0.05):
+    """
+    Realiza una mutación de intercambio: con probabilidad pmut intercambia los genes
+    de dos posiciones aleatorias distintas (equivalente a mutacion de la versión pura).
+    Con pmut >= 1 no se sortea (ver mutar).
+    Args:
+        individual (list): El cromosoma individual a mutar
+        pmut (float): Probabilidad de mutación (por defecto: 0.05)
+    Returns:
+        tuple: Una tupla que contiene el individuo mutado
+    """
+    
+    if (pmut >= 1.0 or random.random() < pmut) and len(individual) > 1:
+        i, j = random.sample(range(len(individual)), 2)
+        individual[i], individual[j] = individual[j], individual[i]
+    
+    return individual,
+
+def mutar(toolbox, individuo, pmut, operador='mutate'):
+    """
+    Muta con probabilidad pmut una copia del individuo, como varAnd de DEAP: la
+    copia se hace solo si la mutación se aplica, y su fitness queda inválido si
+    el cromosoma cambió. Si no, devuelve el mismo individuo con su fitness.
+    Args:
+        toolbox (deap.base.Toolbox): Toolbox con clone() y el operador de mutación.
+        individuo (creator.Individual): Individuo a mutar (no se modifica).
+        pmut (float): Probabilidad de mutación.
+        operador (str): Nombre del operador en el toolbox ('mutate' = shift, 'mutate_swap').
+    Returns:
+        creator.Individual: El mutante o el propio individuo.
+    """
+
+    if random.random() >= pmut:
+        return individuo
+    mutante, = getattr(toolbox, operador)(toolbox.clone(individuo))
+    if mutante == individuo:  # Desplazamiento a la misma posición
+        return individuo
+    del mutante.fitness.values
+    return mutante
+
+def individuo_por_bloques(orden, instancia, makespan):
+    """
+    Adapta una permutación de jobs a la representación por operaciones: cada job
+    se repite tantas veces como máquinas, en bloques consecutivos. Con el orden de
+    máquinas secuencial, decodificar_jsp_correcto programa cada job completo
+    después del anterior, así que el makespan decodificado es el mismo que el de
+    la permutación y no hace falta evaluarlo de nuevo.
+    Args:
+        orden (sequence[int]): Permutación de jobs (base 0).
+        instancia (dict): Instancia con 'maquinas'.
+        makespan (float): Makespan de la permutación.
+    Returns:
+        creator.Individual: Individuo con el fitness asignado.
+    """
+
+    individuo = creator.Individual([int(job) for job in orden for _ in range(instancia['maquinas'])])
+    individuo.fitness.values = (makespan,)
+    return individuo
+
+def individuo_neh(instancia):
+    """
+    Construye un individuo con la heurística NEH (ver utils/heuristicas.py),
+    adaptado a la representación por operaciones con individuo_por_bloques.
+    Args:
+        instancia (dict): Instancia con 'tiempos' (jobs × operaciones) y 'maquinas'.
+    Returns:
+        tuple: (individuo con fitness asignado, evaluaciones consumidas por NEH).
+    """
+
+    tiempos = np.array(instancia['tiempos'], dtype=np.int64).T  # (maquinas, jobs)
+    orden, makespan, evaluaciones = neh(tiempos)
+    return individuo_por_bloques(orden, instancia, makespan), evaluaciones
+
+def evaluar_individuo(toolbox, individuo, duplicados=None):
+    """
+    Asigna el fitness de un individuo con toolbox.evaluate si no es válido
+    (individuo nuevo o mutado). Con el filtro de duplicados, un cromosoma ya
+    evaluado toma el makespan guardado.
+    Args:
+        toolbox (deap.base.Toolbox): Toolbox con evaluate().
+        individuo (creator.Individual): Individuo a evaluar (se modifica in-place).
+        duplicados (FiltroDuplicados, optional): Filtro de cromosomas ya evaluados.
+    Returns:
+        int: Evaluaciones consumidas (0 si el fitness ya era válido o el individuo
+        era un duplicado, 1 si no).
+    """
+
+    if individuo.fitness.valid:
+        return 0
+    if duplicados is None:
+        individuo.fitness.values = toolbox.evaluate(individuo)
+        return 1
+    clave, makespan = duplicados.buscar(individuo)
+    if makespan is not None:
+        individuo.fitness.values = (makespan,)
+        return 0
+    individuo.fitness.values = toolbox.evaluate(individuo)
+    duplicados.registrar(clave, individuo.fitness.values[0])
+    return 1
+
 # Algoritmo Evosocial 
 def calcular_error_relativo(makespan, lower_bound):
     """
@@ -401,7 +522,48 @@ def calcular_error_relativo(makespan, lower_bound):
         return 0.0
     return ((makespan - lower_bound) / lower_bound) * 100.0
 
-def algoritmo_evosocial_deap(instancia, parametros, toolbox):
+def verificar_parada(parametros, lower_bound, gen, gen_mejor, mejor_global, evaluaciones, t_inicio):
+    """
+    Evalúa los criterios de parada adicionales al final de una generación.
+    Los criterios no configurados (None/False en parametros) se ignoran. Primero se
+    verifican los criterios de calidad (lower bound, makespan objetivo) y luego los
+    de presupuesto (evaluaciones, estancamiento, tiempo).
+    Args:
+        parametros (dict): Parámetros del algoritmo. Claves opcionales:
+            - max_tiempo (float): Presupuesto de tiempo por corrida en segundos
+            - max_evals (int): Presupuesto de evaluaciones por corrida
+            - max_estancamiento (int): Generaciones sin mejora admitidas
+            - objetivo (float): Makespan objetivo
+            - parar_en_lowerb (bool): Detener al alcanzar la cota inferior
+        lower_bound (float): Cota inferior de la instancia.
+        gen (int): Generación actual.
+        gen_mejor (int): Generación en que se encontró el mejor global.
+        mejor_global (float): Mejor makespan encontrado.
+        evaluaciones (int): Evaluaciones acumuladas en la corrida.
+        t_inicio (float): Instante de inicio de la corrida (time.perf_counter).
+    Returns:
+        str or None: Motivo de finalización (ver MOTIVOS_FIN) o None si debe continuar.
+    """
+
+    if parametros.get('parar_en_lowerb') and mejor_global <= lower_bound:
+        return 'lowerb'
+    objetivo = parametros.get('objetivo')
+    if objetivo is not None and mejor_global <= objetivo:
+        return 'objetivo'
+    max_evals = parametros.get('max_evals')
+    if max_evals is not None and evaluaciones >= max_evals:
+        return 'evaluaciones'
+    max_estancamiento = parametros.get('max_estancamiento')
+    if max_estancamiento is not None and gen - gen_mejor >= max_estancamiento:
+        return 'estancamiento'
+    max_tiempo = parametros.get('max_tiempo')
+    if max_tiempo is not None and time.perf_counter() - t_inicio >= max_tiempo:
+        return 'tiempo'
+    return None
+
+def algoritmo_evosocial_deap(instancia, parametros, toolbox, cronometro=None, corrida=0, memoria=None,
+                             eventos=None, metricas=None, convergencia=None, memetica=None, duplicados=None,
+                             control=None):
     """
     Ejecuta un algoritmo genético híbrido inspirado en estrategias evolutivas usando DEAP.
     Este algoritmo implementa una estrategia evolutiva que mantiene una solución elite (reina)
@@ -414,11 +576,34 @@ def algoritmo_evosocial_deap(instancia, parametros, toolbox):
             - maxgen (int): Número máximo de generaciones
             - pcross (float): Probabilidad de aplicar crossover (vs mutación)
             - pmutacion (float): Probabilidad de mutación
+            - max_tiempo, max_evals, max_estancamiento, objetivo, parar_en_lowerb:
+              criterios de parada opcionales (ver verificar_parada)
+            - semilla_reina (str, optional): 'aleatoria' (defecto) o 'neh'; las
+              evaluaciones de NEH se suman a las de la corrida
         toolbox (deap.base.Toolbox): Toolbox de DEAP con operadores evolutivos:
             - individual(): Función para crear individuos
             - evaluate(): Función de evaluación de fitness
             - mate(): Operador de crossover
             - mutate(): Operador de mutación
+        cronometro (CronometroFases, optional): Si se indica, acumula el tiempo por fase
+            de cada generación y escribe una línea por generación. None = sin instrumentación.
+        corrida (int, optional): Índice de corrida con que se registran los tiempos por fase.
+        memoria (MonitorMemoria, optional): Si se indica, registra la memoria de cada
+            generación y el pico de la corrida. None = sin instrumentación.
+        eventos (EscritorEventos, optional): Si se indica, emite los eventos de la corrida
+            (inicio, nuevo mejor, generación y fin) en formato JSONL.
+        metricas (ServidorMetricas, optional): Si se indica, publica el estado de la corrida
+            en cada generación.
+        convergencia (EscritorConvergencia, optional): Si se indica, registra cada generación
+            (gen, mingl, evals, avg, tiempo) y escribe la corrida como un bloque binario al final.
+        memetica (MemeticaReina, optional): Si se indica, aplica búsqueda local a la reina al
+            final de las generaciones que correspondan. La búsqueda trabaja sobre la
+            permutación de jobs de la máquina 0 de la reina (orden de primera aparición) y
+            la reemplaza solo si la mejora; sus evaluaciones se suman a las de la corrida.
+        duplicados (FiltroDuplicados, optional): Si se indica, los cromosomas ya evaluados en
+            la generación (o corrida) toman el makespan guardado y no cuentan como evaluación.
+        control (ControlOperadores, optional): Si se indica, cada individuo sortea entre cruce,
+            mutación shift y mutación swap con probabilidades adaptativas en lugar de pcross.
     Returns:
         dict: Resultados del algoritmo con las siguientes claves:
             - mejor_global (float): Mejor valor de fitness encontrado
@@ -426,6 +611,9 @@ def algoritmo_evosocial_deap(instancia, parametros, toolbox):
             - error_mejor (float): Error relativo del mejor respecto al límite inferior
             - error_promedio (float): Error relativo promedio de la última generación
             - historial_convergencia (list): Historial de convergencia por generación
+            - gen_final (int): Última generación ejecutada
+            - motivo_fin (str): Motivo de finalización de la corrida
+            - memoria_pico_kib (float | None): Pico de tracemalloc de la corrida (solo con memoria)
     """
     
     popsize = parametros['popsize']
@@ -433,75 +621,185 @@ def algoritmo_evosocial_deap(instancia, parametros, toolbox):
     pcross = parametros['pcross']
     pmutacion = parametros['pmutacion']
     lower_bound = instancia['lower_bound']
+    t_inicio = time.perf_counter()
+    if memoria is not None:
+        memoria.iniciar_corrida()
+    if memetica is not None:
+        memetica.iniciar_corrida(corrida)
+        tiempos = np.array(instancia['tiempos'], dtype=np.int64).T  # (maquinas, jobs)
+    if duplicados is not None:
+        duplicados.iniciar_corrida(corrida)
+    if control is not None:
+        control.iniciar_corrida(corrida)
     
     # Inicializar Queen
-    queen = toolbox.individual()
-    queen.fitness.values = toolbox.evaluate(queen)
+    if parametros.get('semilla_reina') == 'neh':
+        queen, evaluaciones_totales = individuo_neh(instancia)
+    else:
+        queen = toolbox.individual()
+        queen.fitness.values = toolbox.evaluate(queen)
+        evaluaciones_totales = 1  # Queen inicial
     mejor_global = queen.fitness.values[0]
     gen_mejor = 0
+    if eventos is not None:
+        eventos.emitir('corrida_inicio', motor='deap', instancia=instancia['nombre'], corrida=corrida,
+                       popsize=popsize, maxgen=maxgen)
+    if convergencia is not None:
+        convergencia.iniciar_corrida(corrida)
     
     # Historial
     historial_convergencia = []
-    evaluaciones_totales = 1  # Queen inicial
     
     # Variables para tracking de población
     suma_fitness_gen = 0
     count_fitness_gen = 0
+    gen_final = 0
+    motivo_fin = 'maxgen'
     
     # Evolución generacional
     for gen in range(1, maxgen + 1):
+        if cronometro is not None:
+            cronometro.iniciar_generacion()
+        evaluaciones_inicio_gen = evaluaciones_totales
         suma_fitness_gen = queen.fitness.values[0]  # Incluir Queen
         count_fitness_gen = 1
+        if duplicados is not None:
+            duplicados.iniciar_generacion(queen, queen.fitness.values[0])
         
         # Procesar popsize individuos (inmigrantes aleatorios)
         for i in range(popsize):
-            # 1. Generar inmigrante aleatorio
+            # 1. Generar inmigrante aleatorio (sin evaluar: en el cruce su fitness no se usa)
             inmigrante = toolbox.individual()
-            inmigrante.fitness.values = toolbox.evaluate(inmigrante)
-            evaluaciones_totales += 1
+            if cronometro is not None:
+                cronometro.marcar('inmigrante')
             
-            # 2. Decisión estocástica: crossover o mutación
-            if random.random() < pcross:
-                # CROSSOVER: Queen × inmigrante
-                hijo1, hijo2 = toolbox.mate(copy.deepcopy(queen), copy.deepcopy(inmigrante))
-                hijo1.fitness.values = toolbox.evaluate(hijo1)
-                hijo2.fitness.values = toolbox.evaluate(hijo2)
-                evaluaciones_totales += 2
+            # 2. Decisión estocástica: crossover o mutación (shift o swap con el control adaptativo)
+            referencia = queen.fitness.values[0]
+            if control is not None:
+                operador = control.elegir()
+            else:
+                operador = 'cruce' if random.random() < pcross else 'shift'
+            mutacion = 'mutate_swap' if operador == 'swap' else 'mutate'
+            if operador == 'cruce':
+                # CROSSOVER: Queen × inmigrante (los hijos son individuos nuevos; los padres no cambian)
+                hijo1, hijo2 = toolbox.mate(queen, inmigrante)
+                if cronometro is not None:
+                    cronometro.marcar('cruce')
+                evaluaciones_totales += evaluar_individuo(toolbox, hijo1, duplicados)
+                evaluaciones_totales += evaluar_individuo(toolbox, hijo2, duplicados)
+                if cronometro is not None:
+                    cronometro.marcar('evaluacion')
                 
                 # Seleccionar mejor offspring
                 mejor_hijo = hijo1 if hijo1.fitness.values[0] < hijo2.fitness.values[0] else hijo2
                 candidato = mejor_hijo
             else:
-                # MUTACIÓN: aplicar a ambos y seleccionar mejor
-                queen_mut = copy.deepcopy(queen)
-                queen_mut, = toolbox.mutate(queen_mut)
-                queen_mut.fitness.values = toolbox.evaluate(queen_mut)
+                # MUTACIÓN: aplicar a ambos y seleccionar mejor; sin mutar, la reina
+                # conserva su fitness y el inmigrante se evalúa una sola vez
+                queen_mut = mutar(toolbox, queen, pmutacion, mutacion)
+                if cronometro is not None:
+                    cronometro.marcar('mutacion')
+                evaluaciones_totales += evaluar_individuo(toolbox, queen_mut, duplicados)
+                if cronometro is not None:
+                    cronometro.marcar('evaluacion')
                 
-                inm_mut = copy.deepcopy(inmigrante)
-                inm_mut, = toolbox.mutate(inm_mut)
-                inm_mut.fitness.values = toolbox.evaluate(inm_mut)
-                
-                evaluaciones_totales += 2
+                inm_mut = mutar(toolbox, inmigrante, pmutacion, mutacion)
+                if cronometro is not None:
+                    cronometro.marcar('mutacion')
+                evaluaciones_totales += evaluar_individuo(toolbox, inm_mut, duplicados)
+                if cronometro is not None:
+                    cronometro.marcar('evaluacion')
                 
                 # Seleccionar mejor entre ambos mutados
                 candidato = queen_mut if queen_mut.fitness.values[0] < inm_mut.fitness.values[0] else inm_mut
             
+            if control is not None:
+                control.recompensar(operador, candidato.fitness.values[0], referencia)
+            
             # 3. Actualizar estadísticas poblacionales
             suma_fitness_gen += candidato.fitness.values[0]
             count_fitness_gen += 1
             
             # 4. Actualizar Queen si hay mejora
             if candidato.fitness.values[0] < queen.fitness.values[0]:
-                queen = copy.deepcopy(candidato)
+                queen = candidato  # Individuo nuevo de esta iteración: no hace falta copiarlo
+                mejor_global = queen.fitness.values[0]
+                gen_mejor = gen
+                if eventos is not None:
+                    eventos.emitir('nuevo_mejor', corrida=corrida, gen=gen, mingl=mejor_global,
+                                   evals=evaluaciones_totales)
+            if cronometro is not None:
+                cronometro.marcar('seleccion')
+        
+        # Paso memético sobre la reina (periódico y/o al mejorar)
+        memetica_gen = memetica is not None and memetica.corresponde(gen, gen_mejor == gen)
+        if memetica_gen:
+            orden = list(dict.fromkeys(queen))  # Orden de los jobs en la máquina 0
+            secuencia, makespan, evaluaciones = memetica.aplicar(tiempos, orden, None, gen)
+            evaluaciones_totales += evaluaciones
+            if makespan < queen.fitness.values[0]:
+                queen = individuo_por_bloques(secuencia, instancia, makespan)
                 mejor_global = queen.fitness.values[0]
                 gen_mejor = gen
+                if eventos is not None:
+                    eventos.emitir('nuevo_mejor', corrida=corrida, gen=gen, mingl=mejor_global,
+                                   evals=evaluaciones_totales)
+            if cronometro is not None:
+                cronometro.marcar('evaluacion')
         
         # Guardar punto de convergencia
         historial_convergencia.append({
             'gen': gen,
             'mingl': mejor_global,
-            'evals': evaluaciones_totales
+            'evals': evaluaciones_totales,
+            'memetica': memetica_gen  # Salto de evals: se registra también en el modo por cambios
         })
+        if cronometro is not None:
+            cronometro.marcar('io')
+            cronometro.cerrar_generacion(corrida, gen, evaluaciones_totales - evaluaciones_inicio_gen)
+        if memoria is not None:
+            memoria.cerrar_generacion(corrida, gen)
+        if eventos is not None:
+            eventos.emitir('generacion', corrida=corrida, gen=gen, mingl=mejor_global,
+                           avg=suma_fitness_gen / count_fitness_gen, evals=evaluaciones_totales)
+        if metricas is not None:
+            metricas.actualizar(corrida, gen, evaluaciones_totales, mejor_global)
+        if duplicados is not None:
+            duplicados.cerrar_generacion(gen)
+            if metricas is not None:
+                metricas.actualizar_cache(corrida, duplicados.duplicados_corrida, duplicados.consultas_corrida)
+        if control is not None:
+            probabilidades = control.cerrar_generacion(gen)
+            log(GENERACION, "  Operadores: " + ", ".join(f"{o} {p:.3f}" for o, p in probabilidades.items()))
+        if convergencia is not None:
+            convergencia.registrar(gen, mejor_global, evaluaciones_totales,
+                                   suma_fitness_gen / count_fitness_gen, time.perf_counter() - t_inicio)
+        log(GENERACION, f"Generación {gen:4d} - Mejor Global: {mejor_global:6.2f} - "
+                        f"Avg de Gen: {suma_fitness_gen / count_fitness_gen:6.2f}")
+        gen_final = gen
+        
+        # Criterios de parada adicionales
+        motivo = verificar_parada(parametros, lower_bound, gen, gen_mejor,
+                                  mejor_global, evaluaciones_totales, t_inicio)
+        if motivo is not None:
+            motivo_fin = motivo
+            break
+    
+    memoria_pico_kib = memoria.cerrar_corrida()[0] if memoria is not None else None
+    if memetica is not None:
+        log(INFO, f"   Búsqueda local: {memetica.aplicaciones} aplicaciones, {memetica.mejoras} mejoras, "
+                  f"{memetica.evals} de {evaluaciones_totales} evaluaciones")
+    if duplicados is not None:
+        log(INFO, f"   Duplicados: {duplicados.duplicados_corrida} de {duplicados.consultas_corrida} "
+                  f"evaluaciones evitadas")
+    if metricas is not None:
+        metricas.finalizar_corrida(corrida)
+    if convergencia is not None:
+        convergencia.cerrar_corrida()
+    if eventos is not None:
+        eventos.emitir('corrida_fin', corrida=corrida, mingl=mejor_global, genmax=gen_mejor, genfin=gen_final,
+                       motivo=motivo_fin, evals=evaluaciones_totales,
+                       segundos=round(time.perf_counter() - t_inicio, 3))
     
     # Calcular error del mejor
     error_mejor = calcular_error_relativo(mejor_global, lower_bound)
@@ -515,12 +813,18 @@ def algoritmo_evosocial_deap(instancia, parametros, toolbox):
         'gen_mejor': gen_mejor,
         'error_mejor': error_mejor,
         'error_promedio': error_promedio,
-        'historial_convergencia': historial_convergencia
+        'historial_convergencia': historial_convergencia,
+        'gen_final': gen_final,
+        'motivo_fin': motivo_fin,
+        'memoria_pico_kib': memoria_pico_kib
     }
 
 
 # Generación de archivos de resumen y detalle
-def ejecutar_experimento_completo(instancia, parametros, archivo_resumen="resumen.txt", archivo_detalle="detalle.txt"):
+def ejecutar_experimento_completo(instancia, parametros, archivo_resumen="resumen.txt", archivo_detalle="detalle.txt",
+                                  tiempos_fase=False, perfil_base=None, perfil_lineas=False,
+                                  memoria=False, memoria_top=5, eventos=False, metricas=None,
+                                  detalle_binario=False, detalle_cambios=False, almacen=None):
     """
     Ejecuta un experimento completo del algoritmo evolutivo social utilizando DEAP.
     Esta función coordina múltiples corridas del algoritmo evolutivo, almacena los resultados
@@ -529,11 +833,35 @@ def ejecutar_experimento_completo(instancia, parametros, archivo_resumen="resume
         instancia (dict): Diccionario con información de la instancia del problema JSSP.
             Debe contener al menos la clave 'nombre' con el nombre de la instancia.
         parametros (dict): Diccionario con los parámetros de configuración del algoritmo.
-            Debe contener la clave 'cantcorr' con el número de corridas a ejecutar.
+            Debe contener la clave 'cantcorr' con el número de corridas a ejecutar. Con
+            'memetica_cada' o 'memetica_al_mejorar' se aplica búsqueda local a la reina
+            (ver MemeticaReina) y se registra en memetica_*.txt. Con 'duplicados'
+            ('generacion' o 'corrida') no se reevalúan cromosomas repetidos (ver
+            FiltroDuplicados) y la tasa por generación se registra en duplicados_*.txt.
+            Con 'control' ('persecucion' o 'emparejamiento') las probabilidades de
+            cruce, shift y swap se adaptan (ver ControlOperadores) y su trayectoria se
+            registra en operadores_*.txt.
         archivo_resumen (str, optional): Nombre del archivo para guardar el resumen de resultados.
             Por defecto "resumen.txt".
         archivo_detalle (str, optional): Nombre del archivo para guardar el detalle completo
             del historial de convergencia. Por defecto "detalle.txt".
+        tiempos_fase (bool, optional): Si es True, registra el tiempo por fase de cada
+            generación en tiempos_fase_*.txt junto al archivo de detalle.
+        perfil_base (str, optional): Si se indica, cada corrida se ejecuta bajo cProfile y se
+            guarda en <perfil_base>_corrida<k>.pstats y <perfil_base>_corrida<k>_resumen.txt.
+        perfil_lineas (bool, optional): Con perfil_base, cuenta además las líneas ejecutadas
+            (Python 3.12+).
+        memoria (bool, optional): Si es True, registra la memoria de cada generación en
+            memoria_*.txt y los sitios de asignación top en memoria_sitios_*.txt.
+        memoria_top (int, optional): Sitios de asignación por generación (0 = ninguno).
+        eventos (bool, optional): Si es True, escribe el flujo de eventos en eventos_*.jsonl.
+        metricas (ServidorMetricas, optional): Endpoint de métricas a actualizar en cada generación.
+        detalle_binario (bool, optional): Si es True, la convergencia se guarda en formato binario
+            columnar (detalle_*.evc, ver utils/convergencia.py) en lugar de detalle_*.txt.
+        detalle_cambios (bool, optional): Si es True, detalle_*.txt solo registra la primera
+            generación, las mejoras de mingl y la última generación de cada corrida.
+        almacen (AlmacenResultados, optional): Base SQLite con el experimento ya iniciado; cada
+            corrida y su convergencia completa se insertan al terminar la corrida.
     Returns:
         list: Lista de diccionarios con los resultados de cada corrida. Cada diccionario contiene:
             - indcorr (int): Índice de la corrida
@@ -541,6 +869,9 @@ def ejecutar_experimento_completo(instancia, parametros, archivo_resumen="resume
             - epop (float): Error promedio de la población
             - mingl (float): Mejor makespan global encontrado
             - genmax (int): Generación donde se encontró el mejor resultado
+            - genfin (int): Última generación ejecutada
+            - motivo (str): Motivo de finalización de la corrida
+            - memoria_pico_kib (float | None): Pico de tracemalloc de la corrida
     Side effects:
         - Crea dos archivos de texto con los resultados
         - Imprime información de progreso y estadísticas en consola
@@ -549,77 +880,290 @@ def ejecutar_experimento_completo(instancia, parametros, archivo_resumen="resume
     
     cantcorr = parametros['cantcorr']
     
-    print(f"\n  Ejecutando experimento Evosocial con DEAP")
-    print(f"{'='*60}")
-    print(f"Instancia: {instancia['nombre']}")
-    print(f"Corridas: {cantcorr}")
-    print(f"{'='*60}\n")
+    log(INFO, f"\n  Ejecutando experimento Evosocial con DEAP")
+    log(INFO, f"{'='*60}")
+    log(INFO, f"Instancia: {instancia['nombre']}")
+    log(INFO, f"Corridas: {cantcorr}")
+    log(INFO, f"{'='*60}\n")
     
     toolbox = configurar_deap(instancia)
     resultados_corridas = []
+    cronometro = CronometroFases(ruta_companera(archivo_detalle, 'tiempos_fase')) if tiempos_fase else None
+    monitor = None
+    if memoria:
+        monitor = MonitorMemoria(ruta_companera(archivo_detalle, 'memoria'),
+                                 ruta_companera(archivo_detalle, 'memoria_sitios'), top=memoria_top)
+    escritor = None
+    if eventos:
+        escritor = EscritorEventos(os.path.splitext(ruta_companera(archivo_detalle, 'eventos'))[0] + '.jsonl')
+    memetica = None
+    if parametros.get('memetica_cada') or parametros.get('memetica_al_mejorar'):
+        memetica = MemeticaReina(ruta_companera(archivo_detalle, 'memetica'), cada=parametros['memetica_cada'],
+                                 al_mejorar=parametros['memetica_al_mejorar'],
+                                 evals_aplicacion=parametros['memetica_evals'],
+                                 max_evals_corrida=parametros['memetica_max_evals'])
+    duplicados = None
+    if parametros.get('duplicados'):
+        duplicados = FiltroDuplicados(ruta_companera(archivo_detalle, 'duplicados'), alcance=parametros['duplicados'])
+    control = None
+    if parametros.get('control'):
+        control = ControlOperadores(ruta_companera(archivo_detalle, 'operadores'), parametros['pcross'],
+                                    metodo=parametros['control'], alfa=parametros['control_alfa'],
+                                    beta=parametros['control_beta'], p_min=parametros['control_p_min'])
     
-    # Archivo detalle
-    with open(archivo_detalle, 'w') as f_detalle:
-        for corrida in range(cantcorr):
-            print(f"Corrida {corrida + 1}/{cantcorr}...", end='\r')
-            
-            resultado = algoritmo_evosocial_deap(instancia, parametros, toolbox)
-            
-            resultados_corridas.append({
-                'indcorr': corrida,
-                'ebest': resultado['error_mejor'],
-                'epop': resultado['error_promedio'],
-                'mingl': resultado['mejor_global'],
-                'genmax': resultado['gen_mejor']
-            })
-            
-            # Escribir detalle de TODAS las corridas
-            for punto in resultado['historial_convergencia']:
-                f_detalle.write(f"{punto['gen']:4d} {punto['mingl']:8.2f} {punto['evals']}\n")
+    # Archivo detalle (texto) o registro binario de convergencia
+    convergencia = None
+    f_detalle = None
+    if detalle_binario:
+        convergencia = EscritorConvergencia(os.path.splitext(archivo_detalle)[0] + EXTENSION_CONVERGENCIA,
+                                            capacidad=parametros['maxgen'])
+    else:
+        f_detalle = open(archivo_detalle, 'w')
+        if detalle_cambios:
+            f_detalle.write(MARCA_CAMBIOS + "\n")
     
-    print(f"\n  {cantcorr} corridas completadas")
+    for corrida in range(cantcorr):
+        log(INFO, f"Corrida {corrida + 1}/{cantcorr}...")
+        t_corrida = time.perf_counter()
+        
+        if perfil_base is not None:
+            resultado = perfilar(
+                lambda: algoritmo_evosocial_deap(instancia, parametros, toolbox, cronometro=cronometro,
+                                                 corrida=corrida, memoria=monitor, eventos=escritor,
+                                                 metricas=metricas, convergencia=convergencia,
+                                                 memetica=memetica, duplicados=duplicados, control=control),
+                f"{perfil_base}_corrida{corrida}", lineas=perfil_lineas)
+        else:
+            resultado = algoritmo_evosocial_deap(instancia, parametros, toolbox, cronometro=cronometro,
+                                                 corrida=corrida, memoria=monitor, eventos=escritor,
+                                                 metricas=metricas, convergencia=convergencia,
+                                                 memetica=memetica, duplicados=duplicados, control=control)
+        
+        resultados_corridas.append({
+            'indcorr': corrida,
+            'ebest': resultado['error_mejor'],
+            'epop': resultado['error_promedio'],
+            'mingl': resultado['mejor_global'],
+            'genmax': resultado['gen_mejor'],
+            'genfin': resultado['gen_final'],
+            'motivo': resultado['motivo_fin'],
+            'memoria_pico_kib': resultado['memoria_pico_kib']
+        })
+        
+        if almacen is not None:
+            historial = resultado['historial_convergencia']
+            almacen.registrar_convergencia(corrida, ((p['gen'], p['mingl'], p['evals']) for p in historial))
+            almacen.registrar_corrida(corrida, resultado['error_mejor'], resultado['error_promedio'],
+                                      resultado['mejor_global'], resultado['gen_mejor'], resultado['gen_final'],
+                                      resultado['motivo_fin'], historial[-1]['evals'] if historial else 1,
+                                      time.perf_counter() - t_corrida)
+        
+        # Escribir detalle de TODAS las corridas
+        if f_detalle is not None:
+            historial = resultado['historial_convergencia']
+            if detalle_cambios:
+                # Primera generación, mejoras, pasos meméticos y última generación
+                historial = [punto for k, punto in enumerate(historial)
+                             if k == 0 or k == len(historial) - 1 or punto['mingl'] != historial[k - 1]['mingl']
+                             or punto['memetica']]
+            for punto in historial:
+                f_detalle.write(f"{punto['gen']:4d} {punto['mingl']:8.2f} {punto['evals']} {corrida}\n")
+    
+    if f_detalle is not None:
+        f_detalle.close()
+    if convergencia is not None:
+        convergencia.cerrar()
+    if cronometro is not None:
+        cronometro.cerrar()
+    if monitor is not None:
+        monitor.cerrar()
+    if escritor is not None:
+        escritor.cerrar()
+    if memetica is not None:
+        memetica.cerrar()
+    if duplicados is not None:
+        duplicados.cerrar()
+    if control is not None:
+        control.cerrar()
+    
+    log(INFO, f"\n  {cantcorr} corridas completadas")
     
     # Escribir resumen
     with open(archivo_resumen, 'w') as f:
         for resultado in resultados_corridas:
             f.write(f"{resultado['indcorr']:2d} {resultado['ebest']:5.2f} {resultado['epop']:5.2f} "
-                   f"{resultado['mingl']:7.2f} {resultado['genmax']:4d}\n")
+                   f"{resultado['mingl']:7.2f} {resultado['genmax']:4d} "
+                   f"{resultado['genfin']:4d} {resultado['motivo']}\n")
     
     # Estadísticas
     mingls = [r['mingl'] for r in resultados_corridas]
     ebests = [r['ebest'] for r in resultados_corridas]
     
-    print(f"\n  Estadísticas globales:")
-    print(f"{'='*40}")
-    print(f"Mejor makespan: {min(mingls):.2f}")
-    print(f"Makespan promedio: {np.mean(mingls):.2f} ± {np.std(mingls):.2f}")
-    print(f"Makespan mediana: {np.median(mingls):.2f}")
-    print(f"Error mejor: {min(ebests):.2f}%")
-    print(f"Error promedio: {np.mean(ebests):.2f}%")
-    print(f"\n  Archivos generados:")
-    print(f"  - {archivo_resumen}")
-    print(f"  - {archivo_detalle}")
-    print(f"{'='*40}\n")
+    log(INFO, f"\n  Estadísticas globales:")
+    log(INFO, f"{'='*40}")
+    log(INFO, f"Mejor makespan: {min(mingls):.2f}")
+    log(INFO, f"Makespan promedio: {np.mean(mingls):.2f} ± {np.std(mingls):.2f}")
+    log(INFO, f"Makespan mediana: {np.median(mingls):.2f}")
+    log(INFO, f"Error mejor: {min(ebests):.2f}%")
+    log(INFO, f"Error promedio: {np.mean(ebests):.2f}%")
+    log(INFO, f"\n  Archivos generados:")
+    log(INFO, f"  - {archivo_resumen}")
+    log(INFO, f"  - {convergencia.ruta if convergencia is not None else archivo_detalle}")
+    if cronometro is not None:
+        log(INFO, f"  - {cronometro.ruta}")
+    if monitor is not None:
+        log(INFO, f"  - {monitor.ruta}")
+        if monitor.archivo_sitios is not None:
+            log(INFO, f"  - {monitor.ruta_sitios}")
+    if escritor is not None:
+        log(INFO, f"  - {escritor.ruta}")
+    if memetica is not None:
+        log(INFO, f"  - {memetica.ruta}")
+    if duplicados is not None:
+        log(INFO, f"  - {duplicados.ruta}")
+    if control is not None:
+        log(INFO, f"  - {control.ruta}")
+    log(INFO, f"{'='*40}\n")
     
     return resultados_corridas
 
 
+def parsear_argumentos(argv=None):
+    """
+    Define y parsea los argumentos de línea de comandos del experimento.
+    Args:
+        argv (list, optional): Argumentos a parsear. Por defecto sys.argv[1:].
+    Returns:
+        argparse.Namespace: Argumentos parseados.
+    """
+
+    parser = argparse.ArgumentParser(description="Algoritmo Evosocial - Implementación mediante librería DEAP")
+    parser.add_argument('--instancia', default='converted_swv08.txt',
+                        help="Archivo de instancia dentro de ../instancias (o ruta a un archivo existente)")
+    parser.add_argument('--datos', default='DATOS.DAT', help="Archivo de parámetros")
+    parser.add_argument('--sqlite', metavar='RUTA', default=None,
+                        help="Guardar además corridas, convergencia y tiempos en una base SQLite")
+    parser.add_argument('--generar', metavar='JOBSxMAQUINAS[:SEMILLA]', type=parsear_especificacion, default=None,
+                        help="Generar una instancia de Taillard en ../instancias/generadas y usarla "
+                             "en lugar de --instancia")
+    parser.add_argument('--semilla-reina', choices=['aleatoria', 'neh'], default='aleatoria',
+                        help="Inicialización de la reina: secuencia aleatoria o heurística NEH "
+                             "(sus evaluaciones se suman a evals)")
+    parser.add_argument('--duplicados', choices=['generacion', 'corrida'], default=None,
+                        help="No reevaluar cromosomas ya evaluados en la misma generación o corrida "
+                             "(tasa de duplicados por generación en duplicados_*.txt)")
+    adaptativo = parser.add_argument_group('control adaptativo de operadores')
+    adaptativo.add_argument('--control', choices=METODOS_CONTROL, default=None,
+                            help="Elegir entre cruce, mutación shift y mutación swap según su tasa de mejora "
+                                 "reciente (adaptive pursuit o probability matching) en lugar de pcross fijo; "
+                                 "trayectorias en operadores_*.txt")
+    adaptativo.add_argument('--control-alfa', type=float, default=0.3,
+                            help="Tasa de adaptación de la calidad de cada operador (defecto: 0.3)")
+    adaptativo.add_argument('--control-beta', type=float, default=0.3,
+                            help="Tasa de persecución de adaptive pursuit (defecto: 0.3)")
+    adaptativo.add_argument('--control-p-min', type=float, default=0.05,
+                            help="Probabilidad mínima de cada operador (defecto: 0.05)")
+    local = parser.add_argument_group('búsqueda local sobre la reina (memética)')
+    local.add_argument('--memetica-cada', type=int, default=0, metavar='K',
+                       help="Aplicar la búsqueda local a la reina cada K generaciones (0 = no periódica)")
+    local.add_argument('--memetica-al-mejorar', action='store_true',
+                       help="Aplicar la búsqueda local en cada generación en que mejora la reina")
+    local.add_argument('--memetica-evals', type=int, default=1000,
+                       help="Presupuesto de evaluaciones por aplicación (defecto: 1000)")
+    local.add_argument('--memetica-max-evals', type=int, default=None,
+                       help="Presupuesto total de evaluaciones de búsqueda local por corrida")
+    parada = parser.add_argument_group('criterios de parada')
+    parada.add_argument('--max-tiempo', type=float, default=None,
+                        help="Presupuesto de tiempo por corrida (segundos)")
+    parada.add_argument('--max-evals', type=int, default=None,
+                        help="Presupuesto de evaluaciones por corrida")
+    parada.add_argument('--max-estancamiento', type=int, default=None,
+                        help="Generaciones sin mejora del mejor global antes de detener la corrida")
+    parada.add_argument('--objetivo', type=float, default=None,
+                        help="Makespan objetivo: detener la corrida al alcanzarlo")
+    parada.add_argument('--parar-en-lowerb', action='store_true',
+                        help="Detener la corrida al alcanzar la cota inferior de la instancia")
+    instrumentacion = parser.add_argument_group('instrumentación')
+    instrumentacion.add_argument('--tiempos-fase', action='store_true',
+                                 help="Registrar el tiempo por fase de cada generación en tiempos_fase_*.txt")
+    instrumentacion.add_argument('--profile', action='store_true',
+                                 help="Perfilar cada corrida con cProfile (perfil_*.pstats y perfil_*_resumen.txt)")
+    instrumentacion.add_argument('--profile-gens', type=int, default=10,
+                                 help="Generaciones por corrida en modo --profile (defecto: 10)")
+    instrumentacion.add_argument('--profile-corridas', type=int, default=1,
+                                 help="Corridas en modo --profile (defecto: 1)")
+    instrumentacion.add_argument('--profile-lineas', action='store_true',
+                                 help="Con --profile, contar además líneas ejecutadas (Python 3.12+, sys.monitoring)")
+    instrumentacion.add_argument('--memoria', action='store_true',
+                                 help="Registrar memoria por generación (tracemalloc y RSS pico) en memoria_*.txt")
+    instrumentacion.add_argument('--memoria-top', type=int, default=5,
+                                 help="Sitios de asignación top por generación en memoria_sitios_*.txt (0 = ninguno)")
+    instrumentacion.add_argument('--eventos', action='store_true',
+                                 help="Escribir eventos de cada corrida (inicio, nuevo mejor, generación, fin) "
+                                      "en eventos_*.jsonl")
+    instrumentacion.add_argument('--metricas-puerto', type=int, default=None, metavar='PUERTO',
+                                 help="Exponer métricas Prometheus en http://127.0.0.1:PUERTO/metrics "
+                                      "(0 = puerto libre)")
+    instrumentacion.add_argument('--metricas-host', default='127.0.0.1',
+                                 help="Dirección de escucha del endpoint de métricas (defecto: 127.0.0.1)")
+    formato_detalle = parser.add_mutually_exclusive_group()
+    formato_detalle.add_argument('--detalle-binario', action='store_true',
+                                 help="Guardar la convergencia en formato binario columnar (detalle_*.evc) "
+                                      "en lugar de detalle_*.txt")
+    formato_detalle.add_argument('--detalle-cambios', action='store_true',
+                                 help="Escribir en detalle_*.txt solo la primera generación, las mejoras "
+                                      "de mingl y la última generación de cada corrida")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help="Aumentar la verbosidad: -v corridas, -vv generaciones, -vvv depuración "
+                             "(por defecto solo errores)")
+    return parser.parse_args(argv)
+
+
 # Función main que orquesta la ejecución del experimento
-def main():
+def main(argv=None):
     
+    args = parsear_argumentos(argv)
+    configurar_verbosidad(args.verbose)
+    if args.generar:
+        jobs, maquinas, semilla = args.generar
+        args.instancia = generar_instancia(jobs, maquinas, semilla)['custom']
+        log(INFO, f"- Instancia generada: {args.instancia}")
     start_time = time.time()
-    print("[] Algoritmo Evosocial - Implementación mediante librería DEAP")
-    print("="*60)
+    log(INFO, "[] Algoritmo Evosocial - Implementación mediante librería DEAP")
+    log(INFO, "="*60)
     
     # Leer parámetros
-    parametros = leer_parametros("DATOS.DAT")
+    parametros = leer_parametros(args.datos)
+    parametros.update({
+        'max_tiempo': args.max_tiempo,
+        'max_evals': args.max_evals,
+        'max_estancamiento': args.max_estancamiento,
+        'objetivo': args.objetivo,
+        'parar_en_lowerb': args.parar_en_lowerb,
+        'semilla_reina': args.semilla_reina,
+        'memetica_cada': args.memetica_cada,
+        'memetica_al_mejorar': args.memetica_al_mejorar,
+        'memetica_evals': args.memetica_evals,
+        'memetica_max_evals': args.memetica_max_evals,
+        'duplicados': args.duplicados,
+        'control': args.control,
+        'control_alfa': args.control_alfa,
+        'control_beta': args.control_beta,
+        'control_p_min': args.control_p_min
+    })
+    if args.profile:
+        parametros['maxgen'] = args.profile_gens
+        parametros['cantcorr'] = args.profile_corridas
+        log(INFO, f"- Modo perfilado: {args.profile_corridas} corrida(s) de {args.profile_gens} generaciones")
     
     # Leer instancia
     dir_instancias = 'instancias'
     #file_instancia = 'converted_swv06.txt'
     #file_instancia = 'converted_swv07.txt'
-    file_instancia = 'converted_swv08.txt'
+    file_instancia = args.instancia
     archivo_instancia = f'../{dir_instancias}/{file_instancia}'
+    if os.path.exists(file_instancia):
+        archivo_instancia = file_instancia
     
     try:
         instancia = leer_instancia_jsp(archivo_instancia)
@@ -632,14 +1176,39 @@ def main():
     archivo_resumen = f"resumen_{nombre_instancia}.txt"
     archivo_detalle = f"detalle_{nombre_instancia}.txt"
     
+    metricas = None
+    if args.metricas_puerto is not None:
+        metricas = ServidorMetricas(args.metricas_puerto, args.metricas_host, motor='deap',
+                                    instancia=nombre_instancia)
+        log(INFO, f"- Métricas en {metricas.url}")
+    
+    almacen = None
+    if args.sqlite:
+        almacen = AlmacenResultados(args.sqlite)
+        almacen.iniciar_experimento('deap', nombre_instancia, parametros,
+                                    lowerb=instancia['lower_bound'], upperb=instancia['upper_bound'])
+        log(INFO, f"- Base de resultados: {almacen.ruta} (experimento {almacen.experimento})")
+    
     resultados = ejecutar_experimento_completo(
         instancia, 
         parametros,
         archivo_resumen=archivo_resumen,
-        archivo_detalle=archivo_detalle
+        archivo_detalle=archivo_detalle,
+        tiempos_fase=args.tiempos_fase,
+        perfil_base=f"perfil_deap_{nombre_instancia}" if args.profile else None,
+        perfil_lineas=args.profile_lineas,
+        memoria=args.memoria,
+        memoria_top=args.memoria_top,
+        eventos=args.eventos,
+        metricas=metricas,
+        detalle_binario=args.detalle_binario,
+        detalle_cambios=args.detalle_cambios,
+        almacen=almacen
     )
+    if metricas is not None:
+        metricas.cerrar()
     
-    print("+ Experimento completado exitosamente")
+    log(INFO, "+ Experimento completado exitosamente")
     
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -647,10 +1216,20 @@ def main():
     # Guardo el tiempo en un archivo especificando instancia y tiempo
     #archivo_tiempo = "tiempo_deap_"+ nombre_instancia + ".txt"
     archivo_tiempo = "tiempo_ejecucion_deap_"+ nombre_instancia + ".txt"
-    print(archivo_tiempo)
+    log(INFO, archivo_tiempo)
     with open(archivo_tiempo, "w", encoding="utf-8") as f:
         f.write(f"Instancia: {nombre_instancia}\n")
         f.write(f"Tiempo de ejecución: {elapsed_time:.2f} segundos\n")
+        if args.memoria:
+            f.writelines(lineas_memoria([r['memoria_pico_kib'] for r in resultados]))
+    if almacen is not None:
+        memoria_pico_mib = rss_mib = None
+        if args.memoria:
+            memoria_pico_mib = max(r['memoria_pico_kib'] for r in resultados) / 1024
+            rss = rss_pico_kib()
+            rss_mib = rss / 1024 if rss is not None else None
+        almacen.registrar_tiempo(elapsed_time, memoria_pico_mib, rss_mib)
+        almacen.cerrar()
 
 if __name__ == "__main__":
     main()
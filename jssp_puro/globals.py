@@ -13,24 +13,26 @@ MAX_MAQ = 15 #5
 
 # Tipos de datos
 # alelo = byte (posición de bit)
-Alelo = np.uint8  # Tipo para valores 0-255
+Alelo = np.uint8  # Tipo para valores 0-255 (uint16 si MAX_CROM > 255)
 
 # cromosoma = array[1..maxcrom] of alelo
 def crear_cromosoma() -> np.ndarray:
-    """Crea un cromosoma como array de numpy de tipo uint8"""
-    return np.zeros(MAX_CROM, dtype=np.uint8)
+    """Crea un cromosoma como array de numpy de tipo Alelo"""
+    return np.zeros(MAX_CROM, dtype=Alelo)
 
 @dataclass 
 class Individuo:
     """Estructura equivalente al RECORD individuo de Pascal"""
-    cromosoma: np.ndarray  # array de MAX_CROM elementos tipo uint8
+    cromosoma: np.ndarray  # array de MAX_CROM elementos tipo Alelo
     objective: float
     fitness: float
+    valido: bool  # objective y fitness corresponden al cromosoma actual
     
     def __init__(self):
         self.cromosoma = crear_cromosoma()
         self.objective = 0.0
         self.fitness = 0.0
+        self.valido = False
 
 # tipoconj = set of 1..maxcrom
 TipoConj = Set[int]  # Set de enteros (rango 1 a MAX_CROM)
@@ -110,6 +112,32 @@ upperb: int = 0  # longint en Pascal = int en Python
 lowerb: int = 0
 evals: int = 0
 
+# Criterios de parada adicionales (None/False = deshabilitado)
+max_tiempo: float = None  # Presupuesto de tiempo por corrida (segundos)
+max_evals: int = None  # Presupuesto de evaluaciones por corrida
+max_estancamiento: int = None  # Generaciones sin mejora admitidas
+objetivo: float = None  # Makespan objetivo
+parar_en_lowerb: bool = False  # Detener al alcanzar lowerb
+genfin: int = 0  # Última generación ejecutada
+motivo_fin: str = 'maxgen'  # Motivo de finalización de la corrida
+
+# Inicialización de la reina ('aleatoria' o 'neh') y búsqueda local sobre ella
+semilla_reina: str = 'aleatoria'
+memetica = None  # MemeticaReina: búsqueda local acotada sobre la reina (None = deshabilitada)
+
+# Evaluación
+duplicados = None  # FiltroDuplicados: makespan de los cromosomas ya evaluados (None = deshabilitado)
+control = None  # ControlOperadores: probabilidades adaptativas de cruce/shift/swap (None = pcross fijo)
+
+# Instrumentación opcional (None = deshabilitada)
+cronometro = None  # CronometroFases: tiempo por fase de cada generación
+memoria = None  # MonitorMemoria: tracemalloc y RSS pico por generación
+eventos = None  # EscritorEventos: flujo JSONL de eventos de cada corrida
+metricas = None  # ServidorMetricas: endpoint Prometheus local
+convergencia = None  # EscritorConvergencia: detalle binario columnar en lugar de Det
+detalle_cambios: bool = False  # Det solo registra la primera generación, las mejoras y la última
+almacen = None  # AlmacenResultados: base SQLite de corridas, convergencia y tiempos
+
 # Instancias de tipos complejos
 child: Hijos = Hijos()
 Cmj: TipoMaqJob = TipoMaqJob()
@@ -2,22 +2,42 @@ import os
 import time
 import random
 import sys
+import argparse
 import numpy as np
-from typing import Set, Dict, Any, Tuple
-
+from typing import Set, Dict, Any, Tuple, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# Los módulos de instrumentación, métricas, eventos, convergencia binaria, SQLite
+# y perfilado se importan en main() solo si se pide la opción correspondiente
+from utils.generador import generar_instancia, parsear_especificacion
+from utils.registro import log, configurar_verbosidad, INFO, GENERACION, DEBUG
+from utils.heuristicas import neh, MemeticaReina
+from utils.duplicados import FiltroDuplicados
+from utils.adaptacion import ControlOperadores, METODOS as METODOS_CONTROL
+
+import globals as definiciones
 from globals import (
     # Constantes del sistema
-    MAX_MAQ, MAX_CROM,
+    MAX_MAQ, MAX_CROM, Alelo,
     
     # Tipos de datos y estructuras
     Individuo, Hijos, TipoMaqJob,
     
     # Variables de configuración del algoritmo
-    popsize, pcross, pmutacion, maxgen, cantcorr,
+    popsize, pcross, pmutacion, maxgen,
     
     # Variables de estado y control
     gen, evals, indchild, mingl,
     
+    # Criterios de parada
+    max_tiempo, max_evals, max_estancamiento, objetivo, parar_en_lowerb,
+    
+    # Inicialización y búsqueda local de la reina
+    semilla_reina, memetica,
+    
+    # Evaluación y control de operadores
+    duplicados, control,
+    
     # Variables de estadísticas y resultados
     queen, mej, child, maximo, min_val, avg,
     
@@ -25,7 +45,10 @@ from globals import (
     upperb, lowerb, Cmj,
     
     # Archivos de entrada y salida
-    Ins, Det, Resum
+    Ins, Det, Resum,
+    
+    # Instrumentación
+    cronometro, memoria, eventos, metricas, convergencia, detalle_cambios, almacen
 )
 
 
@@ -237,8 +260,8 @@ def crossox(p1: np.ndarray, p2: np.ndarray) -> None:
     Implementa el algoritmo crossox de Pascal.
 
     Args:
-        p1: Primer cromosoma padre (np.ndarray de uint8)
-        p2: Segundo cromosoma padre (np.ndarray de uint8)
+        p1: Primer cromosoma padre (np.ndarray de Alelo)
+        p2: Segundo cromosoma padre (np.ndarray de Alelo)
     """
     global child, indchild, pmutacion # Acceder a las variables globales
 
@@ -251,7 +274,7 @@ def crossox(p1: np.ndarray, p2: np.ndarray) -> None:
         # Por lo tanto, se debe declarar como 'global' si se va a modificar.
         global indchild 
 
-        h = np.zeros(max_crom_len, dtype=np.uint8) # h: cromosoma
+        h = np.zeros(max_crom_len, dtype=Alelo) # h: cromosoma
         conj: Set[int] = set() # conj: tipoconj
 
         # Copiar segmento central de v a h y añadir al conjunto
@@ -259,7 +282,7 @@ def crossox(p1: np.ndarray, p2: np.ndarray) -> None:
             h[i] = v[i]
             conj.add(int(h[i])) # Asegurar que se añaden enteros al set
 
-        aux = np.zeros(max_crom_len, dtype=np.uint8) # aux: cromosoma
+        aux = np.zeros(max_crom_len, dtype=Alelo) # aux: cromosoma
         j_aux = 0 # índice para el array auxiliar
 
         # Armar auxiliar con genes del extremo del segundo corte del padre w
@@ -313,6 +336,30 @@ def crossox(p1: np.ndarray, p2: np.ndarray) -> None:
     gen_hijo(MAX_CROM, ptocorte1, ptocorte2, p2, p1)
 
 
+def configurar_dimensiones(maquinas: int, jobs: int) -> None:
+    """
+    Redimensiona el sistema para instancias de `maquinas` x `jobs`.
+    En Pascal maxmaq y maxcrom son constantes de compilación; aquí se ajustan en
+    tiempo de ejecución tanto en globals como en este módulo, y se recrean las
+    estructuras que dependen de ellas (Cmj, child, queen, mej). Con más de 255
+    jobs el cromosoma pasa de uint8 a uint16.
+    
+    Args:
+        maquinas: Cantidad de máquinas (MAX_MAQ)
+        jobs: Cantidad de jobs (MAX_CROM)
+    """
+    global MAX_MAQ, MAX_CROM, Alelo, Cmj, child, queen, mej
+    
+    definiciones.MAX_MAQ = maquinas
+    definiciones.MAX_CROM = jobs
+    definiciones.Alelo = np.uint8 if jobs <= 255 else np.uint16
+    MAX_MAQ, MAX_CROM, Alelo = maquinas, jobs, definiciones.Alelo
+    
+    Cmj = definiciones.Cmj = TipoMaqJob()
+    child = definiciones.child = Hijos()
+    queen = definiciones.queen = Individuo()
+    mej = definiciones.mej = Individuo()
+
 def cargar_configuracion(archivo_datos: str = 'DATOS.DAT') -> Dict[str, Any]:
     """
     Carga la configuración desde archivo de datos.
@@ -362,35 +409,41 @@ def setup(archivo_datos: str = 'DATOS.DAT'):
     maxgen = config['maxgen']
     popsize = config['popsize']
     
-    print("Configuración cargada!!!:")
-    print(f"  Corridas: {cantcorr}")
-    print(f"  P. Mutación: {pmutacion}")
-    print(f"  P. Cruzamiento: {pcross}")
-    print(f"  Max. Generaciones: {maxgen}")
-    print(f"  Tamaño Población: {popsize}")
+    log(INFO, "Configuración cargada!!!:")
+    log(INFO, f"  Corridas: {cantcorr}")
+    log(INFO, f"  P. Mutación: {pmutacion}")
+    log(INFO, f"  P. Cruzamiento: {pcross}")
+    log(INFO, f"  Max. Generaciones: {maxgen}")
+    log(INFO, f"  Tamaño Población: {popsize}")
 
 def inicializar_archivos(
-    archivo_detalle: str = 'detalle.txt',
+    archivo_detalle: Optional[str] = 'detalle.txt',
     archivo_resumen: str = 'resumen.txt',
+    modo_cambios: bool = False
     #archivo_instancia: str = '100X5-10.txt'
 ):
     """
     Inicializa los archivos de salida.
     
     Args:
-        archivo_detalle: Archivo para escribir detalles
+        archivo_detalle: Archivo para escribir detalles (None = sin detalle de texto,
+            por ejemplo cuando se usa el registro binario de convergencia)
         archivo_resumen: Archivo para escribir resumen
+        modo_cambios: Si es True, el detalle empieza con la marca del modo por cambios
         archivo_instancia: Archivo con datos de instancia
     """
     global Det, Resum, Ins
 
-    Det = open(archivo_detalle, 'w', encoding='utf-8')
+    Det = open(archivo_detalle, 'w', encoding='utf-8') if archivo_detalle is not None else None
+    if Det is not None and modo_cambios:
+        from utils.convergencia import MARCA_CAMBIOS
+        Det.write(MARCA_CAMBIOS + "\n")
     Resum = open(archivo_resumen, 'w', encoding='utf-8')
     #Ins = open(archivo_instancia, 'r', encoding='utf-8')
 
-    print("Archivos inicializados:")
-    print(f"  Detalle: {archivo_detalle}")
-    print(f"  Resumen: {archivo_resumen}")
+    log(INFO, "Archivos inicializados:")
+    log(INFO, f"  Detalle: {archivo_detalle}")
+    log(INFO, f"  Resumen: {archivo_resumen}")
     #print(f"  Instancia: {archivo_instancia}")
 
 def inicializar_sistema(archivo_datos: str = 'DATOS.DAT'):
@@ -417,7 +470,7 @@ def cerrar_archivos():
         try:
             if archivo and hasattr(archivo, 'close') and not archivo.closed:
                 archivo.close()
-                print(f"Archivo {nombre} cerrado")
+                log(DEBUG, f"Archivo {nombre} cerrado")
         except Exception as e:
             print(f"Error al cerrar {nombre}: {e}")
 
@@ -428,35 +481,42 @@ def leer_instancia():
     Formato esperado:
     - Línea 1: upperb
     - Línea 2: lowerb  
-    - Líneas 3-7: 100 valores cada una (5 máquinas x 100 trabajos) Depende de la instancia.
+    - Líneas siguientes: una línea por máquina con los tiempos de cada trabajo.
+    
+    Las dimensiones se toman del archivo (cantidad de líneas y de valores por
+    línea); si difieren de MAX_MAQ x MAX_CROM se redimensiona el sistema con
+    configurar_dimensiones.
     """
     global upperb, lowerb, Ins, Cmj
     
     try:
         # Leer upperb (primera línea)
         upperb = int(Ins.readline().strip())
-        print(f"upperb leído: {upperb}")
+        log(INFO, f"upperb leído: {upperb}")
         
         # Leer lowerb (segunda línea)  
         lowerb = int(Ins.readline().strip())
-        print(f"lowerb leído: {lowerb}")
+        log(INFO, f"lowerb leído: {lowerb}")
         
         # Leer matriz de máquinas-trabajos
-        for i in range(1, MAX_MAQ + 1):  # máquinas 1 a 15
-            linea = Ins.readline().strip()
-            if not linea:
-                raise ValueError(f"Archivo termina inesperadamente en máquina {i}")
-                
-            valores = [int(x) for x in linea.split()]
+        filas = [[int(x) for x in linea.split()] for linea in Ins if linea.strip()]
+        if not filas:
+            raise ValueError("El archivo no contiene tiempos de máquinas")
+        
+        for i, valores in enumerate(filas, start=1):
+            if len(valores) != len(filas[0]):
+                raise ValueError(f"Máquina {i}: se esperaban {len(filas[0])} valores, se encontraron {len(valores)}")
+        
+        if (len(filas), len(filas[0])) != (MAX_MAQ, MAX_CROM):
+            configurar_dimensiones(len(filas), len(filas[0]))
             
-            if len(valores) != MAX_CROM:
-                raise ValueError(f"Máquina {i}: se esperaban {MAX_CROM} valores, se encontraron {len(valores)}")
-                
+        for i in range(1, MAX_MAQ + 1):
+            valores = filas[i-1]
             # Llenar la fila i de la matriz
-            for j in range(1, MAX_CROM + 1):  # trabajos 1 a 20
+            for j in range(1, MAX_CROM + 1):
                 Cmj[i, j] = valores[j-1]  # valores está en base 0
                 
-        print(f"Matriz {MAX_MAQ}x{MAX_CROM} cargada correctamente")
+        log(INFO, f"Matriz {MAX_MAQ}x{MAX_CROM} cargada correctamente")
         #print(Cmj.array)
 
     except ValueError as e:
@@ -513,6 +573,32 @@ def gen_scheduler(vdec: np.ndarray, cmj: TipoMaqJob) -> tuple[float, float]:
     
     return objective, fitness
 
+def evaluar(ind: Individuo) -> None:
+    """
+    Calcula objective y fitness de un individuo con gen_scheduler, solo si no son
+    válidos (individuo nuevo o cromosoma modificado). Con el filtro de duplicados
+    activo, un cromosoma ya evaluado toma el makespan guardado en lugar de
+    decodificarse de nuevo. Solo las decodificaciones se suman a evals.
+    
+    Args:
+        ind: Individuo a evaluar (se modifica in-place)
+    """
+    global evals
+    
+    if ind.valido:
+        return
+    ind.valido = True
+    if duplicados is not None:
+        clave, objective = duplicados.buscar(ind.cromosoma)
+        if objective is not None:
+            ind.objective = objective
+            ind.fitness = 1.0 / objective if objective > 0 else float('inf')
+            return
+    ind.objective, ind.fitness = gen_scheduler(ind.cromosoma, Cmj)
+    evals += 1
+    if duplicados is not None:
+        duplicados.registrar(clave, ind.objective)
+
 def evalua(child: Hijos, ch: int) -> None:
     """
     Evalúa los primeros ch individuos del array de hijos.
@@ -522,16 +608,14 @@ def evalua(child: Hijos, ch: int) -> None:
         ch: Número de hijos a evaluar (máximo 2)
     """
     for i in range(1, min(ch + 1, 3)):  # Máximo 2 hijos
-        objective, fitness = gen_scheduler(child[i].cromosoma, Cmj)
-        child[i].objective = objective
-        child[i].fitness = fitness
+        evaluar(child[i])
 
 def ind_aleatorio() -> Individuo:
     """
     Genera un individuo aleatorio con cromosoma de permutación.
     
     Returns:
-        Individuo con cromosoma aleatorio, objective y fitness calculados
+        Individuo con cromosoma aleatorio, sin evaluar (valido=False; ver evaluar)
     """
     ri = Individuo()
     
@@ -557,11 +641,60 @@ def ind_aleatorio() -> Individuo:
         print()
         sys.exit(1)  # halt
     
-    # Evaluar cromosoma
-    ri.objective, ri.fitness = gen_scheduler(ri.cromosoma, Cmj)
+    if cronometro is not None:
+        cronometro.marcar('inmigrante')
     
+    # Sin evaluar: en el cruce el fitness del inmigrante no se usa
     return ri
 
+def ind_neh() -> Tuple[Individuo, int]:
+    """
+    Genera la reina con la heurística NEH sobre la matriz Cmj (ver utils/heuristicas.py).
+    El makespan de la secuencia sale de la propia construcción, sin decodificarla de nuevo.
+    
+    Returns:
+        Tupla (individuo, evaluaciones) donde evaluaciones son las posiciones de
+        inserción probadas por NEH
+    """
+    ri = Individuo()
+    orden, makespan, evaluaciones = neh(Cmj.array)
+    ri.cromosoma[:] = orden + 1  # Jobs en base 1
+    ri.objective = float(makespan)
+    ri.fitness = 1.0 / ri.objective if ri.objective > 0 else float('inf')
+    ri.valido = True
+    
+    if cronometro is not None:
+        cronometro.marcar('evaluacion')
+    
+    return ri, evaluaciones
+
+def memetica_reina() -> None:
+    """
+    Paso memético: búsqueda local acotada sobre la reina (ver utils/heuristicas.py).
+    Si la mejora, la reemplaza; si además mejora el mejor global, actualiza mingl y genmax.
+    Las evaluaciones de la búsqueda se suman a evals y memetica las cuenta aparte.
+    """
+    global queen, mingl, genmax, evals
+    
+    orden, makespan, evaluaciones = memetica.aplicar(Cmj.array, queen.cromosoma.astype(np.int64) - 1,
+                                                     int(queen.objective), gen)
+    evals += evaluaciones
+    if makespan < queen.objective:
+        queen = Individuo()
+        queen.cromosoma[:] = orden + 1  # Jobs en base 1
+        queen.objective = float(makespan)
+        queen.fitness = 1.0 / queen.objective
+        queen.valido = True
+        if queen.objective < mingl:
+            mingl = queen.objective
+            genmax = gen
+            log(GENERACION, f"  Búsqueda local: nuevo mejor global {mingl:.2f} en generación {genmax}")
+            if eventos is not None:
+                eventos.emitir('nuevo_mejor', corrida=indcorr, gen=gen, mingl=mingl, evals=evals)
+    
+    if cronometro is not None:
+        cronometro.marcar('evaluacion')
+
 def mostrar_individuo(individuo: Individuo, num_genes: int = 10) -> None:
     """
     Muestra información de un individuo.
@@ -638,7 +771,8 @@ def next_generacion() -> None:
     Algoritmo:
     1. Para cada individuo de la nueva población:
        - Genera un inmigrante aleatorio (ri)
-       - Decide si hacer crossover o mutación
+       - Decide si hacer crossover o mutación (con pcross, o con el control
+         adaptativo, que además elige la mutación shift o swap)
        - Si crossover: OX2 entre queen y ri, selecciona mejor hijo
        - Si mutación: aplica mutshift a queen y ri, selecciona mejor
        - Actualiza estadísticas con el mejor
@@ -651,8 +785,10 @@ def next_generacion() -> None:
     min_val = float(upperb * 10.5) # Asegurarse que es float
     sumobjective = 0.0
     j = 0  # Primer individuo de la población actual
+    if duplicados is not None:
+        duplicados.iniciar_generacion(queen.cromosoma, queen.objective)
     
-    print(f"Generando nueva generación (población: {popsize})...")
+    log(GENERACION, f"Generando nueva generación (población: {popsize})...")
     
     # Loop principal - generar popsize individuos
     while j < popsize:
@@ -660,12 +796,22 @@ def next_generacion() -> None:
         
         # Generar inmigrante aleatorio
         ri = ind_aleatorio()
+        referencia = queen.objective
         
-        # Realizar crossover OX2 con probabilidad pcross
-        if flip(pcross): # Usa la función flip integrada
+        # Realizar crossover OX2 con probabilidad pcross (o según el control adaptativo)
+        if control is not None:
+            operador = control.elegir()
+        else:
+            operador = 'cruce' if flip(pcross) else 'shift' # Usa la función flip integrada
+        mutar = mutacion if operador == 'swap' else mutshift
+        if operador == 'cruce':
             # Hacer crossover
             crossox(queen.cromosoma, ri.cromosoma)
+            if cronometro is not None:
+                cronometro.marcar('cruce')
             evalua(child, 2)
+            if cronometro is not None:
+                cronometro.marcar('evaluacion')
             
             # Elegir el mejor hijo
             if child[1].objective < child[2].objective:
@@ -678,15 +824,24 @@ def next_generacion() -> None:
         else:
             # No hacer crossover, aplicar mutación
             
-            # Mutar queen con probabilidad pmutacion
+            # Mutar queen con probabilidad pmutacion (sin mutar conserva su fitness)
             if flip(pmutacion): # Usa la función flip integrada
-                mutshift(queen.cromosoma)
-                queen.objective, queen.fitness = gen_scheduler(queen.cromosoma, Cmj)
+                mutar(queen.cromosoma)
+                queen.valido = False
+                if cronometro is not None:
+                    cronometro.marcar('mutacion')
+                evaluar(queen)
+                if cronometro is not None:
+                    cronometro.marcar('evaluacion')
             
-            # Mutar ri con probabilidad pmutacion
+            # Mutar ri con probabilidad pmutacion; ri se evalúa una sola vez, mutado o no
             if flip(pmutacion): # Usa la función flip integrada
-                mutshift(ri.cromosoma)
-                ri.objective, ri.fitness = gen_scheduler(ri.cromosoma, Cmj)
+                mutar(ri.cromosoma)
+                if cronometro is not None:
+                    cronometro.marcar('mutacion')
+            evaluar(ri)
+            if cronometro is not None:
+                cronometro.marcar('evaluacion')
             
             # Elegir el mejor entre ri y queen
             if ri.objective < queen.objective:
@@ -694,23 +849,30 @@ def next_generacion() -> None:
             else:
                 mej = queen
         
+        if control is not None:
+            control.recompensar(operador, mej.objective, referencia)
+        
         # Actualizar estadísticas
         stats(mej)
         sumobjective += mej.objective
         j += 1
+        if cronometro is not None:
+            cronometro.marcar('seleccion')
         
         # Mostrar progreso cada 10% de la población
         if popsize >= 10 and j % (popsize // 10) == 0:
             porcentaje = (j * 100) // popsize
-            print(f"  Progreso: {porcentaje}% ({j}/{popsize}) - Mejor actual: {min_val:.2f}")
+            log(DEBUG, f"  Progreso: {porcentaje}% ({j}/{popsize}) - Mejor actual: {min_val:.2f}")
+            if cronometro is not None:
+                cronometro.marcar('io')
     
     # Calcular fitness promedio poblacional
     avg = sumobjective / popsize
     
-    print("Generación completada:")
-    print(f"  Fitness promedio: {avg:.2f}")
-    print(f"  Mejor objective: {min_val:.2f}")
-    print(f"  Peor objective: {maximo:.2f}")
+    log(GENERACION, "Generación completada:")
+    log(GENERACION, f"  Fitness promedio: {avg:.2f}")
+    log(GENERACION, f"  Mejor objective: {min_val:.2f}")
+    log(GENERACION, f"  Peor objective: {maximo:.2f}")
 
 # Suponiendo que estas funciones imprimir_detalle y imprimir_resumen existen o serán creadas.
 # Si no las tienes, estas son versiones placeholder:
@@ -723,25 +885,53 @@ def imprimir_detalle(detalle_archivo: str) -> None:
 
     if Det and not Det.closed:
         # Aquí 'mingl' representa el mejor objetivo global hasta el momento,
-        # 'gen' es la generación actual, y 'evals' son las evaluaciones acumuladas.
-        Det.write(f"{gen:4d}  {mingl:6.2f} {evals:d}\n") # Imprime gen, mingl, evals donde gen es la generación actual, mingl es el mejor objetivo global, y evals son las evaluaciones acumuladas.
+        # 'gen' es la generación actual, 'evals' son las evaluaciones acumuladas
+        # e 'indcorr' identifica la corrida.
+        Det.write(f"{gen:4d}  {mingl:6.2f} {evals:d} {indcorr:d}\n") # Imprime gen, mingl, evals, indcorr
     else:
         print("ADVERTENCIA: Archivo Det no está abierto o es nulo. No se pudo escribir el detalle de la generación.")
 
 def imprimir_resumen(resumen_archivo: str) -> None:
     """
     Imprime una línea de resumen en el archivo de resumen (Resum) al final de una corrida.
-    Equivalente a PROCEDURE imprimir_resumen en Pascal.
+    Equivalente a PROCEDURE imprimir_resumen en Pascal, con dos columnas adicionales:
+    la última generación ejecutada (genfin) y el motivo de finalización.
     """
     global Resum, indcorr, ebest, epop, mingl, genmax # Asegurarse de acceder a las variables globales
 
     if Resum and not Resum.closed:
         # Imprime indcorr es la cantidad de corrida, ebest es el error del mejor individuo, 
         # epop es el error promedio de la población, mingl es el mejor objetivo global, genmax es la generación en que se encontró el mejor global.
-        Resum.write(f"{indcorr:2d} {ebest:5.2f} {epop:5.2f} {mingl:6.2f} {genmax:4d}\n") # Imprime indcorr, ebest, epop, mingl, genmax
+        Resum.write(f"{indcorr:2d} {ebest:5.2f} {epop:5.2f} {mingl:6.2f} {genmax:4d} {genfin:4d} {motivo_fin}\n") # Imprime indcorr, ebest, epop, mingl, genmax, genfin, motivo
     else:
         print("ADVERTENCIA: Archivo Resum no está abierto o es nulo. No se pudo escribir el resumen final.")
 
+def criterio_parada(t_inicio: float) -> Optional[str]:
+    """
+    Evalúa los criterios de parada adicionales al final de una generación.
+    Primero verifica los criterios de calidad (lowerb, makespan objetivo) y luego
+    los de presupuesto (evaluaciones, estancamiento, tiempo). Los criterios en
+    None/False están deshabilitados.
+
+    Args:
+        t_inicio: Instante de inicio de la corrida (time.perf_counter)
+
+    Returns:
+        Motivo de finalización ('lowerb', 'objetivo', 'evaluaciones',
+        'estancamiento', 'tiempo') o None si la corrida debe continuar
+    """
+    if parar_en_lowerb and mingl <= lowerb:
+        return 'lowerb'
+    if objetivo is not None and mingl <= objetivo:
+        return 'objetivo'
+    if max_evals is not None and evals >= max_evals:
+        return 'evaluaciones'
+    if max_estancamiento is not None and gen - genmax >= max_estancamiento:
+        return 'estancamiento'
+    if max_tiempo is not None and time.perf_counter() - t_inicio >= max_tiempo:
+        return 'tiempo'
+    return None
+
 def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
     """
     Implementa el algoritmo genético principal (EVOSO) como se especifica en Pascal.
@@ -751,6 +941,7 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
     # Necesitamos variables globales para mingl, genmax, ebest, epop.
     # Si no están en globals.py, las declaramos aquí y las inicializamos.
     global mingl, genmax, ebest, epop 
+    global genfin, motivo_fin
 
     # randomize; (En Python, random se inicializa automáticamente al importarse,
     #             o puedes usar random.seed() para un control explícito)
@@ -758,10 +949,25 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
 
     evals = 0
     gen = 0 # Reiniciar el contador de generación
+    genfin = 0
+    motivo_fin = 'maxgen'
+    t_inicio = time.perf_counter()
+    if memoria is not None:
+        memoria.iniciar_corrida()
+    if memetica is not None:
+        memetica.iniciar_corrida(indcorr)
+    if duplicados is not None:
+        duplicados.iniciar_corrida(indcorr)
+    if control is not None:
+        control.iniciar_corrida(indcorr)
 
     # indAleatorio(Queen); (En Pascal, Queen se pasaría como VAR y se modificaría.
     #                     Aquí, como Queen es global, simplemente la asignamos.)
-    queen = ind_aleatorio() # Llama a la función para generar un individuo aleatorio
+    if semilla_reina == 'neh':
+        queen, evals = ind_neh() # El costo de NEH se descuenta del presupuesto de evaluaciones
+    else:
+        queen = ind_aleatorio() # Llama a la función para generar un individuo aleatorio
+        evaluar(queen)          # La reina inicial cuenta como una evaluación
 
     mingl = queen.objective # mingl := queen.objective; (Mejor objetivo global)
 
@@ -773,9 +979,16 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
 
     genmax = 0 # Inicializa la generación en la que se encontró el mejor global.
 
-    print("\n=== Iniciando Proceso de Evolución (EVOSO) ===")
-    print(f"Mejor objetivo inicial (Queen): {queen.objective:.2f}")
-    print(f"Rango de makespan esperado: [{lowerb}, {upperb}]")
+    if convergencia is not None:
+        convergencia.iniciar_corrida(indcorr)
+    ultima_detalle = 0 # Última generación escrita en Det (modo por cambios)
+    if eventos is not None:
+        eventos.emitir('corrida_inicio', motor='puro', instancia=os.path.basename(Ins.name), corrida=indcorr,
+                       popsize=popsize, maxgen=maxgen)
+
+    log(INFO, "\n=== Iniciando Proceso de Evolución (EVOSO) ===")
+    log(INFO, f"Mejor objetivo inicial (Queen, {semilla_reina}): {queen.objective:.2f}")
+    log(INFO, f"Rango de makespan esperado: [{lowerb}, {upperb}]")
 
     # Evoluciona
     # gen := gen + 1; (El loop while incrementa gen al principio en Pascal,
@@ -783,7 +996,12 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
     gen = 1 # Empezamos con la generación 1
 
     while gen <= maxgen:
-        print(f"\n--- Ejecutando Generación {gen}/{maxgen} ---")
+        if cronometro is not None:
+            cronometro.iniciar_generacion()
+        evals_inicio_gen = evals
+        log(GENERACION, f"\n--- Ejecutando Generación {gen}/{maxgen} ---")
+        if cronometro is not None:
+            cronometro.marcar('io')
         next_generacion() # Esta función actualiza min_val, maximo, avg, y mej de la generación
 
         # IF min < mingl THEN (min_val es el min de la generación actual)
@@ -791,18 +1009,74 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
             mingl = min_val   # mingl := min;
             queen = mej       # Queen := mej; (Actualiza la 'reina' con el mejor individuo global)
             genmax = gen      # genmax := gen;
-            print(f"  Nuevo mejor global encontrado: {mingl:.2f} en generación {genmax}")
-
-        evals += popsize # evals := evals + popsize; (Cada individuo evaluado en next_generacion)
-
-        imprimir_detalle(detalle_archivo) # Llama a la función para imprimir detalles (si está implementada)
-        print(f"Generación {gen:4d} - Mejor Global: {mingl:6.2f} - Mejor de Gen: {min_val:6.2f} - Avg de Gen: {avg:6.2f}")
+            log(GENERACION, f"  Nuevo mejor global encontrado: {mingl:.2f} en generación {genmax}")
+            if eventos is not None:
+                eventos.emitir('nuevo_mejor', corrida=indcorr, gen=gen, mingl=mingl, evals=evals)
+
+        # evals ya suma las decodificaciones de la generación (ver evaluar); en Pascal
+        # era evals := evals + popsize aunque cada individuo costara hasta tres
+
+        # Paso memético sobre la reina (periódico y/o al mejorar)
+        memetica_gen = memetica is not None and memetica.corresponde(gen, genmax == gen)
+        if memetica_gen:
+            memetica_reina()
+
+        if cronometro is not None:
+            cronometro.marcar('seleccion')
+
+        if convergencia is not None:
+            convergencia.registrar(gen, mingl, evals, avg, time.perf_counter() - t_inicio)
+        elif not detalle_cambios or gen == 1 or genmax == gen or memetica_gen:
+            imprimir_detalle(detalle_archivo) # Llama a la función para imprimir detalles (si está implementada)
+            ultima_detalle = gen
+        if almacen is not None:
+            almacen.registrar_generacion(indcorr, gen, mingl, evals, avg)
+        if eventos is not None:
+            eventos.emitir('generacion', corrida=indcorr, gen=gen, mingl=mingl, avg=avg, evals=evals)
+        if metricas is not None:
+            metricas.actualizar(indcorr, gen, evals, mingl)
+        if duplicados is not None:
+            duplicados.cerrar_generacion(gen)
+            if metricas is not None:
+                metricas.actualizar_cache(indcorr, duplicados.duplicados_corrida, duplicados.consultas_corrida)
+        if control is not None:
+            probabilidades = control.cerrar_generacion(gen)
+            log(GENERACION, "  Operadores: " + ", ".join(f"{o} {p:.3f}" for o, p in probabilidades.items()))
+        log(GENERACION, f"Generación {gen:4d} - Mejor Global: {mingl:6.2f} - Mejor de Gen: {min_val:6.2f} - Avg de Gen: {avg:6.2f}")
+        if cronometro is not None:
+            cronometro.marcar('io')
+            cronometro.cerrar_generacion(indcorr, gen, evals - evals_inicio_gen)
+        if memoria is not None:
+            memoria.cerrar_generacion(indcorr, gen)
+        genfin = gen
+        
+        # Criterios de parada adicionales
+        motivo = criterio_parada(t_inicio)
+        if motivo is not None:
+            motivo_fin = motivo
+            break
         
         gen += 1 # gen := gen + 1;
 
-    print("\n=== Proceso EVOSO Finalizado ===")
-    print(f"Mejor Makespan global encontrado: {mingl:.2f} (en generación {genmax})")
-    print(f"Mejor individuo global: Objective={queen.objective:.2f}, Fitness={queen.fitness:.6f}")
+    if memoria is not None:
+        memoria.cerrar_corrida()
+    if convergencia is not None:
+        convergencia.cerrar_corrida()
+    elif detalle_cambios and ultima_detalle != genfin:
+        # En modo por cambios se registra siempre la última generación
+        gen = genfin
+        imprimir_detalle(detalle_archivo)
+
+    log(INFO, "\n=== Proceso EVOSO Finalizado ===")
+    log(INFO, f"Motivo de finalización: {motivo_fin} (generación {genfin})")
+    log(INFO, f"Mejor Makespan global encontrado: {mingl:.2f} (en generación {genmax})")
+    if memetica is not None:
+        log(INFO, f"Búsqueda local: {memetica.aplicaciones} aplicaciones, {memetica.mejoras} mejoras, "
+                  f"{memetica.evals} de {evals} evaluaciones")
+    if duplicados is not None:
+        log(INFO, f"Duplicados: {duplicados.duplicados_corrida} de {duplicados.consultas_corrida} "
+                  f"evaluaciones evitadas")
+    log(INFO, f"Mejor individuo global: Objective={queen.objective:.2f}, Fitness={queen.fitness:.6f}")
     
     # Calcular ebest y epop (errores relativos respecto al upperb, si es una métrica de referencia)
     # abs(upperb - mingl) / upperb * 100
@@ -810,60 +1084,295 @@ def evoso(detalle_archivo: str, resumen_archivo: str) -> None:
     # abs(upperb - avg) / upperb * 100
     epop = (abs(upperb - avg) / upperb) * 100 if upperb != 0 else float('inf')
 
-    print(f"Error del mejor individuo (ebest): {ebest:.2f}%")
-    print(f"Error promedio de la población (epop): {epop:.2f}%")
+    log(INFO, f"Error del mejor individuo (ebest): {ebest:.2f}%")
+    log(INFO, f"Error promedio de la población (epop): {epop:.2f}%")
 
     imprimir_resumen(resumen_archivo) # Llama a la función para imprimir el resumen final
-
-if __name__ == "__main__":
+    if almacen is not None:
+        almacen.registrar_corrida(indcorr, ebest, epop, mingl, genmax, genfin, motivo_fin, evals,
+                                  time.perf_counter() - t_inicio)
+    if metricas is not None:
+        metricas.finalizar_corrida(indcorr)
+    if eventos is not None:
+        eventos.emitir('corrida_fin', corrida=indcorr, mingl=mingl, genmax=genmax, genfin=genfin,
+                       motivo=motivo_fin, evals=evals, segundos=round(time.perf_counter() - t_inicio, 3))
+
+def parsear_argumentos(argv: Optional[list] = None) -> argparse.Namespace:
+    """
+    Define y parsea los argumentos de línea de comandos.
+    
+    Args:
+        argv: Argumentos a parsear (por defecto sys.argv[1:])
+        
+    Returns:
+        Namespace con los argumentos parseados
+    """
+    parser = argparse.ArgumentParser(description="Algoritmo Evosocial - Implementación Python puro")
+    parser.add_argument('--instancia', default='converted_swv08.txt',
+                        help="Archivo de instancia dentro de ../instancias (o ruta a un archivo existente)")
+    parser.add_argument('--datos', default='DATOS.DAT', help="Archivo de parámetros")
+    parser.add_argument('--sqlite', metavar='RUTA', default=None,
+                        help="Guardar además corridas, convergencia y tiempos en una base SQLite")
+    parser.add_argument('--generar', metavar='JOBSxMAQUINAS[:SEMILLA]', type=parsear_especificacion, default=None,
+                        help="Generar una instancia de Taillard en ../instancias/generadas y usarla "
+                             "en lugar de --instancia")
+    parser.add_argument('--semilla-reina', choices=['aleatoria', 'neh'], default='aleatoria',
+                        help="Inicialización de la reina: permutación aleatoria o heurística NEH "
+                             "(sus evaluaciones se suman a evals)")
+    parser.add_argument('--duplicados', choices=['generacion', 'corrida'], default=None,
+                        help="No reevaluar cromosomas ya evaluados en la misma generación o corrida "
+                             "(tasa de duplicados por generación en duplicados_*.txt)")
+    adaptativo = parser.add_argument_group('control adaptativo de operadores')
+    adaptativo.add_argument('--control', choices=METODOS_CONTROL, default=None,
+                            help="Elegir entre cruce, mutación shift y mutación swap según su tasa de mejora "
+                                 "reciente (adaptive pursuit o probability matching) en lugar de pcross fijo; "
+                                 "trayectorias en operadores_*.txt")
+    adaptativo.add_argument('--control-alfa', type=float, default=0.3,
+                            help="Tasa de adaptación de la calidad de cada operador (defecto: 0.3)")
+    adaptativo.add_argument('--control-beta', type=float, default=0.3,
+                            help="Tasa de persecución de adaptive pursuit (defecto: 0.3)")
+    adaptativo.add_argument('--control-p-min', type=float, default=0.05,
+                            help="Probabilidad mínima de cada operador (defecto: 0.05)")
+    local = parser.add_argument_group('búsqueda local sobre la reina (memética)')
+    local.add_argument('--memetica-cada', type=int, default=0, metavar='K',
+                       help="Aplicar la búsqueda local a la reina cada K generaciones (0 = no periódica)")
+    local.add_argument('--memetica-al-mejorar', action='store_true',
+                       help="Aplicar la búsqueda local en cada generación en que mejora la reina")
+    local.add_argument('--memetica-evals', type=int, default=1000,
+                       help="Presupuesto de evaluaciones por aplicación (defecto: 1000)")
+    local.add_argument('--memetica-max-evals', type=int, default=None,
+                       help="Presupuesto total de evaluaciones de búsqueda local por corrida")
+    parada = parser.add_argument_group('criterios de parada')
+    parada.add_argument('--max-tiempo', type=float, default=None,
+                        help="Presupuesto de tiempo por corrida (segundos)")
+    parada.add_argument('--max-evals', type=int, default=None,
+                        help="Presupuesto de evaluaciones por corrida")
+    parada.add_argument('--max-estancamiento', type=int, default=None,
+                        help="Generaciones sin mejora del mejor global antes de detener la corrida")
+    parada.add_argument('--objetivo', type=float, default=None,
+                        help="Makespan objetivo: detener la corrida al alcanzarlo")
+    parada.add_argument('--parar-en-lowerb', action='store_true',
+                        help="Detener la corrida al alcanzar lowerb")
+    instrumentacion = parser.add_argument_group('instrumentación')
+    instrumentacion.add_argument('--tiempos-fase', action='store_true',
+                                 help="Registrar el tiempo por fase de cada generación en tiempos_fase_*.txt")
+    instrumentacion.add_argument('--profile', action='store_true',
+                                 help="Perfilar cada corrida con cProfile (perfil_*.pstats y perfil_*_resumen.txt)")
+    instrumentacion.add_argument('--profile-gens', type=int, default=10,
+                                 help="Generaciones por corrida en modo --profile (defecto: 10)")
+    instrumentacion.add_argument('--profile-corridas', type=int, default=1,
+                                 help="Corridas en modo --profile (defecto: 1)")
+    instrumentacion.add_argument('--profile-lineas', action='store_true',
+                                 help="Con --profile, contar además líneas ejecutadas (Python 3.12+, sys.monitoring)")
+    instrumentacion.add_argument('--memoria', action='store_true',
+                                 help="Registrar memoria por generación (tracemalloc y RSS pico) en memoria_*.txt")
+    instrumentacion.add_argument('--memoria-top', type=int, default=5,
+                                 help="Sitios de asignación top por generación en memoria_sitios_*.txt (0 = ninguno)")
+    instrumentacion.add_argument('--eventos', action='store_true',
+                                 help="Escribir eventos de cada corrida (inicio, nuevo mejor, generación, fin) "
+                                      "en eventos_*.jsonl")
+    instrumentacion.add_argument('--metricas-puerto', type=int, default=None, metavar='PUERTO',
+                                 help="Exponer métricas Prometheus en http://127.0.0.1:PUERTO/metrics "
+                                      "(0 = puerto libre)")
+    instrumentacion.add_argument('--metricas-host', default='127.0.0.1',
+                                 help="Dirección de escucha del endpoint de métricas (defecto: 127.0.0.1)")
+    formato_detalle = parser.add_mutually_exclusive_group()
+    formato_detalle.add_argument('--detalle-binario', action='store_true',
+                                 help="Guardar la convergencia en formato binario columnar (detalle_*.evc) "
+                                      "en lugar de detalle_*.txt")
+    formato_detalle.add_argument('--detalle-cambios', action='store_true',
+                                 help="Escribir en detalle_*.txt solo la primera generación, las mejoras "
+                                      "de mingl y la última generación de cada corrida")
+    parser.add_argument('-v', '--verbose', action='count', default=0,
+                        help="Aumentar la verbosidad: -v corridas, -vv generaciones, -vvv depuración "
+                             "(por defecto solo errores)")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[list] = None) -> None:
+    """
+    Orquesta la ejecución completa: configuración, lectura de instancia,
+    cantcorr corridas de evoso y registro del tiempo total.
+    
+    Args:
+        argv: Argumentos de línea de comandos (por defecto sys.argv[1:])
+    """
+    global Ins, indcorr, cronometro, memoria, eventos, metricas, convergencia, detalle_cambios, almacen
+    global maxgen, cantcorr
+    global max_tiempo, max_evals, max_estancamiento, objetivo, parar_en_lowerb
+    global semilla_reina, memetica, duplicados, control
+    
+    # Los objetos opcionales se reinician en cada llamada: main() puede ejecutarse
+    # varias veces en el mismo proceso (ver utils/motores.py)
+    cronometro = memoria = eventos = metricas = convergencia = almacen = None
+    memetica = duplicados = control = None
+    detalle_cambios = False
+    
+    args = parsear_argumentos(argv)
+    configurar_verbosidad(args.verbose)
+    if args.generar:
+        jobs, maquinas, semilla = args.generar
+        args.instancia = generar_instancia(jobs, maquinas, semilla)['custom']
+        log(INFO, f"Instancia generada: {args.instancia}")
     
     dir_instancias = 'instancias'
     #archivo_instancia = 'converted_swv06.txt'
     #archivo_instancia = 'converted_swv07.txt'
-    archivo_instancia = 'converted_swv08.txt'
-    ruta_completa_instancia = os.path.join('..', dir_instancias, archivo_instancia) 
+    archivo_instancia = os.path.basename(args.instancia)
+    ruta_completa_instancia = os.path.join('..', dir_instancias, args.instancia) 
+    if os.path.exists(args.instancia):
+        ruta_completa_instancia = args.instancia
 
     detalle_archivo = "detalle_converted_" + archivo_instancia 
     resumen_archivo = "resumen_converted_" + archivo_instancia 
 
+    # Criterios de parada
+    max_tiempo = args.max_tiempo
+    max_evals = args.max_evals
+    max_estancamiento = args.max_estancamiento
+    objetivo = args.objetivo
+    parar_en_lowerb = args.parar_en_lowerb
+    semilla_reina = args.semilla_reina
+
     # Inicio medida de tiempo
     start_time = time.time()
 
     try:
-        print("Iniciando sistema...")
-        inicializar_sistema()
-        print(f"Sistema listo. Población: {popsize}, Generaciones: {maxgen}")
-
-        inicializar_archivos(detalle_archivo, resumen_archivo)
+        log(INFO, "Iniciando sistema...")
+        inicializar_sistema(args.datos)
+        if args.profile:
+            maxgen = args.profile_gens
+            cantcorr = args.profile_corridas
+            log(INFO, f"Modo perfilado: {cantcorr} corrida(s) de {maxgen} generaciones")
+        log(INFO, f"Sistema listo. Población: {popsize}, Generaciones: {maxgen}")
+
+        if args.detalle_binario:
+            from utils.convergencia import EscritorConvergencia, EXTENSION as EXTENSION_CONVERGENCIA
+            inicializar_archivos(None, resumen_archivo)
+            convergencia = EscritorConvergencia(os.path.splitext(detalle_archivo)[0] + EXTENSION_CONVERGENCIA,
+                                                capacidad=maxgen)
+            log(INFO, f"  Convergencia binaria: {convergencia.ruta}")
+        else:
+            detalle_cambios = args.detalle_cambios
+            inicializar_archivos(detalle_archivo, resumen_archivo, modo_cambios=detalle_cambios)
+        if args.tiempos_fase:
+            from utils.instrumentacion import CronometroFases, ruta_companera
+            cronometro = CronometroFases(ruta_companera(detalle_archivo, 'tiempos_fase'))
+            log(INFO, f"  Tiempos por fase: {cronometro.ruta}")
+        if args.memoria:
+            from utils.instrumentacion import MonitorMemoria, ruta_companera
+            memoria = MonitorMemoria(ruta_companera(detalle_archivo, 'memoria'),
+                                     ruta_companera(detalle_archivo, 'memoria_sitios'), top=args.memoria_top)
+            log(INFO, f"  Memoria por generación: {memoria.ruta}")
+        if args.eventos:
+            from utils.eventos import EscritorEventos
+            from utils.instrumentacion import ruta_companera
+            eventos = EscritorEventos(os.path.splitext(ruta_companera(detalle_archivo, 'eventos'))[0] + '.jsonl')
+            log(INFO, f"  Eventos: {eventos.ruta}")
+        if args.memetica_cada or args.memetica_al_mejorar:
+            from utils.instrumentacion import ruta_companera
+            memetica = MemeticaReina(ruta_companera(detalle_archivo, 'memetica'), cada=args.memetica_cada,
+                                     al_mejorar=args.memetica_al_mejorar, evals_aplicacion=args.memetica_evals,
+                                     max_evals_corrida=args.memetica_max_evals)
+            log(INFO, f"  Búsqueda local: {memetica.ruta}")
+        if args.duplicados:
+            from utils.instrumentacion import ruta_companera
+            duplicados = FiltroDuplicados(ruta_companera(detalle_archivo, 'duplicados'), alcance=args.duplicados)
+            log(INFO, f"  Duplicados ({duplicados.alcance}): {duplicados.ruta}")
+        if args.control:
+            from utils.instrumentacion import ruta_companera
+            control = ControlOperadores(ruta_companera(detalle_archivo, 'operadores'), pcross, metodo=args.control,
+                                        alfa=args.control_alfa, beta=args.control_beta, p_min=args.control_p_min)
+            log(INFO, f"  Control de operadores ({control.metodo}): {control.ruta}")
+        if args.metricas_puerto is not None:
+            from utils.metricas import ServidorMetricas
+            metricas = ServidorMetricas(args.metricas_puerto, args.metricas_host, motor='puro',
+                                        instancia=os.path.splitext(archivo_instancia)[0])
+            log(INFO, f"  Métricas en {metricas.url}")
         
         #Ins = open('./instancias/100X5-10.txt', 'r', encoding='utf-8')
         #Ins = open('./instancias/converted_swv06.txt', 'r', encoding='utf-8')
         #Ins = open(f'../{dir_instancias}/{archivo_instancia}', 'r', encoding='utf-8')
         Ins = open(ruta_completa_instancia, 'r', encoding='utf-8')
-        print("Leyendo archivo de instancia...")
+        log(INFO, "Leyendo archivo de instancia...")
         leer_instancia()
-
-        print("\n=== Test: Ejecutar Algorimo Genético ===")
+        if args.sqlite:
+            from utils.almacen import AlmacenResultados
+            almacen = AlmacenResultados(args.sqlite)
+            almacen.iniciar_experimento('puro', archivo_instancia, {
+                'popsize': popsize, 'maxgen': maxgen, 'pcross': pcross, 'pmutacion': pmutacion,
+                'cantcorr': cantcorr, 'max_tiempo': max_tiempo, 'max_evals': max_evals,
+                'max_estancamiento': max_estancamiento, 'objetivo': objetivo,
+                'parar_en_lowerb': parar_en_lowerb, 'semilla_reina': semilla_reina,
+                'memetica_cada': args.memetica_cada, 'memetica_al_mejorar': args.memetica_al_mejorar,
+                'memetica_evals': args.memetica_evals, 'memetica_max_evals': args.memetica_max_evals,
+                'duplicados': args.duplicados, 'control': args.control, 'control_alfa': args.control_alfa,
+                'control_beta': args.control_beta, 'control_p_min': args.control_p_min},
+                lowerb=lowerb, upperb=upperb)
+            log(INFO, f"  Base de resultados: {almacen.ruta} (experimento {almacen.experimento})")
+
+        log(INFO, "\n=== Test: Ejecutar Algorimo Genético ===")
         for indcorr in range(0, cantcorr):
-            print(f"\n--- Corrida {indcorr}/{cantcorr} ---")
-            evoso(detalle_archivo, resumen_archivo)
+            log(INFO, f"\n--- Corrida {indcorr}/{cantcorr} ---")
+            if args.profile:
+                from utils.perfilado import perfilar
+                nombre_base = os.path.splitext(archivo_instancia)[0]
+                perfilar(lambda: evoso(detalle_archivo, resumen_archivo),
+                         f"perfil_puro_{nombre_base}_corrida{indcorr}",
+                         lineas=args.profile_lineas)
+            else:
+                evoso(detalle_archivo, resumen_archivo)
         
     except TypeError as e: 
         print(f"Ocurrió un error de tipo: {e}")
     finally:
         if Ins and not Ins.closed:
             Ins.close()
+        if cronometro is not None:
+            cronometro.cerrar()
+        if memoria is not None:
+            memoria.cerrar()
+        if eventos is not None:
+            eventos.cerrar()
+        if metricas is not None:
+            metricas.cerrar()
+        if convergencia is not None:
+            convergencia.cerrar()
+        if memetica is not None:
+            memetica.cerrar()
+        if duplicados is not None:
+            duplicados.cerrar()
+        if control is not None:
+            control.cerrar()
         cerrar_archivos()
+        # memoria y almacen se usan todavía para el archivo de tiempo
+        cronometro = eventos = metricas = convergencia = memetica = duplicados = control = None
+        detalle_cambios = False
 
-    print("Ejecución finalizada.")
+    log(INFO, "Ejecución finalizada.")
 
-# Fin medida de tiempo
+    # Fin medida de tiempo
     end_time = time.time()
     elapsed_time = end_time - start_time
     # Guardo en archivo de resumen el tiempo total correspondiente a la instancia
     #archivo_resumen = 'resumen_tiempo_' + archivo_instancia
     archivo_tiempo = "tiempo_ejecucion_puro_"+ archivo_instancia
-    print(archivo_tiempo)
+    log(INFO, archivo_tiempo)
     with open(archivo_tiempo, "w", encoding="utf-8") as f:
         f.write(f"Instancia: {archivo_instancia}\n")
-        f.write(f"Tiempo de ejecución: {elapsed_time:.2f} segundos\n")
\ No newline at end of file
+        f.write(f"Tiempo de ejecución: {elapsed_time:.2f} segundos\n")
+        if memoria is not None:
+            from utils.instrumentacion import lineas_memoria
+            f.writelines(lineas_memoria([pico for pico, _ in memoria.picos]))
+    if almacen is not None:
+        memoria_pico_mib = rss_mib = None
+        if memoria is not None and memoria.picos:
+            from utils.instrumentacion import rss_pico_kib
+            memoria_pico_mib = max(pico for pico, _ in memoria.picos) / 1024
+            rss = rss_pico_kib()
+            rss_mib = rss / 1024 if rss is not None else None
+        almacen.registrar_tiempo(elapsed_time, memoria_pico_mib, rss_mib)
+        almacen.cerrar()
+    memoria = almacen = None
+
+if __name__ == "__main__":
+    main()
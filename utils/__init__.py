@@ -0,0 +1 @@
+"""Utilidades compartidas por los motores Evosocial, benchmarks y análisis."""
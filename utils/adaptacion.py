@@ -0,0 +1,140 @@
+"""
+Control adaptativo de operadores: elige para cada individuo entre cruce,
+mutación shift y mutación swap según su tasa de mejora reciente.
+
+En el ciclo Evosocial cada individuo pasa por una de dos ramas: cruce OX con
+la reina (probabilidad pcross) o mutación de la reina y del inmigrante (cada
+uno con probabilidad pmutacion). Con el control, la rama se sortea entre tres
+operadores ('cruce', 'shift' y 'swap'; las dos últimas son la rama de
+mutación con el operador correspondiente) y pmutacion sigue siendo la
+probabilidad de mutar dentro de la rama.
+
+La recompensa de una aplicación es la mejora relativa del candidato sobre la
+reina, (reina - candidato) / reina, o 0 si no la mejora. Al cerrar cada
+generación la calidad de cada operador usado se mueve hacia su recompensa media
+de la generación (q += alfa * (r - q)) y las probabilidades se recalculan con
+uno de dos métodos (Thierens, 2005):
+
+    persecucion      adaptive pursuit: la probabilidad del operador de mayor
+                     calidad se acerca a p_max y las demás a p_min (tasa beta)
+    emparejamiento   probability matching: probabilidades proporcionales a la
+                     calidad, con piso p_min
+
+Mientras ningún operador haya mejorado a la reina las probabilidades no cambian.
+p_min mantiene la exploración: ningún operador deja de aplicarse. Las
+probabilidades iniciales salen de pcross (el resto se reparte entre shift y
+swap), así que la primera generación es la del algoritmo con pcross fijo.
+
+Formato del archivo (una línea por generación y corrida):
+    corrida gen p_cruce p_shift p_swap usos_cruce usos_shift usos_swap mejoras_cruce mejoras_shift mejoras_swap
+"""
+
+import random
+
+OPERADORES = ('cruce', 'shift', 'swap')
+METODOS = ('persecucion', 'emparejamiento')
+
+
+class ControlOperadores:
+    """
+    Probabilidades de los operadores y su actualización por generación.
+    Args:
+        ruta (str): Archivo con la trayectoria de probabilidades (operadores_*.txt).
+        pcross (float): Probabilidad de cruce inicial (el resto se reparte entre shift y swap).
+        metodo (str): 'persecucion' (adaptive pursuit) o 'emparejamiento' (probability matching).
+        alfa (float): Tasa de adaptación de la calidad de cada operador.
+        beta (float): Tasa de persecución (solo 'persecucion').
+        p_min (float): Probabilidad mínima de cada operador.
+    """
+
+    def __init__(self, ruta, pcross, metodo='persecucion', alfa=0.3, beta=0.3, p_min=0.05):
+        if metodo not in METODOS:
+            raise ValueError(f"Método inválido: {metodo} (opciones: {', '.join(METODOS)})")
+        if not 0.0 <= p_min < 1.0 / len(OPERADORES):
+            raise ValueError(f"p_min debe estar en [0, {1.0 / len(OPERADORES):.3f})")
+        self.ruta = ruta
+        self.metodo = metodo
+        self.alfa = alfa
+        self.beta = beta
+        self.p_min = p_min
+        self.p_max = 1.0 - (len(OPERADORES) - 1) * p_min
+        self.iniciales = self._acotar([pcross, (1.0 - pcross) / 2, (1.0 - pcross) / 2])
+        self.archivo = open(ruta, 'w', encoding='utf-8')
+        self.archivo.write("# corrida gen " + " ".join(f"p_{o}" for o in OPERADORES) + " "
+                           + " ".join(f"usos_{o}" for o in OPERADORES) + " "
+                           + " ".join(f"mejoras_{o}" for o in OPERADORES) + "\n")
+        self.iniciar_corrida(0)
+
+    def _acotar(self, probabilidades):
+        """Lleva las probabilidades a [p_min, p_max] y las normaliza."""
+        acotadas = [min(max(p, self.p_min), self.p_max) for p in probabilidades]
+        total = sum(acotadas)
+        return [p / total for p in acotadas]
+
+    def iniciar_corrida(self, corrida):
+        """Vuelve a las probabilidades iniciales y a calidad 0."""
+        self.corrida = corrida
+        self.probabilidades = list(self.iniciales)
+        self.calidad = [0.0] * len(OPERADORES)
+        self._reiniciar_generacion()
+
+    def _reiniciar_generacion(self):
+        self.usos = [0] * len(OPERADORES)
+        self.mejoras = [0] * len(OPERADORES)
+        self._recompensas = [0.0] * len(OPERADORES)
+
+    def elegir(self):
+        """Sortea un operador con las probabilidades actuales (un solo random.random())."""
+        sorteo = random.random()
+        acumulada = 0.0
+        for operador, p in zip(OPERADORES, self.probabilidades):
+            acumulada += p
+            if sorteo < acumulada:
+                return operador
+        return OPERADORES[-1]
+
+    def recompensar(self, operador, makespan, referencia):
+        """
+        Registra el resultado de una aplicación.
+        Args:
+            operador (str): Operador aplicado (uno de OPERADORES).
+            makespan (float): Makespan del candidato elegido.
+            referencia (float): Makespan de la reina antes de aplicar el operador.
+        """
+
+        i = OPERADORES.index(operador)
+        self.usos[i] += 1
+        if makespan < referencia:
+            self.mejoras[i] += 1
+            self._recompensas[i] += (referencia - makespan) / referencia
+
+    def cerrar_generacion(self, gen):
+        """
+        Actualiza calidades y probabilidades con las recompensas de la generación y
+        escribe la línea de la generación (con las probabilidades usadas en ella).
+        Returns:
+            dict[str, float]: Probabilidades para la generación siguiente.
+        """
+
+        self.archivo.write(f"{self.corrida} {gen} " + " ".join(f"{p:.4f}" for p in self.probabilidades) + " "
+                           + " ".join(str(u) for u in self.usos) + " "
+                           + " ".join(str(m) for m in self.mejoras) + "\n")
+        for i, usos in enumerate(self.usos):
+            if usos:
+                self.calidad[i] += self.alfa * (self._recompensas[i] / usos - self.calidad[i])
+
+        if self.metodo == 'persecucion' and max(self.calidad) > 0:
+            mejor = max(range(len(OPERADORES)), key=self.calidad.__getitem__)
+            self.probabilidades = [p + self.beta * ((self.p_max if i == mejor else self.p_min) - p)
+                                   for i, p in enumerate(self.probabilidades)]
+        elif self.metodo == 'emparejamiento' and sum(self.calidad) > 0:
+            total = sum(self.calidad)
+            self.probabilidades = [self.p_min + (1.0 - len(OPERADORES) * self.p_min) * q / total
+                                   for q in self.calidad]
+        self._reiniciar_generacion()
+        return dict(zip(OPERADORES, self.probabilidades))
+
+    def cerrar(self):
+        """Cierra el archivo de trayectorias."""
+        if not self.archivo.closed:
+            self.archivo.close()
@@ -0,0 +1,203 @@
+"""
+Almacén SQLite de resultados: experimentos, corridas, convergencia y tiempos.
+
+Los motores escriben aquí además de sus archivos de texto (--sqlite RUTA). Un
+experimento es una ejecución de un motor sobre una instancia con una
+configuración; la configuración se guarda como JSON y su huella permite
+agrupar experimentos con los mismos parámetros.
+
+    experimentos  id, motor, instancia, config, huella_config, lowerb, upperb, fecha
+    corridas      experimento, corrida, ebest, epop, mingl, genmax, genfin, motivo, evals, segundos
+    convergencia  experimento, corrida, gen, mingl, evals, avg
+    tiempos       experimento, segundos, memoria_pico_mib, rss_pico_mib
+
+La base usa WAL, de modo que el análisis puede leer mientras un motor escribe y
+varios procesos pueden agregar experimentos a la misma base. La convergencia
+se acumula en memoria durante la corrida y se inserta con executemany en la
+misma transacción que la fila de la corrida: una transacción por corrida.
+
+    almacen = AlmacenResultados('resultados.db')
+    almacen.iniciar_experimento('puro', 'converted_swv06', {'popsize': 250, ...})
+    almacen.registrar_generacion(0, 1, 2450.0, 250)
+    almacen.registrar_corrida(0, ebest, epop, mingl, genmax, genfin, 'maxgen', evals, segundos)
+    almacen.registrar_tiempo(segundos)
+    almacen.cerrar()
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+from datetime import datetime
+from urllib.parse import quote
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS experimentos (
+    id INTEGER PRIMARY KEY,
+    motor TEXT NOT NULL,
+    instancia TEXT NOT NULL,
+    config TEXT NOT NULL,
+    huella_config TEXT NOT NULL,
+    lowerb REAL,
+    upperb REAL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_experimentos_instancia ON experimentos (instancia, motor);
+CREATE INDEX IF NOT EXISTS idx_experimentos_config ON experimentos (huella_config);
+
+CREATE TABLE IF NOT EXISTS corridas (
+    experimento INTEGER NOT NULL REFERENCES experimentos (id),
+    corrida INTEGER NOT NULL,
+    ebest REAL,
+    epop REAL,
+    mingl REAL NOT NULL,
+    genmax INTEGER,
+    genfin INTEGER,
+    motivo TEXT,
+    evals INTEGER,
+    segundos REAL,
+    PRIMARY KEY (experimento, corrida)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS convergencia (
+    experimento INTEGER NOT NULL REFERENCES experimentos (id),
+    corrida INTEGER NOT NULL,
+    gen INTEGER NOT NULL,
+    mingl REAL NOT NULL,
+    evals INTEGER,
+    avg REAL,
+    PRIMARY KEY (experimento, corrida, gen)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS tiempos (
+    experimento INTEGER PRIMARY KEY REFERENCES experimentos (id),
+    segundos REAL NOT NULL,
+    memoria_pico_mib REAL,
+    rss_pico_mib REAL
+);
+"""
+
+
+def nombre_instancia(instancia):
+    """Nombre normalizado de una instancia: sin directorio ni extensión."""
+    return os.path.splitext(os.path.basename(instancia))[0]
+
+
+def conectar(ruta):
+    """Abre (y crea si hace falta) una base de resultados en modo WAL."""
+
+    conexion = sqlite3.connect(ruta, timeout=30)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+def conectar_lectura(ruta):
+    """
+    Abre una base existente en solo lectura: no la crea, no aplica el esquema ni
+    cambia su modo de diario.
+    Raises:
+        FileNotFoundError: Si la base no existe.
+    """
+
+    if not os.path.isfile(ruta):
+        raise FileNotFoundError(f"No existe la base de resultados: {ruta}")
+    return sqlite3.connect(f"file:{quote(os.path.abspath(ruta))}?mode=ro", uri=True, timeout=30)
+
+
+class AlmacenResultados:
+    """
+    Escritor de un experimento en la base SQLite.
+    Args:
+        ruta (str): Archivo de la base.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.conexion = conectar(ruta)
+        self.experimento = None
+        self._convergencia = []
+
+    def iniciar_experimento(self, motor, instancia, parametros, lowerb=None, upperb=None):
+        """
+        Registra el experimento y lo deja como destino de las corridas siguientes.
+        Args:
+            motor (str): 'puro' o 'deap'.
+            instancia (str): Nombre o ruta de la instancia (se normaliza).
+            parametros (dict): Configuración (DATOS.DAT y criterios de parada).
+        Returns:
+            int: Id del experimento.
+        """
+
+        config = json.dumps(parametros, sort_keys=True, default=str)
+        huella = hashlib.sha1(config.encode('utf-8')).hexdigest()[:16]
+        with self.conexion:
+            cursor = self.conexion.execute(
+                "INSERT INTO experimentos (motor, instancia, config, huella_config, lowerb, upperb, fecha) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (motor, nombre_instancia(instancia), config, huella, lowerb, upperb,
+                 datetime.now().isoformat(timespec='seconds')))
+        self.experimento = cursor.lastrowid
+        return self.experimento
+
+    def registrar_generacion(self, corrida, gen, mingl, evals, avg=None):
+        """Acumula un punto de convergencia (se inserta al registrar la corrida)."""
+        self._convergencia.append((self.experimento, corrida, gen, mingl, evals, avg))
+
+    def registrar_convergencia(self, corrida, puntos):
+        """Acumula varios puntos (gen, mingl, evals) de una corrida."""
+        self._convergencia.extend((self.experimento, corrida, gen, mingl, evals, None)
+                                  for gen, mingl, evals in puntos)
+
+    def registrar_corrida(self, corrida, ebest, epop, mingl, genmax, genfin, motivo, evals=None, segundos=None):
+        """Inserta la corrida y su convergencia acumulada en una sola transacción."""
+
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT OR REPLACE INTO convergencia (experimento, corrida, gen, mingl, evals, avg) "
+                "VALUES (?, ?, ?, ?, ?, ?)", self._convergencia)
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO corridas (experimento, corrida, ebest, epop, mingl, genmax, genfin, "
+                "motivo, evals, segundos) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.experimento, corrida, ebest, epop, mingl, genmax, genfin, motivo, evals, segundos))
+        self._convergencia = []
+
+    def registrar_tiempo(self, segundos, memoria_pico_mib=None, rss_pico_mib=None):
+        """Registra el tiempo total del experimento (y la memoria pico si se midió)."""
+
+        with self.conexion:
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO tiempos (experimento, segundos, memoria_pico_mib, rss_pico_mib) "
+                "VALUES (?, ?, ?, ?)", (self.experimento, segundos, memoria_pico_mib, rss_pico_mib))
+
+    def cerrar(self):
+        """Cierra la conexión (los puntos de una corrida sin registrar se descartan)."""
+        self.conexion.close()
+
+
+def consultar_experimentos(conexion, motor=None, instancia=None, huella_config=None, ultimo=True):
+    """
+    Experimentos que cumplen los filtros.
+    Args:
+        conexion (sqlite3.Connection): Conexión abierta con conectar() o conectar_lectura().
+        motor, instancia, huella_config (str, optional): Filtros por igualdad.
+        ultimo (bool): Si es True, solo el experimento más reciente por (motor, instancia).
+    Returns:
+        list[dict]: Filas de la tabla experimentos.
+    """
+
+    condiciones, valores = [], []
+    for columna, valor in (('motor', motor), ('instancia', instancia), ('huella_config', huella_config)):
+        if valor is not None:
+            condiciones.append(f"{columna} = ?")
+            valores.append(valor)
+    donde = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+    consulta = f"SELECT * FROM experimentos {donde} ORDER BY instancia, motor, id"
+    if ultimo:
+        consulta = (f"SELECT * FROM experimentos WHERE id IN (SELECT MAX(id) FROM experimentos {donde} "
+                    f"GROUP BY motor, instancia) ORDER BY instancia, motor")
+
+    cursor = conexion.execute(consulta, valores)
+    columnas = [d[0] for d in cursor.description]
+    return [dict(zip(columnas, fila)) for fila in cursor.fetchall()]
@@ -0,0 +1,76 @@
+"""
+Caché en disco de archivos de resultados ya parseados.
+
+Cada entrada guarda el resultado de un lector (por ejemplo la tabla de un
+resumen_*.txt) junto con la ruta, el tamaño y el mtime del archivo de origen.
+Mientras el archivo no cambie, obtener() devuelve el resultado guardado sin
+volver a parsear; si cambia, se parsea y se reemplaza la entrada.
+
+    cache = CacheLectura('analisis_comparativo/cache')
+    tabla = cache.obtener('puro/resumen_converted_swv06.txt', tabla_resumen)
+
+Las entradas son pickles locales: el directorio de caché no debe compartirse
+con fuentes no confiables. Borrar el directorio invalida todo el caché.
+"""
+
+import os
+import pickle
+import hashlib
+
+# Cambiar al modificar el formato de lo que devuelven los lectores
+VERSION = 2
+
+
+class CacheLectura:
+    """
+    Caché de lecturas indexado por (ruta, tamaño, mtime) del archivo de origen.
+    Args:
+        directorio (str): Directorio de las entradas (se crea si no existe).
+    """
+
+    def __init__(self, directorio):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _entrada(self, ruta, nombre_lector):
+        clave = f"{VERSION}:{nombre_lector}:{os.path.abspath(ruta)}"
+        return os.path.join(self.directorio, hashlib.sha1(clave.encode('utf-8')).hexdigest() + '.pkl')
+
+    def obtener(self, ruta, lector, **kwargs):
+        """
+        Devuelve lector(ruta, **kwargs), desde el caché si el archivo no cambió.
+        Args:
+            ruta (str): Archivo a leer.
+            lector (callable): Función de lectura; su nombre y kwargs forman parte de la clave.
+        """
+
+        estado = os.stat(ruta)
+        firma = (estado.st_size, estado.st_mtime_ns)
+        nombre_lector = lector.__name__ + (repr(sorted(kwargs.items())) if kwargs else '')
+        entrada = self._entrada(ruta, nombre_lector)
+
+        try:
+            with open(entrada, 'rb') as f:
+                guardado = pickle.load(f)
+            if guardado['firma'] == firma:
+                self.aciertos += 1
+                return guardado['datos']
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, AttributeError, ImportError):
+            pass
+
+        self.fallos += 1
+        datos = lector(ruta, **kwargs)
+        temporal = f"{entrada}.{os.getpid()}.tmp"
+        with open(temporal, 'wb') as f:
+            pickle.dump({'ruta': os.path.abspath(ruta), 'firma': firma, 'datos': datos}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, entrada)
+        return datos
+
+    def limpiar(self):
+        """Elimina todas las entradas del caché."""
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith('.pkl'):
+                os.remove(os.path.join(self.directorio, nombre))
@@ -0,0 +1,358 @@
+"""
+Registro de convergencia: formato binario columnar (alternativa a detalle_*.txt)
+y reconstrucción de la curva escalonada del modo por cambios.
+
+Cada corrida acumula sus generaciones en un arreglo estructurado preasignado
+(gen, mingl, evals, avg, tiempo) y al terminar se escribe como un único bloque,
+de modo que escribir y leer cuesta O(1) operaciones de Python por corrida y no
+por generación.
+
+Formato del archivo (little-endian):
+    cabecera   MAGIA (8 bytes) + versión (uint32)
+    bloque     corrida (int32) + filas (int32) + filas * DTYPE.itemsize bytes
+
+En el modo por cambios, detalle_*.txt empieza con la línea MARCA_CAMBIOS y solo
+tiene la primera generación, las generaciones en que mejora mingl, las del paso
+memético y la última generación de cada corrida. expandir_cambios() reconstruye
+la curva por generación: mingl es escalonado y evals queda en NaN fuera de los
+puntos registrados, ya que cada generación cuenta las decodificaciones que
+realmente hizo y no hay interpolación exacta. La curva mingl contra evals se
+arma con los puntos registrados (curva_por_evaluaciones()), que son exactos.
+"""
+
+import struct
+
+import numpy as np
+
+MAGIA = b'EVOCONV\0'
+VERSION = 1
+EXTENSION = '.evc'
+
+MARCA_CAMBIOS = '# modo: cambios'
+
+DTYPE = np.dtype([
+    ('gen', '<i4'),
+    ('mingl', '<f8'),
+    ('evals', '<i8'),
+    ('avg', '<f8'),
+    ('tiempo', '<f8'),
+])
+
+_CABECERA = struct.Struct('<8sI')
+_BLOQUE = struct.Struct('<ii')
+
+
+class EscritorConvergencia:
+    """
+    Escritor por bloques: registrar() guarda una fila en el arreglo de la corrida
+    y cerrar_corrida() vuelca la corrida completa con una sola escritura.
+    Args:
+        ruta (str): Archivo de salida.
+        capacidad (int): Filas preasignadas por corrida (normalmente maxgen); el
+            arreglo se duplica si se excede.
+    """
+
+    def __init__(self, ruta, capacidad=1000):
+        self.ruta = ruta
+        self.archivo = open(ruta, 'wb')
+        self.archivo.write(_CABECERA.pack(MAGIA, VERSION))
+        self._filas = np.zeros(max(1, capacidad), dtype=DTYPE)
+        self._n = 0
+        self._corrida = 0
+
+    def iniciar_corrida(self, corrida):
+        """Comienza el bloque de una corrida."""
+        self._corrida = corrida
+        self._n = 0
+
+    def registrar(self, gen, mingl, evals, avg, tiempo):
+        """Agrega una generación a la corrida actual."""
+        if self._n == len(self._filas):
+            self._filas = np.resize(self._filas, 2 * len(self._filas))
+        self._filas[self._n] = (gen, mingl, evals, avg, tiempo)
+        self._n += 1
+
+    def cerrar_corrida(self):
+        """Escribe el bloque de la corrida actual."""
+        self.archivo.write(_BLOQUE.pack(self._corrida, self._n))
+        self.archivo.write(self._filas[:self._n].tobytes())
+        self._n = 0
+
+    def cerrar(self):
+        """Cierra el archivo (una corrida sin cerrar se descarta)."""
+        if not self.archivo.closed:
+            self.archivo.close()
+
+
+def leer_convergencia(ruta):
+    """
+    Lee un archivo de convergencia binario.
+    Args:
+        ruta (str): Archivo .evc.
+    Returns:
+        dict[str, np.ndarray]: Columnas 'corrida', 'gen', 'mingl', 'evals', 'avg' y
+        'tiempo', con una fila por generación de todas las corridas.
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado.
+    """
+
+    with open(ruta, 'rb') as f:
+        datos = f.read()
+
+    if len(datos) < _CABECERA.size:
+        raise ValueError(f"{ruta}: archivo de convergencia truncado")
+    magia, version = _CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or version != VERSION:
+        raise ValueError(f"{ruta}: no es un archivo de convergencia v{VERSION}")
+
+    bloques, corridas = [], []
+    posicion = _CABECERA.size
+    while posicion + _BLOQUE.size <= len(datos):
+        corrida, filas = _BLOQUE.unpack_from(datos, posicion)
+        posicion += _BLOQUE.size
+        fin = posicion + filas * DTYPE.itemsize
+        if fin > len(datos):
+            raise ValueError(f"{ruta}: bloque de la corrida {corrida} truncado")
+        bloques.append(np.frombuffer(datos, dtype=DTYPE, count=filas, offset=posicion))
+        corridas.append(np.full(filas, corrida, dtype=np.int32))
+        posicion = fin
+
+    tabla = np.concatenate(bloques) if bloques else np.zeros(0, dtype=DTYPE)
+    columnas = {'corrida': np.concatenate(corridas) if corridas else np.zeros(0, dtype=np.int32)}
+    columnas.update({nombre: tabla[nombre].copy() for nombre in DTYPE.names})
+    return columnas
+
+
+def inicios_de_corrida(gen, corrida=None):
+    """
+    Índices donde empieza cada corrida en una secuencia de generaciones
+    concatenadas. Con la columna de corrida se usa su cambio; sin ella (archivos
+    anteriores) una corrida nueva empieza cuando gen no crece.
+    Args:
+        gen (np.ndarray): Generaciones de todas las corridas en orden de archivo.
+        corrida (np.ndarray, optional): Índice de corrida de cada fila.
+    Returns:
+        np.ndarray: Índices de inicio (el primero siempre es 0).
+    """
+
+    gen = np.asarray(gen)
+    if gen.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    cortes = np.diff(gen) <= 0
+    if corrida is not None:
+        cortes |= np.diff(np.asarray(corrida)) != 0
+    return np.concatenate(([0], np.flatnonzero(cortes) + 1))
+
+
+def indices_de_corrida(gen, corrida=None):
+    """
+    Índice de corrida de cada fila: la columna de corrida si existe, o el número
+    de corrida inferido de los reinicios de gen.
+    Returns:
+        np.ndarray: Índice de corrida (int) por fila.
+    """
+
+    if corrida is not None:
+        return np.asarray(corrida, dtype=np.int64)
+    gen = np.asarray(gen)
+    indices = np.zeros(gen.size, dtype=np.int64)
+    inicios = inicios_de_corrida(gen)
+    indices[inicios[1:]] = 1
+    return np.cumsum(indices)
+
+
+def expandir_cambios(gen, mingl, evals, corrida=None):
+    """
+    Reconstruye la curva de convergencia completa a partir de los puntos de cambio.
+    Args:
+        gen (np.ndarray): Generaciones registradas (todas las corridas concatenadas).
+        mingl (np.ndarray): Mejor global en cada punto.
+        evals (np.ndarray): Evaluaciones acumuladas en cada punto.
+        corrida (np.ndarray, optional): Índice de corrida de cada punto (si no se
+            indica, se infiere de los reinicios de gen).
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: (corrida, gen, mingl, evals)
+        con una fila por generación, de la primera a la última registrada de cada corrida.
+        evals (float64) es NaN en las generaciones no registradas.
+    """
+
+    gen = np.asarray(gen, dtype=np.int64)
+    mingl = np.asarray(mingl, dtype=np.float64)
+    evals = np.asarray(evals, dtype=np.float64)
+    corrida = indices_de_corrida(gen, corrida)
+    inicios = inicios_de_corrida(gen, corrida)
+    finales = np.append(inicios[1:], gen.size)
+
+    corridas, gens, mingls, evalss = [], [], [], []
+    for i, f in zip(inicios, finales):
+        completa = np.arange(gen[i], gen[f - 1] + 1)
+        indice = np.searchsorted(gen[i:f], completa, side='right') - 1
+        corridas.append(np.full(completa.size, corrida[i]))
+        gens.append(completa)
+        mingls.append(mingl[i:f][indice])
+        evals_completa = np.full(completa.size, np.nan)
+        evals_completa[gen[i:f] - gen[i]] = evals[i:f]
+        evalss.append(evals_completa)
+
+    if not gens:
+        return corrida, gen, mingl, evals
+    return np.concatenate(corridas), np.concatenate(gens), np.concatenate(mingls), np.concatenate(evalss)
+
+
+def curva_por_evaluaciones(corrida, evals, mingl):
+    """
+    Curva mingl contra evaluaciones de cada corrida, solo con los puntos registrados
+    (las filas con evals NaN de expandir_cambios() se descartan).
+    Args:
+        corrida (np.ndarray): Índice de corrida de cada fila.
+        evals (np.ndarray): Evaluaciones acumuladas (NaN si la generación no se registró).
+        mingl (np.ndarray): Mejor global de cada fila.
+    Returns:
+        dict[int, tuple[np.ndarray, np.ndarray]]: corrida -> (evals, mingl), en orden de generación.
+    """
+
+    corrida = np.asarray(corrida, dtype=np.int64)
+    evals = np.asarray(evals, dtype=np.float64)
+    mingl = np.asarray(mingl, dtype=np.float64)
+    registrados = ~np.isnan(evals)
+    corrida, evals, mingl = corrida[registrados], evals[registrados], mingl[registrados]
+    return {int(c): (evals[corrida == c].astype(np.int64), mingl[corrida == c]) for c in np.unique(corrida)}
+
+
+def matriz_por_corrida(corrida, gen, valores):
+    """
+    Reordena una columna de convergencia en una matriz (corridas, generaciones).
+    Las corridas que terminan antes (criterios de parada) conservan su último
+    valor hasta la última generación, ya que el mejor global no cambia después;
+    las generaciones anteriores al primer registro quedan en NaN.
+    Args:
+        corrida (np.ndarray): Índice de corrida por fila.
+        gen (np.ndarray): Generación por fila.
+        valores (np.ndarray): Valor por fila (por ejemplo mingl).
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: (ids de corrida, generaciones, matriz)
+    """
+
+    corrida = np.asarray(corrida)
+    gen = np.asarray(gen, dtype=np.int64)
+    valores = np.asarray(valores, dtype=np.float64)
+    if gen.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros((0, 0))
+
+    ids, fila = np.unique(corrida, return_inverse=True)
+    gen_min = gen.min()
+    generaciones = np.arange(gen_min, gen.max() + 1)
+    columna = gen - gen_min
+
+    matriz = np.full((ids.size, generaciones.size), np.nan)
+    matriz[fila, columna] = valores
+
+    # Arrastre hacia adelante del último valor registrado de cada corrida
+    presente = ~np.isnan(matriz)
+    ultimo = np.where(presente, np.arange(generaciones.size), 0)
+    np.maximum.accumulate(ultimo, axis=1, out=ultimo)
+    arrastrada = matriz[np.arange(ids.size)[:, None], ultimo]
+    iniciada = np.maximum.accumulate(presente, axis=1)
+    return ids, generaciones, np.where(iniciada, arrastrada, np.nan)
+
+
+def bandas_convergencia(matriz):
+    """
+    Estadísticos por generación a través de las corridas.
+    Args:
+        matriz (np.ndarray): Matriz (corridas, generaciones), con NaN donde falta dato.
+    Returns:
+        dict[str, np.ndarray]: 'mediana', 'q1', 'q3', 'media', 'minimo', 'maximo' y 'n'
+        (corridas con dato), cada uno de largo igual a la cantidad de generaciones.
+    """
+
+    q1, mediana, q3 = np.nanpercentile(matriz, [25, 50, 75], axis=0)
+    return {
+        'mediana': mediana,
+        'q1': q1,
+        'q3': q3,
+        'media': np.nanmean(matriz, axis=0),
+        'minimo': np.nanmin(matriz, axis=0),
+        'maximo': np.nanmax(matriz, axis=0),
+        'n': np.sum(~np.isnan(matriz), axis=0),
+    }
+
+
+def comprimir_escalones(x, *series, puntos=None):
+    """
+    Reduce curvas escalonadas (mejor global y sus cuantiles entre corridas) a los
+    puntos donde cambia alguna de las series, más el primero y el último. Dibujadas
+    con drawstyle='steps-post' (o fill_between(step='post')) son idénticas a las
+    originales.
+    Si quedan más de `puntos`, el eje x se divide en puntos // 2 intervalos y de
+    cada uno se conservan el primer y el último punto. En series monótonas son el
+    máximo y el mínimo del intervalo, así que la diferencia queda dentro de un
+    píxel cuando `puntos` es el ancho del gráfico.
+    Args:
+        x (np.ndarray): Abscisas crecientes (generaciones).
+        *series (np.ndarray): Series del mismo largo que x.
+        puntos (int, optional): Máximo de puntos a conservar.
+    Returns:
+        tuple[np.ndarray, ...]: (x, *series) reducidas a los mismos índices.
+    """
+
+    x = np.asarray(x)
+    series = [np.asarray(s, dtype=np.float64) for s in series]
+    if x.size <= 2:
+        return (x, *series)
+
+    cambia = np.zeros(x.size, dtype=bool)
+    cambia[0] = cambia[-1] = True
+    for s in series:
+        # NaN != NaN: los tramos sin dato se conservan tal cual
+        cambia[1:] |= s[1:] != s[:-1]
+    indices = np.flatnonzero(cambia)
+
+    if puntos is not None and indices.size > puntos:
+        intervalos = max(1, puntos // 2)
+        posicion = (x[indices] - x[0]) / max(x[-1] - x[0], 1)
+        intervalo = np.minimum((posicion * intervalos).astype(np.int64), intervalos - 1)
+        primeros = np.flatnonzero(np.r_[True, intervalo[1:] != intervalo[:-1]])
+        ultimos = np.r_[primeros[1:] - 1, intervalo.size - 1]
+        indices = indices[np.union1d(primeros, ultimos)]
+
+    return (x[indices], *(s[indices] for s in series))
+
+
+def lttb(x, y, puntos):
+    """
+    Submuestreo Largest-Triangle-Three-Buckets (Steinarsson, 2013) de una curva
+    continua (por ejemplo la media entre corridas). Conserva el primer y el último
+    punto y, de cada intervalo, el que forma el triángulo de mayor área con el
+    punto elegido antes y el promedio del intervalo siguiente. El costo en Python
+    es O(puntos); los puntos con NaN se descartan.
+    Args:
+        x (np.ndarray): Abscisas crecientes.
+        y (np.ndarray): Ordenadas.
+        puntos (int): Puntos a conservar (3 o más).
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (x, y) submuestreadas.
+    """
+
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    validos = ~np.isnan(y)
+    x, y = x[validos], y[validos]
+    n = x.size
+    if puntos >= n or puntos < 3:
+        return x, y
+
+    xf = x.astype(np.float64)
+    bordes = np.linspace(1, n - 1, puntos - 1).astype(np.int64)
+    elegidos = np.empty(puntos, dtype=np.int64)
+    elegidos[0], elegidos[-1] = 0, n - 1
+    anterior = 0
+    for i in range(puntos - 2):
+        inicio, fin = bordes[i], bordes[i + 1]
+        siguiente = slice(bordes[i + 1], bordes[i + 2]) if i + 2 < puntos - 1 else slice(n - 1, n)
+        cx, cy = xf[siguiente].mean(), y[siguiente].mean()
+        area = np.abs((xf[anterior] - cx) * (y[inicio:fin] - y[anterior])
+                      - (xf[anterior] - xf[inicio:fin]) * (cy - y[anterior]))
+        anterior = inicio + int(np.argmax(area))
+        elegidos[i + 1] = anterior
+    return x[elegidos], y[elegidos]
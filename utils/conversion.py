@@ -1,48 +1,349 @@
+"""
+Conversión de instancias al formato personalizado de los motores.
+
+Formatos de entrada (se detectan por contenido; un archivo puede tener varias
+instancias, como jobshop1.txt de OR-Library o tai20_5.txt de Taillard):
+
+- JSPLIB / OR-Library: "jobs maquinas" y una línea por job con pares
+  "maquina tiempo" (máquinas base 0). Los comentarios '#' y las líneas de texto
+  se ignoran; "instance NOMBRE" nombra la instancia siguiente.
+- Taillard flow shop: "number of jobs, number of machines, initial seed, upper
+  bound and lower bound :", sus valores, "processing times :" y una fila de
+  tiempos por máquina. Sus cotas son válidas para el problema de los motores.
+- Taillard job shop: "Nb of jobs, Nb of Machines, Time seed, Machine seed, Upper
+  bound, Lower bound", sus valores, "Times" (jobs x maquinas) y "Machines" (base 1).
+
+Los archivos se leen línea a línea: los tiempos se acumulan en arreglos del
+tamaño que anuncia la cabecera, sin cargar el archivo completo. Cada instancia
+se valida (cantidad de valores, rango de máquinas, cada job visita cada máquina
+una vez, tiempos no negativos) y se escribe como converted_<nombre>.txt
+(formato personalizado) y converted_<nombre>.npz (caché compilado con la matriz
+de tiempos y las cotas, que se lee sin parsear texto). Los archivos se
+convierten en paralelo en un pool de procesos.
+
+Uso:
+    python utils/conversion.py                                  # swv06..swv15 de instances/
+    python utils/conversion.py instances/swv06                  # un archivo
+    python utils/conversion.py JSPLIB/instances 'taillard/*.txt' --salida instancias/importadas
+"""
+
 import os
 import sys
+import glob
+import argparse
+from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.cotas import calcular_cotas, leer_cotas_conocidas, nombre_tabla
+
+# Cambiar al modificar el contenido de los .npz
+VERSION_COMPILADA = 1
+
+# Extensiones que no son instancias al recorrer directorios
+EXTENSIONES_IGNORADAS = ('.npz', '.json', '.md', '.py', '.pdf', '.csv', '.zip', '.gz', '.tar')
+
+
+def _lineas(archivo):
+    """Líneas no vacías de un archivo, con su número."""
+    for numero, linea in enumerate(archivo, start=1):
+        texto = linea.strip()
+        if texto:
+            yield numero, texto
+
+
+def _enteros(texto):
+    """Enteros de una línea, o None si la línea no es numérica."""
+    try:
+        return np.array(texto.split(), dtype=np.int64)
+    except ValueError:
+        return None
+
+
+def _leer_valores(lineas, cantidad, ruta, contexto):
+    """
+    Consume líneas hasta reunir `cantidad` enteros (pueden ocupar varias líneas).
+    Raises:
+        ValueError: Si aparece una línea no numérica, sobran valores o el archivo termina antes.
+    """
+
+    valores = np.empty(cantidad, dtype=np.int64)
+    leidos = 0
+    numero = None
+    while leidos < cantidad:
+        try:
+            numero, texto = next(lineas)
+        except StopIteration:
+            raise ValueError(f"{ruta}: {contexto}: se esperaban {cantidad} valores, "
+                             f"el archivo terminó con {leidos}") from None
+        fila = _enteros(texto)
+        if fila is None:
+            raise ValueError(f"{ruta}:{numero}: {contexto}: línea no numérica: {texto[:40]!r}")
+        if leidos + fila.size > cantidad:
+            raise ValueError(f"{ruta}:{numero}: {contexto}: sobran {leidos + fila.size - cantidad} valores")
+        valores[leidos:leidos + fila.size] = fila
+        leidos += fila.size
+    return valores
+
+
+def _esperar_titulo(lineas, titulo, ruta):
+    """Consume la línea de título de una sección (p. ej. 'processing times :')."""
+
+    for numero, texto in lineas:
+        if texto.lower().startswith(titulo):
+            return
+        raise ValueError(f"{ruta}:{numero}: se esperaba la sección '{titulo}', se encontró {texto[:40]!r}")
+    raise ValueError(f"{ruta}: falta la sección '{titulo}'")
+
+
+def _validar_dimensiones(n, m, ruta, numero):
+    """Verifica que la cabecera anuncie al menos un job y una máquina."""
+    if n <= 0 or m <= 0:
+        raise ValueError(f"{ruta}:{numero}: dimensiones inválidas {n}x{m}")
+
+
+def _maquinas_por_job(tiempos, ruteo, ruta, nombre):
+    """
+    Valida un job shop y lo reorganiza en la matriz [máquina][job] de los motores.
+    Args:
+        tiempos (np.ndarray): Tiempos (jobs, operaciones).
+        ruteo (np.ndarray): Máquina (base 0) de cada operación (jobs, operaciones).
+    Returns:
+        np.ndarray: Tiempos (maquinas, jobs).
+    """
+
+    jobs, maquinas = tiempos.shape
+    if ruteo.min() < 0 or ruteo.max() >= maquinas:
+        raise ValueError(f"{ruta}: {nombre}: máquina fuera de rango [0, {maquinas - 1}]")
+    visitas = np.sort(ruteo, axis=1) != np.arange(maquinas)
+    if visitas.any():
+        job = int(np.flatnonzero(visitas.any(axis=1))[0])
+        raise ValueError(f"{ruta}: {nombre}: el job {job} no visita cada máquina exactamente una vez")
+    matriz = np.empty((maquinas, jobs), dtype=np.int64)
+    matriz[ruteo, np.arange(jobs)[:, None]] = tiempos
+    return matriz
+
+
+def leer_instancias(ruta):
+    """
+    Lee las instancias de un archivo JSPLIB, OR-Library o Taillard.
+    Args:
+        ruta (str): Archivo de entrada.
+    Yields:
+        dict: 'nombre', 'formato' ('jsplib', 'taillard_fs' o 'taillard_js'),
+        'tiempos' (maquinas, jobs) y las cotas del archivo válidas para el flow
+        shop de los motores ('upperb' y 'lowerb', o None).
+    Raises:
+        ValueError: Si el archivo no tiene un formato válido.
+    """
+
+    base = os.path.splitext(os.path.basename(ruta))[0]
+    leidas = 0
+    nombre = None
+
+    def nombre_siguiente():
+        return nombre or (base if leidas == 0 else f"{base}_{leidas + 1}")
+
+    with open(ruta, 'r', encoding='utf-8', errors='replace') as f:
+        lineas = _lineas(f)
+        for numero, texto in lineas:
+            minusculas = texto.lower().lstrip('#').strip()
+
+            if minusculas.startswith('instance '):
+                nombre = texto.lstrip('#').split()[1]
+                continue
+
+            if minusculas.startswith('number of jobs'):
+                n, m, _, upperb, lowerb = _leer_valores(lineas, 5, ruta, "cabecera de Taillard")
+                _validar_dimensiones(n, m, ruta, numero)
+                _esperar_titulo(lineas, 'processing times', ruta)
+                tiempos = _leer_valores(lineas, m * n, ruta, "tiempos").reshape(m, n)
+                formato, cotas = 'taillard_fs', (int(upperb), int(lowerb))
+
+            elif minusculas.startswith('nb of jobs'):
+                n, m = _leer_valores(lineas, 6, ruta, "cabecera de Taillard")[:2]
+                _validar_dimensiones(n, m, ruta, numero)
+                _esperar_titulo(lineas, 'times', ruta)
+                tiempos_jobs = _leer_valores(lineas, n * m, ruta, "tiempos").reshape(n, m)
+                _esperar_titulo(lineas, 'machines', ruta)
+                ruteo = _leer_valores(lineas, n * m, ruta, "máquinas").reshape(n, m) - 1
+                tiempos = _maquinas_por_job(tiempos_jobs, ruteo, ruta, nombre_siguiente())
+                formato, cotas = 'taillard_js', (None, None)
+
+            else:
+                dimensiones = _enteros(texto)
+                if dimensiones is None or texto.startswith(('#', '+')):
+                    # Comentarios y descripciones de OR-Library
+                    continue
+                if dimensiones.size != 2:
+                    raise ValueError(f"{ruta}:{numero}: se esperaba 'jobs maquinas', se encontró {texto[:40]!r}")
+                n, m = dimensiones
+                _validar_dimensiones(n, m, ruta, numero)
+                pares = _leer_valores(lineas, n * m * 2, ruta, "operaciones").reshape(n, m, 2)
+                tiempos = _maquinas_por_job(pares[:, :, 1], pares[:, :, 0], ruta, nombre_siguiente())
+                formato, cotas = 'jsplib', (None, None)
+
+            if tiempos.min() < 0:
+                raise ValueError(f"{ruta}: {nombre_siguiente()}: tiempos negativos")
+
+            yield {'nombre': nombre_siguiente(), 'formato': formato, 'tiempos': tiempos,
+                   'upperb': cotas[0], 'lowerb': cotas[1]}
+            leidas += 1
+            nombre = None
+
+    if leidas == 0:
+        raise ValueError(f"{ruta}: no se encontró ninguna instancia")
+
 
-def convert_jsplib_to_custom_format(jsplib_file, output_file):
+def ruta_compilada(ruta):
+    """Ruta del caché compilado (.npz) de una instancia convertida (.txt)."""
+    return os.path.splitext(ruta)[0] + '.npz'
+
+
+def escribir_instancia(ruta, tiempos, upperb, lowerb):
+    """Escribe una instancia en el formato personalizado y su caché compilado."""
+
+    with open(ruta, 'w') as f:
+        f.write(f"{upperb}\n")
+        f.write(f"{lowerb}\n")
+        np.savetxt(f, tiempos, fmt='%3d', delimiter=' ')
+    np.savez(ruta_compilada(ruta), version=VERSION_COMPILADA, tiempos=tiempos.astype(np.int32),
+             upperb=upperb, lowerb=lowerb)
+
+
+def leer_compilada(ruta):
+    """
+    Lee el caché compilado de una instancia.
+    Args:
+        ruta (str): Archivo .npz (o el .txt convertido, se usa su .npz).
+    Returns:
+        tuple[int, int, np.ndarray]: (upperb, lowerb, tiempos (maquinas, jobs)).
+    Raises:
+        ValueError: Si el archivo es de otra versión.
+    """
+
+    with np.load(ruta_compilada(ruta)) as datos:
+        if int(datos['version']) != VERSION_COMPILADA:
+            raise ValueError(f"{ruta}: caché compilado de otra versión")
+        return int(datos['upperb']), int(datos['lowerb']), datos['tiempos'].astype(np.int64)
+
+
+def convertir_archivo(ruta, salida='.', conocidas=None, forzar=False):
+    """
+    Convierte todas las instancias de un archivo.
+    Args:
+        ruta (str): Archivo de entrada.
+        salida (str): Directorio de salida.
+        conocidas (dict, optional): Tabla de cotas superiores conocidas.
+        forzar (bool): Reescribir aunque la salida sea más reciente que la entrada.
+    Returns:
+        list[dict]: Una entrada por instancia ('nombre', 'ruta', 'jobs', 'maquinas',
+        'lowerb', 'upperb', 'origen_upperb', 'omitida'), o una sola con 'error'.
+    """
+
+    resultados = []
+    try:
+        modificada = os.stat(ruta).st_mtime_ns
+        for instancia in leer_instancias(ruta):
+            destino = os.path.join(salida, f"converted_{instancia['nombre']}.txt")
+            tiempos = instancia['tiempos']
+            resultado = {'nombre': instancia['nombre'], 'ruta': destino, 'formato': instancia['formato'],
+                         'maquinas': tiempos.shape[0], 'jobs': tiempos.shape[1]}
+
+            vigentes = all(os.path.exists(r) and os.stat(r).st_mtime_ns >= modificada
+                           for r in (destino, ruta_compilada(destino)))
+            if vigentes and not forzar:
+                upperb, lowerb, _ = leer_compilada(destino)
+                resultado.update({'upperb': upperb, 'lowerb': lowerb, 'origen_upperb': 'existente',
+                                  'omitida': True})
+                resultados.append(resultado)
+                continue
+
+            tabla = dict(conocidas or {})
+            if instancia['upperb'] is not None:
+                tabla.setdefault(nombre_tabla(instancia['nombre']), instancia['upperb'])
+            cotas = calcular_cotas(tiempos, instancia['nombre'], tabla)
+            lowerb = max(cotas['lowerb'], instancia['lowerb'] or 0)
+            escribir_instancia(destino, tiempos, cotas['upperb'], lowerb)
+            resultado.update({'upperb': cotas['upperb'], 'lowerb': lowerb,
+                              'origen_upperb': cotas['origen_upperb'], 'omitida': False})
+            resultados.append(resultado)
+    except (OSError, ValueError) as e:
+        return resultados + [{'nombre': os.path.basename(ruta), 'ruta': ruta, 'error': str(e)}]
+    return resultados
+
+
+def expandir_entradas(entradas):
+    """
+    Archivos de entrada a partir de archivos, directorios (recursivo) y globs.
+    Returns:
+        list[str]: Rutas únicas, ordenadas.
+    """
+
+    archivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for raiz, directorios, nombres in os.walk(entrada):
+                directorios[:] = [d for d in directorios if not d.startswith('.')]
+                archivos.update(os.path.join(raiz, n) for n in nombres
+                                if not n.startswith('.') and not n.lower().endswith(EXTENSIONES_IGNORADAS))
+        elif os.path.isfile(entrada):
+            archivos.add(entrada)
+        else:
+            archivos.update(r for r in glob.glob(entrada, recursive=True) if os.path.isfile(r))
+    return sorted(archivos)
+
+
+def convertir_lote(entradas, salida='.', conocidas=None, procesos=None, forzar=False):
+    """
+    Convierte un conjunto de archivos en un pool de procesos.
+    Args:
+        entradas (list[str]): Archivos, directorios o globs.
+        salida (str): Directorio de salida (se crea si no existe).
+        conocidas (dict, optional): Tabla de cotas superiores conocidas.
+        procesos (int, optional): Procesos del pool (por defecto uno por CPU, sin
+            superar la cantidad de archivos). Con 1 se convierte en este proceso.
+        forzar (bool): Reescribir las instancias ya convertidas.
+    Returns:
+        list[dict]: Resultados de convertir_archivo() de todos los archivos, en orden.
+    """
+
+    archivos = expandir_entradas(entradas)
+    faltantes = [{'nombre': entrada, 'ruta': entrada, 'error': f"{entrada}: no existe o no coincide con ningún archivo"}
+                 for entrada in entradas if not os.path.exists(entrada) and not glob.glob(entrada, recursive=True)]
+    os.makedirs(salida, exist_ok=True)
+    argumentos = [(ruta, salida, conocidas, forzar) for ruta in archivos]
+
+    procesos = min(procesos or os.cpu_count() or 1, len(archivos))
+    if not archivos:
+        por_archivo = []
+    elif procesos <= 1:
+        por_archivo = [convertir_archivo(*a) for a in argumentos]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            por_archivo = list(pool.map(convertir_archivo, *zip(*argumentos),
+                                        chunksize=max(1, len(archivos) // (4 * procesos))))
+    return faltantes + [resultado for resultados in por_archivo for resultado in resultados]
+
+
+def convert_jsplib_to_custom_format(jsplib_file, output_file, conocidas=None):
     """
     Convierte formato JSPLIB estándar al formato personalizado
     Formato de salida:
-    - Primera línea: upper bound (opcional)
-    - Segunda línea: lower bound (opcional)  
+    - Primera línea: upper bound (tabla de cotas conocidas o heurística)
+    - Segunda línea: lower bound (máximo de las cotas de utils/cotas.py)
     - Líneas siguientes: tiempos por máquina
+    Escribe también el caché compilado (.npz) y devuelve el diccionario de cotas
+    de calcular_cotas(). Si el archivo tiene varias instancias, convierte la primera.
     """
-    
-    with open(jsplib_file, 'r') as f:
-        lines = f.readlines()
-    
-    # Obtener dimensiones
-    dimensions = lines[4].strip().split()
-    num_jobs = int(dimensions[0])
-    num_machines = int(dimensions[1])
-    
-    # Leer datos de jobs
-    jobs_data = []
-    for i in range(5, 5 + num_jobs):
-        line_data = list(map(int, lines[i].strip().split()))
-        jobs_data.append(line_data)
-    
-    # Reorganizar: de [job][máquina, tiempo] a [máquina][job][tiempo]
-    machine_times = [[] for _ in range(num_machines)]
-    
-    for job_idx, job in enumerate(jobs_data):
-        for op_idx in range(0, len(job), 2):
-            machine = job[op_idx]
-            time = job[op_idx + 1]
-            machine_times[machine].append(time)
-    
-    # Escribir en formato personalizado
-    with open(output_file, 'w') as f:
-        # Escribir bounds (puedes ajustar estos valores)
-        f.write("1000\n")  # Upper bound placeholder
-        f.write("800\n")   # Lower bound placeholder
-        
-        # Escribir tiempos por máquina
-        for machine_idx in range(num_machines):
-            line = " ".join(f"{time:3}" for time in machine_times[machine_idx])
-            f.write(line + "\n")
+
+    instancia = next(leer_instancias(jsplib_file))
+    cotas = calcular_cotas(instancia['tiempos'], jsplib_file, conocidas)
+    escribir_instancia(output_file, instancia['tiempos'], cotas['upperb'], cotas['lowerb'])
+    return cotas
+
 
 def convert_multiple_instances():
     """Convierte todas las instancias SWV"""
@@ -50,24 +351,56 @@ def convert_multiple_instances():
         "swv06", "swv07", "swv08", "swv09", "swv10",
         "swv11", "swv12", "swv13", "swv14", "swv15"
     ]
-    
+    existentes = [f"instances/{instance}" for instance in instances if os.path.exists(f"instances/{instance}")]
     for instance in instances:
-        input_file = f"instances/{instance}"
-        output_file = f"converted_{instance}.txt"
-        
-        if os.path.exists(input_file):
-            convert_jsplib_to_custom_format(input_file, output_file)
-            print(f"Converted {instance} -> {output_file}")
+        if f"instances/{instance}" not in existentes:
+            print(f"File not found: instances/{instance}")
+
+    for resultado in convertir_lote(existentes, conocidas=leer_cotas_conocidas(), forzar=True):
+        if 'error' in resultado:
+            print(f"Error: {resultado['error']}")
         else:
-            print(f"File not found: {input_file}")
+            print(f"Converted {resultado['nombre']} -> {resultado['ruta']} "
+                  f"[{resultado['lowerb']}, {resultado['upperb']}]")
 
-# Conversión individual
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-        output_file = f"converted_{os.path.basename(input_file)}.txt"
-        convert_jsplib_to_custom_format(input_file, output_file)
-        print(f"Conversion complete: {output_file}")
-    else:
+
+def main(argv=None):
+    if not (sys.argv[1:] if argv is None else argv):
         # Convertir todas las instancias SWV
-        convert_multiple_instances()
\ No newline at end of file
+        convert_multiple_instances()
+        return 0
+
+    parser = argparse.ArgumentParser(description="Conversión de instancias JSPLIB/OR-Library/Taillard "
+                                                 "al formato de los motores")
+    parser.add_argument('entradas', nargs='+', help="Archivos, directorios o globs")
+    parser.add_argument('--salida', default='.', help="Directorio de salida")
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos del pool (defecto: uno por CPU)")
+    parser.add_argument('--conocidas', default=None, help="CSV de cotas superiores conocidas "
+                                                          "(defecto: instancias/cotas_conocidas.csv)")
+    parser.add_argument('--forzar', action='store_true', help="Reconvertir aunque la salida esté al día")
+    parser.add_argument('-q', '--silencioso', action='store_true', help="Mostrar solo el resumen y los errores")
+    args = parser.parse_args(argv)
+
+    inicio = perf_counter()
+    conocidas = leer_cotas_conocidas(args.conocidas) if args.conocidas else leer_cotas_conocidas()
+    resultados = convertir_lote(args.entradas, args.salida, conocidas, args.procesos, args.forzar)
+    errores = [r for r in resultados if 'error' in r]
+
+    for resultado in resultados:
+        if 'error' in resultado:
+            print(f"! {resultado['error']}", file=sys.stderr)
+        elif not args.silencioso:
+            marca = '=' if resultado['omitida'] else '+'
+            print(f"{marca} {resultado['nombre']:<20} {resultado['jobs']:>4}x{resultado['maquinas']:<3} "
+                  f"[{resultado['lowerb']}, {resultado['upperb']}] ({resultado['origen_upperb']}) -> "
+                  f"{resultado['ruta']}")
+
+    convertidas = sum(1 for r in resultados if 'error' not in r and not r['omitida'])
+    omitidas = sum(1 for r in resultados if 'error' not in r and r['omitida'])
+    print(f"Instancias: {convertidas} convertidas, {omitidas} al día, {len(errores)} errores "
+          f"({perf_counter() - inicio:.2f} s)")
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
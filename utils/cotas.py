@@ -0,0 +1,213 @@
+"""
+Cotas del makespan para las instancias del formato personalizado.
+
+Los motores resuelven un flow shop de permutación sobre la matriz de tiempos
+(maquinas, jobs) del archivo, así que las cotas se calculan sobre esa matriz:
+
+- carga de máquina: max_i sum_j p[i, j]
+- largo de job:     max_j sum_i p[i, j]
+- Taillard (1993):  max_i (min_j cabeza[i, j] + sum_j p[i, j] + min_j cola[i, j]),
+  donde cabeza y cola son el tiempo del job antes y después de la máquina i.
+
+Las tres se obtienen con sumas acumuladas sobre toda la matriz, sin recorrer
+máquinas ni jobs en Python. La cota superior es la de la tabla de cotas
+conocidas si la instancia figura en ella (y no contradice la cota inferior), y
+si no el mejor makespan entre los órdenes natural, SPT y LPT.
+
+Tabla de cotas conocidas (CSV, opcional; por defecto instancias/cotas_conocidas.csv):
+
+    instancia,upperb
+    tai_20x5_1,1278
+
+Uso:
+    python utils/cotas.py instancias/*.txt
+    python utils/cotas.py instancias/converted_swv06.txt --escribir
+"""
+
+import os
+import sys
+import csv
+import argparse
+
+import numpy as np
+
+RUTA_CONOCIDAS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'instancias', 'cotas_conocidas.csv')
+
+
+def cotas_inferiores(tiempos):
+    """
+    Cotas inferiores del makespan de un flow shop de permutación.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+    Returns:
+        dict[str, int]: 'carga_maquinas', 'largo_jobs' y 'taillard'.
+    """
+
+    tiempos = np.asarray(tiempos, dtype=np.int64)
+    carga = tiempos.sum(axis=1)
+    acumulado = np.cumsum(tiempos, axis=0)
+    cabeza = acumulado - tiempos
+    cola = acumulado[-1] - acumulado
+    taillard = cabeza.min(axis=1) + carga + cola.min(axis=1)
+    return {
+        'carga_maquinas': int(carga.max()),
+        'largo_jobs': int(acumulado[-1].max()),
+        'taillard': int(taillard.max()),
+    }
+
+
+def cota_inferior(tiempos):
+    """
+    Mejor cota inferior disponible (máximo de cotas_inferiores()).
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+    Returns:
+        int: Cota inferior del makespan.
+    """
+
+    return max(cotas_inferiores(tiempos).values())
+
+
+def makespan_permutacion(tiempos, orden):
+    """
+    Makespan de un flow shop de permutación (mismo criterio que gen_scheduler).
+    Cada job se programa en todas las máquinas a la vez con la forma cerrada
+    fin[i] = S[i] + max_{k<=i} (fin_anterior[k] - S[k-1]), con S la suma acumulada
+    de los tiempos del job, de modo que el costo en Python es O(jobs).
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+        orden (sequence[int]): Orden de los jobs (base 0).
+    Returns:
+        int: Makespan.
+    """
+
+    tiempos = np.asarray(tiempos, dtype=np.int64)
+    fin = np.zeros(tiempos.shape[0], dtype=np.int64)
+    for job in orden:
+        acumulado = np.cumsum(tiempos[:, job])
+        fin = acumulado + np.maximum.accumulate(fin - (acumulado - tiempos[:, job]))
+    return int(fin[-1])
+
+
+def cota_superior(tiempos):
+    """
+    Cota superior: mejor makespan entre el orden natural, SPT y LPT por tiempo total.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+    Returns:
+        int: Makespan de una solución factible.
+    """
+
+    totales = np.asarray(tiempos).sum(axis=0)
+    ordenes = [np.arange(totales.size), np.argsort(totales, kind='stable'),
+               np.argsort(-totales, kind='stable')]
+    return min(makespan_permutacion(tiempos, orden) for orden in ordenes)
+
+
+def nombre_tabla(instancia):
+    """Clave de una instancia en la tabla de cotas: sin directorio, extensión ni 'converted_'."""
+
+    nombre = os.path.splitext(os.path.basename(instancia))[0]
+    return nombre[len('converted_'):] if nombre.startswith('converted_') else nombre
+
+
+def leer_cotas_conocidas(ruta=RUTA_CONOCIDAS):
+    """
+    Lee la tabla de cotas superiores conocidas.
+    Args:
+        ruta (str): CSV con columnas 'instancia' y 'upperb'.
+    Returns:
+        dict[str, int]: Cota superior por instancia (vacío si el archivo no existe).
+    """
+
+    if not ruta or not os.path.exists(ruta):
+        return {}
+    with open(ruta, newline='') as f:
+        filas = [fila for fila in csv.DictReader(f) if fila.get('instancia') and fila.get('upperb')]
+    return {nombre_tabla(fila['instancia'].strip()): int(fila['upperb']) for fila in filas}
+
+
+def calcular_cotas(tiempos, instancia=None, conocidas=None):
+    """
+    Cotas de una instancia.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+        instancia (str, optional): Nombre o ruta, para buscar en la tabla de cotas conocidas.
+        conocidas (dict, optional): Tabla de leer_cotas_conocidas().
+    Returns:
+        dict: 'lowerb', 'upperb', 'origen_upperb' ('conocida' o 'heuristica'), las
+        cotas inferiores individuales y 'upperb_descartada' si la cota conocida es
+        menor que la inferior calculada.
+    """
+
+    resultado = cotas_inferiores(tiempos)
+    resultado['lowerb'] = max(resultado['carga_maquinas'], resultado['largo_jobs'], resultado['taillard'])
+
+    conocida = (conocidas or {}).get(nombre_tabla(instancia)) if instancia else None
+    if conocida is not None and conocida >= resultado['lowerb']:
+        resultado.update({'upperb': conocida, 'origen_upperb': 'conocida'})
+    else:
+        if conocida is not None:
+            resultado['upperb_descartada'] = conocida
+        resultado.update({'upperb': cota_superior(tiempos), 'origen_upperb': 'heuristica'})
+    return resultado
+
+
+def leer_instancia(ruta):
+    """
+    Lee una instancia del formato personalizado.
+    Returns:
+        tuple[int, int, np.ndarray]: (upperb, lowerb, tiempos (maquinas, jobs)).
+    """
+
+    with open(ruta, 'r') as f:
+        upperb = int(f.readline())
+        lowerb = int(f.readline())
+        tiempos = np.loadtxt(f, dtype=np.int64, ndmin=2)
+    return upperb, lowerb, tiempos
+
+
+def escribir_cotas(ruta, upperb, lowerb):
+    """Reemplaza las dos líneas de cotas de una instancia, sin tocar los tiempos."""
+
+    with open(ruta, 'r') as f:
+        lineas = f.readlines()
+    lineas[0], lineas[1] = f"{upperb}\n", f"{lowerb}\n"
+    with open(ruta, 'w') as f:
+        f.writelines(lineas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cotas del makespan de instancias del formato personalizado")
+    parser.add_argument('instancias', nargs='+', help="Archivos de instancia")
+    parser.add_argument('--conocidas', default=RUTA_CONOCIDAS, help="CSV de cotas superiores conocidas")
+    parser.add_argument('--escribir', action='store_true', help="Reescribir las cotas de cada archivo")
+    args = parser.parse_args(argv)
+
+    conocidas = leer_cotas_conocidas(args.conocidas)
+    print(f"{'instancia':<20} {'tam':>7} {'carga':>7} {'jobs':>7} {'taillard':>8} {'lowerb':>7} "
+          f"{'upperb':>7} {'origen':>10}  archivo")
+    inconsistentes = 0
+    for ruta in args.instancias:
+        upperb_archivo, lowerb_archivo, tiempos = leer_instancia(ruta)
+        cotas = calcular_cotas(tiempos, ruta, conocidas)
+        # Una cota superior del archivo menor que la inferior calculada no es válida
+        marca = ' !' if upperb_archivo < cotas['lowerb'] else ''
+        inconsistentes += bool(marca)
+        tamano = f"{tiempos.shape[1]}x{tiempos.shape[0]}"
+        print(f"{nombre_tabla(ruta):<20} {tamano:>7} {cotas['carga_maquinas']:>7} {cotas['largo_jobs']:>7} "
+              f"{cotas['taillard']:>8} {cotas['lowerb']:>7} {cotas['upperb']:>7} {cotas['origen_upperb']:>10}  "
+              f"[{lowerb_archivo}, {upperb_archivo}]{marca}")
+        if 'upperb_descartada' in cotas:
+            print(f"  Advertencia: cota conocida {cotas['upperb_descartada']} < lowerb {cotas['lowerb']}; se ignora",
+                  file=sys.stderr)
+        if args.escribir:
+            escribir_cotas(ruta, cotas['upperb'], cotas['lowerb'])
+
+    if inconsistentes:
+        print(f"\n{inconsistentes} archivo(s) con upperb menor que la cota inferior calculada (!)")
+
+
+if __name__ == "__main__":
+    main()
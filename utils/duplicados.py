@@ -0,0 +1,103 @@
+"""
+Filtro de cromosomas duplicados por huella de permutación.
+
+Con OX2 contra una única reina muchos hijos salen idénticos a la reina o a
+hijos anteriores, sobre todo al final de una corrida, y cada uno se decodifica
+de nuevo. El filtro guarda la huella de cada cromosoma evaluado (sus bytes, o
+la tupla de genes en DEAP) junto con su makespan, por generación o por
+corrida. Un duplicado toma el makespan guardado en lugar de evaluarse. La
+evaluación es determinista, así que la corrida es la misma que sin filtro y
+solo cambia la cantidad de evaluaciones. La tasa de duplicados de cada
+generación sirve además como medida barata de diversidad.
+
+Los motores guardan el filtro como los demás objetos opcionales (None cuando
+está deshabilitado). Al empezar cada generación se registra la reina, que ya
+está evaluada.
+
+Formato del archivo (una línea por generación y corrida):
+    corrida gen consultas duplicados tasa
+"""
+
+import numpy as np
+
+ALCANCES = ('generacion', 'corrida')
+
+
+def huella(cromosoma):
+    """Clave hashable de un cromosoma: sus bytes (np.ndarray) o la tupla de genes (lista)."""
+    if isinstance(cromosoma, np.ndarray):
+        return cromosoma.tobytes()
+    return tuple(cromosoma)
+
+
+class FiltroDuplicados:
+    """
+    Huellas de los cromosomas evaluados y su makespan.
+    Args:
+        ruta (str): Archivo con la tasa de duplicados por generación (duplicados_*.txt).
+        alcance (str): 'generacion' (las huellas se descartan al empezar cada generación)
+            o 'corrida' (se conservan durante toda la corrida; la memoria crece con las
+            evaluaciones).
+    """
+
+    def __init__(self, ruta, alcance='generacion'):
+        if alcance not in ALCANCES:
+            raise ValueError(f"Alcance inválido: {alcance} (opciones: {', '.join(ALCANCES)})")
+        self.ruta = ruta
+        self.alcance = alcance
+        self.archivo = open(ruta, 'w', encoding='utf-8')
+        self.archivo.write("# corrida gen consultas duplicados tasa\n")
+        self._makespans = {}
+        self.iniciar_corrida(0)
+
+    def iniciar_corrida(self, corrida):
+        """Descarta las huellas y reinicia los contadores de la corrida."""
+        self.corrida = corrida
+        self._makespans.clear()
+        self.consultas = self.duplicados = 0
+        self.consultas_corrida = self.duplicados_corrida = 0
+
+    def iniciar_generacion(self, reina=None, makespan=None):
+        """Reinicia los contadores de la generación y registra la reina (ya evaluada)."""
+        if self.alcance == 'generacion':
+            self._makespans.clear()
+        self.consultas = self.duplicados = 0
+        if reina is not None:
+            self._makespans[huella(reina)] = makespan
+
+    def buscar(self, cromosoma):
+        """
+        Busca un cromosoma entre los ya evaluados.
+        Returns:
+            tuple: (clave, makespan); makespan es None si el cromosoma es nuevo y hay
+            que evaluarlo y registrarlo con registrar(clave, makespan).
+        """
+
+        clave = huella(cromosoma)
+        makespan = self._makespans.get(clave)
+        self.consultas += 1
+        if makespan is not None:
+            self.duplicados += 1
+        return clave, makespan
+
+    def registrar(self, clave, makespan):
+        """Guarda el makespan de un cromosoma recién evaluado."""
+        self._makespans[clave] = makespan
+
+    def cerrar_generacion(self, gen):
+        """
+        Escribe la línea de la generación y acumula los contadores de la corrida.
+        Returns:
+            float: Tasa de duplicados de la generación.
+        """
+
+        tasa = self.duplicados / self.consultas if self.consultas else 0.0
+        self.consultas_corrida += self.consultas
+        self.duplicados_corrida += self.duplicados
+        self.archivo.write(f"{self.corrida} {gen} {self.consultas} {self.duplicados} {tasa:.4f}\n")
+        return tasa
+
+    def cerrar(self):
+        """Cierra el archivo de duplicados."""
+        if not self.archivo.closed:
+            self.archivo.close()
@@ -0,0 +1,51 @@
+"""
+Flujo de eventos JSONL de las corridas Evosocial.
+
+Cada línea es un objeto JSON con el tipo de evento, la marca de tiempo y los
+campos propios del evento:
+
+    corrida_inicio  motor, instancia, corrida, popsize, maxgen
+    nuevo_mejor     corrida, gen, mingl, evals
+    generacion      corrida, gen, mingl, avg, evals
+    corrida_fin     corrida, mingl, genmax, genfin, motivo, evals, segundos
+
+La escritura pasa por un buffer y se vuelca al final de cada corrida o cuando
+pasa `intervalo_s` desde el último volcado, de modo que otra herramienta puede
+seguir el archivo (tail -f) sin que el motor haga una escritura por evento.
+"""
+
+import json
+import time
+
+EVENTOS = ('corrida_inicio', 'nuevo_mejor', 'generacion', 'corrida_fin')
+
+
+class EscritorEventos:
+    """Escritor de eventos JSONL con buffer y volcado periódico."""
+
+    def __init__(self, ruta, buffer_bytes=1 << 16, intervalo_s=1.0):
+        self.ruta = ruta
+        self.intervalo_s = intervalo_s
+        self.archivo = open(ruta, 'w', encoding='utf-8', buffering=buffer_bytes)
+        self._ultimo_volcado = time.monotonic()
+
+    def emitir(self, evento, **campos):
+        """
+        Escribe un evento.
+        Args:
+            evento (str): Tipo de evento (ver EVENTOS).
+            **campos: Campos del evento (serializables a JSON).
+        """
+
+        registro = {'evento': evento, 't': round(time.time(), 3), **campos}
+        self.archivo.write(json.dumps(registro, separators=(',', ':')) + '\n')
+
+        ahora = time.monotonic()
+        if evento == 'corrida_fin' or ahora - self._ultimo_volcado >= self.intervalo_s:
+            self.archivo.flush()
+            self._ultimo_volcado = ahora
+
+    def cerrar(self):
+        """Vuelca y cierra el archivo."""
+        if not self.archivo.closed:
+            self.archivo.close()
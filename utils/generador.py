@@ -0,0 +1,192 @@
+"""
+Generador de instancias sintéticas con semilla, siguiendo el generador publicado
+por Taillard (1993), "Benchmarks for basic scheduling problems", EJOR 64.
+
+- Formato personalizado (el que leen ambos motores): upperb, lowerb y una línea de
+  tiempos por máquina. Los tiempos se generan como en el flow shop de Taillard
+  (máquina por máquina, uniformes en [1, 99]).
+- Formato JSPLIB (con ruteo): 4 líneas de cabecera, "jobs maquinas" y una línea por
+  job con pares "maquina tiempo". Tiempos y ruteo se generan como en el job shop de
+  Taillard (semilla de tiempos y semilla de máquinas). Es el formato de entrada de
+  utils/conversion.py.
+
+Uso:
+    python utils/generador.py --jobs 50 --maquinas 10 --semilla 873654221
+    python utils/generador.py --jobs 100 --maquinas 20 --semilla 1 --formato ambos --salida instancias/generadas
+"""
+
+import os
+import sys
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils.cotas import cota_inferior, cota_superior
+
+DIR_GENERADAS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instancias', 'generadas')
+
+
+def unif(semilla, low, high):
+    """
+    Generador congruencial de Taillard: devuelve un entero uniforme en [low, high]
+    y la semilla actualizada.
+    Args:
+        semilla (int): Semilla actual (1 .. 2^31 - 2).
+        low (int): Cota inferior.
+        high (int): Cota superior.
+    Returns:
+        tuple[int, int]: (valor, nueva_semilla)
+    """
+
+    m, a, b, c = 2147483647, 16807, 127773, 2836
+    k = semilla // b
+    semilla = a * (semilla % b) - k * c
+    if semilla < 0:
+        semilla += m
+    valor_0_1 = semilla / m
+    return low + int(valor_0_1 * (high - low + 1)), semilla
+
+
+def generar_flow_shop(jobs, maquinas, semilla):
+    """
+    Genera los tiempos de un flow shop de Taillard.
+    Returns:
+        np.ndarray: Tiempos de forma (maquinas, jobs).
+    """
+
+    tiempos = np.zeros((maquinas, jobs), dtype=np.int64)
+    for i in range(maquinas):
+        for j in range(jobs):
+            tiempos[i, j], semilla = unif(semilla, 1, 99)
+    return tiempos
+
+
+def generar_job_shop(jobs, maquinas, semilla_tiempos, semilla_maquinas):
+    """
+    Genera tiempos y ruteo de un job shop de Taillard.
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (tiempos, ruteo) de forma (jobs, maquinas);
+        ruteo[j, k] es la máquina (base 0) de la operación k del job j.
+    """
+
+    tiempos = np.zeros((jobs, maquinas), dtype=np.int64)
+    ruteo = np.tile(np.arange(maquinas, dtype=np.int64), (jobs, 1))
+    for j in range(jobs):
+        for k in range(maquinas):
+            tiempos[j, k], semilla_tiempos = unif(semilla_tiempos, 1, 99)
+    for j in range(jobs):
+        for k in range(maquinas):
+            destino, semilla_maquinas = unif(semilla_maquinas, k, maquinas - 1)
+            ruteo[j, k], ruteo[j, destino] = ruteo[j, destino], ruteo[j, k]
+    return tiempos, ruteo
+
+
+def escribir_custom(ruta, tiempos, upperb, lowerb):
+    """Escribe una instancia en el formato personalizado de los motores."""
+
+    with open(ruta, 'w') as f:
+        f.write(f"{upperb}\n")
+        f.write(f"{lowerb}\n")
+        for fila in tiempos:
+            f.write(" ".join(f"{t:3}" for t in fila) + "\n")
+
+
+def escribir_jsplib(ruta, nombre, tiempos, ruteo, semilla_tiempos, semilla_maquinas):
+    """Escribe una instancia de job shop en formato JSPLIB (máquinas base 0)."""
+
+    jobs, maquinas = tiempos.shape
+    with open(ruta, 'w') as f:
+        f.write("#" + "+" * 60 + "\n")
+        f.write(f"# instance {nombre}\n")
+        f.write("#" + "+" * 60 + "\n")
+        f.write(f"# Taillard generator, time seed {semilla_tiempos}, machine seed {semilla_maquinas}\n")
+        f.write(f"{jobs} {maquinas}\n")
+        for j in range(jobs):
+            f.write(" ".join(f"{ruteo[j, k]:2d} {tiempos[j, k]:2d}" for k in range(maquinas)) + "\n")
+
+
+def generar_instancia(jobs, maquinas, semilla, directorio=DIR_GENERADAS, formato='custom',
+                      semilla_maquinas=None):
+    """
+    Genera una instancia y la escribe en disco.
+    Args:
+        jobs (int): Cantidad de jobs.
+        maquinas (int): Cantidad de máquinas.
+        semilla (int): Semilla de tiempos de Taillard.
+        directorio (str): Directorio de salida (se crea si no existe).
+        formato (str): 'custom', 'jsplib' o 'ambos'.
+        semilla_maquinas (int, optional): Semilla de ruteo para JSPLIB (por defecto semilla + 1).
+    Returns:
+        dict: Rutas generadas ('custom' y/o 'jsplib') y cotas ('upperb', 'lowerb').
+    """
+
+    if formato not in ('custom', 'jsplib', 'ambos'):
+        raise ValueError(f"Formato desconocido: {formato}")
+
+    os.makedirs(directorio, exist_ok=True)
+    nombre = f"tai_{jobs}x{maquinas}_{semilla}"
+    resultado = {}
+
+    if formato in ('custom', 'ambos'):
+        tiempos = generar_flow_shop(jobs, maquinas, semilla)
+        upperb, lowerb = cota_superior(tiempos), cota_inferior(tiempos)
+        ruta = os.path.join(directorio, f"{nombre}.txt")
+        escribir_custom(ruta, tiempos, upperb, lowerb)
+        resultado.update({'custom': ruta, 'upperb': upperb, 'lowerb': lowerb})
+
+    if formato in ('jsplib', 'ambos'):
+        if semilla_maquinas is None:
+            semilla_maquinas = semilla + 1
+        tiempos_js, ruteo = generar_job_shop(jobs, maquinas, semilla, semilla_maquinas)
+        ruta = os.path.join(directorio, nombre)
+        escribir_jsplib(ruta, nombre, tiempos_js, ruteo, semilla, semilla_maquinas)
+        resultado['jsplib'] = ruta
+
+    return resultado
+
+
+def parsear_especificacion(texto):
+    """
+    Parsea una especificación 'JOBSxMAQUINAS[:SEMILLA]' (semilla por defecto 1).
+    Sirve como type= de argparse.
+    Returns:
+        tuple[int, int, int]: (jobs, maquinas, semilla)
+    Raises:
+        argparse.ArgumentTypeError: Si el formato es inválido o la semilla está
+            fuera de [1, 2^31 - 2].
+    """
+
+    tamano, _, semilla = texto.partition(':')
+    try:
+        jobs, maquinas = (int(valor) for valor in tamano.lower().split('x'))
+        semilla = int(semilla) if semilla else 1
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Especificación inválida: '{texto}' (formato JOBSxMAQUINAS[:SEMILLA])")
+    if jobs < 1 or maquinas < 1:
+        raise argparse.ArgumentTypeError(f"Jobs y máquinas deben ser positivos: '{texto}'")
+    if not 1 <= semilla < 2147483647:
+        raise argparse.ArgumentTypeError("La semilla debe estar en [1, 2^31 - 2]")
+    return jobs, maquinas, semilla
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generador de instancias de Taillard con semilla")
+    parser.add_argument('--jobs', type=int, required=True)
+    parser.add_argument('--maquinas', type=int, required=True)
+    parser.add_argument('--semilla', type=int, default=1, help="Semilla de tiempos")
+    parser.add_argument('--semilla-maquinas', type=int, default=None, help="Semilla de ruteo (JSPLIB)")
+    parser.add_argument('--formato', choices=['custom', 'jsplib', 'ambos'], default='custom')
+    parser.add_argument('--salida', default=DIR_GENERADAS, help="Directorio de salida")
+    args = parser.parse_args()
+
+    if not 1 <= args.semilla < 2147483647:
+        sys.exit("La semilla debe estar en [1, 2^31 - 2]")
+
+    generada = generar_instancia(args.jobs, args.maquinas, args.semilla, args.salida,
+                                 args.formato, args.semilla_maquinas)
+    for clave in ('custom', 'jsplib'):
+        if clave in generada:
+            print(f"Generada ({clave}): {generada[clave]}")
+    if 'upperb' in generada:
+        print(f"Cotas: [{generada['lowerb']}, {generada['upperb']}]")
@@ -0,0 +1,254 @@
+"""
+Heurísticas constructivas para el flow shop de permutación de los motores.
+
+NEH (Nawaz, Enscore y Ham, 1983): los jobs se ordenan por tiempo total
+decreciente y se insertan de a uno en la posición de la secuencia parcial que
+minimiza el makespan. Cada paso evalúa todas las posiciones de inserción a la
+vez con la aceleración de Taillard (1990): cabezas (e), colas (q) y tiempos de
+fin del job insertado (f) se calculan con sumas y máximos acumulados sobre
+toda la secuencia, de modo que insertar un job en una secuencia de k jobs
+cuesta O(k * maquinas) en NumPy y no k + 1 decodificaciones completas.
+
+La búsqueda local (busqueda_local) mejora una secuencia alternando dos
+vecindarios con primera mejora: inserción, evaluada con la misma aceleración
+(todas las posiciones de un job a la vez), e intercambio de dos jobs, evaluado
+en forma incremental: se reusan las cabezas del prefijo y las colas del sufijo
+y solo se recalcula el tramo entre las dos posiciones. MemeticaReina la aplica
+a la reina de los motores con presupuesto de evaluaciones y registro propio.
+
+La matriz de tiempos es la del formato personalizado: (maquinas, jobs).
+
+    orden, makespan, evaluaciones = neh(tiempos)
+    orden, makespan, evaluaciones = busqueda_local(tiempos, orden, makespan, max_evaluaciones=1000)
+"""
+
+import random
+
+import numpy as np
+
+
+def cabezas(tiempos, secuencia, inicio=None):
+    """
+    Tiempos de fin de cada prefijo de la secuencia en cada máquina.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+        secuencia (np.ndarray): Jobs de la secuencia (base 0).
+        inicio (np.ndarray, optional): Disponibilidad de cada máquina antes del primer
+            job (por defecto 0), para programar un tramo a continuación de otro.
+    Returns:
+        np.ndarray: (maquinas, len(secuencia) + 1); la columna h es el fin de los
+        primeros h jobs (la columna 0 es `inicio`).
+    """
+
+    procesamiento = tiempos[:, secuencia]
+    e = np.zeros((tiempos.shape[0], len(secuencia) + 1), dtype=np.int64)
+    if inicio is not None:
+        e[:, 0] = inicio
+    anterior = e[0, 1:]
+    for i in range(tiempos.shape[0]):
+        # e[i, h] = S[h] + max(e[i, 0], max_{l<=h} (e[i-1, l] - S[l-1])), con S la suma acumulada de la fila
+        acumulado = np.cumsum(procesamiento[i])
+        e[i, 1:] = acumulado + np.maximum(e[i, 0], np.maximum.accumulate(anterior - (acumulado - procesamiento[i])))
+        anterior = e[i, 1:]
+    return e
+
+
+def colas(tiempos, secuencia):
+    """
+    Tiempo desde el inicio de cada sufijo de la secuencia hasta el final, por máquina.
+    Returns:
+        np.ndarray: (maquinas, len(secuencia) + 1); la columna h es la cola desde el
+        job en la posición h (la última columna es 0).
+    """
+
+    return cabezas(tiempos[::-1], secuencia[::-1])[::-1, ::-1]
+
+
+def makespans_insercion(tiempos, secuencia, job):
+    """
+    Makespan de insertar un job en cada posición de una secuencia (Taillard).
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs), enteros.
+        secuencia (np.ndarray): Secuencia parcial (base 0), sin el job.
+        job (int): Job a insertar (base 0).
+    Returns:
+        np.ndarray: len(secuencia) + 1 makespans; el elemento h corresponde a
+        insertar el job antes de la posición h.
+    """
+
+    e = cabezas(tiempos, secuencia)
+    q = colas(tiempos, secuencia)
+    # f[i, h] = max(f[i-1, h], e[i, h]) + p[i, job], resuelto en forma cerrada sobre las máquinas
+    acumulado = np.cumsum(tiempos[:, job])[:, None]
+    f = acumulado + np.maximum.accumulate(e - (acumulado - tiempos[:, job][:, None]), axis=0)
+    return (f + q).max(axis=0)
+
+
+def neh(tiempos):
+    """
+    Secuencia NEH con desempate por la primera posición de menor makespan.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+    Returns:
+        tuple[np.ndarray, int, int]: (orden de los jobs en base 0, makespan,
+        evaluaciones). Las evaluaciones cuentan cada posición de inserción probada
+        (jobs * (jobs + 1) / 2 - 1), para comparar con el presupuesto de los motores.
+    """
+
+    tiempos = np.asarray(tiempos, dtype=np.int64)
+    candidatos = np.argsort(-tiempos.sum(axis=0), kind='stable')
+    secuencia = candidatos[:1]
+    makespan = int(tiempos[:, candidatos[0]].sum())
+    evaluaciones = 0
+    for job in candidatos[1:]:
+        makespans = makespans_insercion(tiempos, secuencia, job)
+        evaluaciones += makespans.size
+        posicion = int(np.argmin(makespans))
+        secuencia = np.insert(secuencia, posicion, job)
+        makespan = int(makespans[posicion])
+    return secuencia, makespan, evaluaciones
+
+
+def busqueda_local(tiempos, orden, makespan=None, max_evaluaciones=None):
+    """
+    Búsqueda local de primera mejora con vecindarios de inserción e intercambio.
+    Recorre los jobs en orden aleatorio y reinserta cada uno en la mejor de sus
+    posiciones si mejora el makespan. Cuando una pasada completa no mejora, prueba
+    intercambios de pares en orden aleatorio y acepta el primero que mejora; con
+    cada intercambio aceptado vuelve a la inserción. Termina en un óptimo local de
+    ambos vecindarios o al agotar el presupuesto.
+    Args:
+        tiempos (np.ndarray): Tiempos (maquinas, jobs).
+        orden (sequence[int]): Secuencia inicial (base 0).
+        makespan (int, optional): Makespan de la secuencia inicial; si falta se evalúa
+            (y cuenta como una evaluación).
+        max_evaluaciones (int, optional): Presupuesto; una pasada de inserción de un
+            job cuenta jobs - 1 evaluaciones y un intercambio, una.
+    Returns:
+        tuple[np.ndarray, int, int]: (secuencia, makespan, evaluaciones).
+    """
+
+    tiempos = np.asarray(tiempos, dtype=np.int64)
+    secuencia = np.array(orden, dtype=np.int64)
+    n = secuencia.size
+    evaluaciones = 0
+    if makespan is None:
+        makespan = int(cabezas(tiempos, secuencia)[-1, -1])
+        evaluaciones += 1
+    presupuesto = float('inf') if max_evaluaciones is None else max_evaluaciones
+    if n < 2:
+        return secuencia, int(makespan), evaluaciones
+
+    pares = [(a, b) for a in range(n - 1) for b in range(a + 1, n)]
+    mejoro = True
+    while mejoro:
+        mejoro = False
+        # Inserción: todas las posiciones de un job en una sola evaluación acelerada
+        for job in random.sample(secuencia.tolist(), n):
+            if evaluaciones + n - 1 > presupuesto:
+                return secuencia, int(makespan), evaluaciones
+            resto = secuencia[secuencia != job]
+            makespans = makespans_insercion(tiempos, resto, job)
+            evaluaciones += n - 1  # La posición original no es una evaluación nueva
+            posicion = int(np.argmin(makespans))
+            if makespans[posicion] < makespan:
+                secuencia = np.insert(resto, posicion, job)
+                makespan = int(makespans[posicion])
+                mejoro = True
+        if mejoro:
+            continue
+
+        # Intercambio: solo se recalcula el tramo [a, b] sobre las cabezas del prefijo
+        e = cabezas(tiempos, secuencia)
+        q = colas(tiempos, secuencia)
+        random.shuffle(pares)
+        for a, b in pares:
+            if evaluaciones + 1 > presupuesto:
+                return secuencia, int(makespan), evaluaciones
+            tramo = secuencia[a:b + 1].copy()
+            tramo[0], tramo[-1] = tramo[-1], tramo[0]
+            fin = cabezas(tiempos, tramo, inicio=e[:, a])[:, -1]
+            evaluaciones += 1
+            candidato = int((fin + q[:, b + 1]).max())
+            if candidato < makespan:
+                secuencia[a:b + 1] = tramo
+                makespan = candidato
+                mejoro = True
+                break
+    return secuencia, int(makespan), evaluaciones
+
+
+class MemeticaReina:
+    """
+    Paso memético sobre la reina: búsqueda local acotada cada `cada` generaciones
+    y/o cada vez que la reina mejora. Lleva la cuenta de sus evaluaciones aparte
+    de las del motor (que igual las suma a evals) y escribe una línea por
+    aplicación.
+
+    Formato del archivo (una línea por aplicación):
+        corrida gen evals antes despues
+
+    Args:
+        ruta (str): Archivo de registro (memetica_*.txt).
+        cada (int): Aplicar cada `cada` generaciones (0 = no periódica).
+        al_mejorar (bool): Aplicar en las generaciones en que mejora la reina.
+        evals_aplicacion (int): Presupuesto de evaluaciones por aplicación.
+        max_evals_corrida (int, optional): Presupuesto total por corrida (None = sin límite).
+    """
+
+    def __init__(self, ruta, cada=0, al_mejorar=False, evals_aplicacion=1000, max_evals_corrida=None):
+        self.ruta = ruta
+        self.cada = cada
+        self.al_mejorar = al_mejorar
+        self.evals_aplicacion = evals_aplicacion
+        self.max_evals_corrida = max_evals_corrida
+        self.archivo = open(ruta, 'w', encoding='utf-8')
+        self.archivo.write("# corrida gen evals antes despues\n")
+        self.iniciar_corrida(0)
+
+    def iniciar_corrida(self, corrida):
+        """Reinicia la cuenta de evaluaciones, aplicaciones y mejoras de la corrida."""
+        self.corrida = corrida
+        self.evals = 0
+        self.aplicaciones = 0
+        self.mejoras = 0
+
+    def corresponde(self, gen, mejoro):
+        """True si hay que aplicar la búsqueda en esta generación y queda presupuesto."""
+        if self.max_evals_corrida is not None and self.evals >= self.max_evals_corrida:
+            return False
+        return bool((self.cada and gen % self.cada == 0) or (self.al_mejorar and mejoro))
+
+    def aplicar(self, tiempos, orden, makespan, gen):
+        """
+        Ejecuta la búsqueda local y la registra.
+        Args:
+            tiempos (np.ndarray): Tiempos (maquinas, jobs).
+            orden (sequence[int]): Secuencia de la reina (base 0).
+            makespan (int, optional): Makespan de esa secuencia (None = evaluarla, con
+                costo de una evaluación).
+            gen (int): Generación actual.
+        Returns:
+            tuple[np.ndarray, int, int]: (secuencia, makespan, evaluaciones) de busqueda_local.
+        """
+
+        presupuesto = self.evals_aplicacion
+        if self.max_evals_corrida is not None:
+            presupuesto = min(presupuesto, self.max_evals_corrida - self.evals)
+        evaluaciones = 0
+        if makespan is None:
+            makespan = int(cabezas(np.asarray(tiempos, dtype=np.int64), np.asarray(orden))[-1, -1])
+            evaluaciones = 1
+        secuencia, nuevo, evaluaciones_busqueda = busqueda_local(tiempos, orden, makespan,
+                                                                 presupuesto - evaluaciones)
+        evaluaciones += evaluaciones_busqueda
+        self.evals += evaluaciones
+        self.aplicaciones += 1
+        self.mejoras += nuevo < makespan
+        self.archivo.write(f"{self.corrida} {gen} {evaluaciones} {makespan} {nuevo}\n")
+        return secuencia, nuevo, evaluaciones
+
+    def cerrar(self):
+        """Cierra el archivo de registro."""
+        if not self.archivo.closed:
+            self.archivo.close()
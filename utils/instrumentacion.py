@@ -0,0 +1,214 @@
+"""
+Instrumentación opcional de las corridas Evosocial: tiempo acumulado por fase
+dentro de cada generación y evaluaciones por segundo, y consumo de memoria
+(tracemalloc y RSS pico) por generación y por corrida.
+
+Los motores guardan un cronómetro global (None cuando está deshabilitado) y solo
+llaman a marcar() detrás de un `if cronometro is not None`, de modo que con la
+instrumentación apagada el costo es una comparación por punto de control. El
+monitor de memoria sigue el mismo patrón.
+"""
+
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Fases en que se reparte el tiempo de una generación
+FASES = ('inmigrante', 'cruce', 'mutacion', 'evaluacion', 'seleccion', 'io')
+
+
+def ruta_companera(archivo_detalle, prefijo):
+    """
+    Deriva la ruta de un archivo compañero del archivo de detalle.
+    Reemplaza el prefijo 'detalle' del nombre por `prefijo`, en el mismo directorio:
+    detalle_converted_swv06.txt -> <prefijo>_converted_swv06.txt
+    Args:
+        archivo_detalle (str): Ruta del archivo de detalle.
+        prefijo (str): Prefijo del archivo compañero.
+    Returns:
+        str: Ruta del archivo compañero.
+    """
+
+    directorio, nombre = os.path.split(archivo_detalle)
+    if nombre.startswith('detalle'):
+        nombre = prefijo + nombre[len('detalle'):]
+    else:
+        nombre = f"{prefijo}_{nombre}"
+    return os.path.join(directorio, nombre)
+
+
+class CronometroFases:
+    """
+    Acumula tiempo por fase con marcas sucesivas: marcar(fase) atribuye a `fase`
+    el tiempo transcurrido desde la marca anterior. Al cerrar cada generación
+    escribe una línea con el tiempo por fase, el total, las evaluaciones de la
+    generación y las evaluaciones por segundo.
+
+    Formato del archivo (una línea por generación y corrida):
+        corrida gen inmigrante cruce mutacion evaluacion seleccion io total evals evals_seg
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.archivo = open(ruta, 'w', encoding='utf-8')
+        self.archivo.write("# corrida gen " + " ".join(FASES) + " total evals evals_seg\n")
+        self.acumulado = dict.fromkeys(FASES, 0.0)
+        self._t = perf_counter()
+        self._t_gen = self._t
+
+    def iniciar_generacion(self):
+        """Reinicia los acumuladores y el reloj al comienzo de una generación."""
+        for fase in FASES:
+            self.acumulado[fase] = 0.0
+        self._t = self._t_gen = perf_counter()
+
+    def reiniciar(self):
+        """Descarta el tiempo transcurrido desde la última marca."""
+        self._t = perf_counter()
+
+    def marcar(self, fase):
+        """Atribuye a `fase` el tiempo transcurrido desde la marca anterior."""
+        t = perf_counter()
+        self.acumulado[fase] += t - self._t
+        self._t = t
+
+    def cerrar_generacion(self, corrida, gen, evals_gen):
+        """
+        Escribe la línea de la generación.
+        Args:
+            corrida (int): Índice de la corrida.
+            gen (int): Número de generación.
+            evals_gen (int): Evaluaciones realizadas en la generación.
+        Returns:
+            float: Evaluaciones por segundo de la generación.
+        """
+
+        total = perf_counter() - self._t_gen
+        evals_seg = evals_gen / total if total > 0 else 0.0
+        tiempos = " ".join(f"{self.acumulado[fase]:.6f}" for fase in FASES)
+        self.archivo.write(f"{corrida} {gen} {tiempos} {total:.6f} {evals_gen} {evals_seg:.1f}\n")
+        return evals_seg
+
+    def cerrar(self):
+        """Cierra el archivo de tiempos."""
+        if not self.archivo.closed:
+            self.archivo.close()
+
+
+def rss_pico_kib():
+    """
+    RSS pico del proceso en KiB (None si la plataforma no expone getrusage).
+    Es el máximo desde el inicio del proceso, no de la corrida.
+    """
+
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB; macOS, bytes
+    return pico / 1024 if sys.platform == 'darwin' else float(pico)
+
+
+def lineas_memoria(picos_kib):
+    """
+    Líneas para el archivo tiempo_ejecucion_*: pico de tracemalloc por corrida,
+    pico global y RSS pico del proceso.
+    Args:
+        picos_kib (list[float]): Pico de tracemalloc de cada corrida, en KiB.
+    Returns:
+        list[str]: Líneas terminadas en salto de línea.
+    """
+
+    if not picos_kib:
+        return []
+    lineas = [f"Memoria corrida {k}: {pico / 1024:.2f} MiB (tracemalloc)\n" for k, pico in enumerate(picos_kib)]
+    lineas.append(f"Memoria pico: {max(picos_kib) / 1024:.2f} MiB (tracemalloc)\n")
+    rss = rss_pico_kib()
+    if rss is not None:
+        lineas.append(f"RSS pico: {rss / 1024:.2f} MiB\n")
+    return lineas
+
+
+class MonitorMemoria:
+    """
+    Registra el consumo de memoria de cada generación con tracemalloc y el RSS
+    pico del proceso, y los sitios de asignación con más memoria viva.
+
+    Archivos (uno por experimento):
+        <ruta>          corrida gen actual_kib pico_kib rss_pico_kib
+        <ruta_sitios>   corrida gen rango kib bloques archivo:linea
+
+    El pico de tracemalloc se reinicia al comienzo de cada corrida, por lo que
+    pico_corrida() es propio de la corrida; el RSS pico es el del proceso.
+    """
+
+    def __init__(self, ruta, ruta_sitios=None, top=5):
+        self.ruta = ruta
+        self.ruta_sitios = ruta_sitios
+        self.top = top
+        self.picos = []
+        self._iniciado_aqui = not tracemalloc.is_tracing()
+        if self._iniciado_aqui:
+            tracemalloc.start()
+        self._filtros = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+        self.archivo = open(ruta, 'w', encoding='utf-8')
+        self.archivo.write("# corrida gen actual_kib pico_kib rss_pico_kib\n")
+        self.archivo_sitios = None
+        if ruta_sitios is not None and top > 0:
+            self.archivo_sitios = open(ruta_sitios, 'w', encoding='utf-8')
+            self.archivo_sitios.write("# corrida gen rango kib bloques sitio\n")
+
+    def iniciar_corrida(self):
+        """Reinicia el pico de tracemalloc al comienzo de una corrida."""
+        tracemalloc.reset_peak()
+
+    def cerrar_generacion(self, corrida, gen):
+        """
+        Escribe la memoria de la generación y, si corresponde, los sitios top.
+        Args:
+            corrida (int): Índice de la corrida.
+            gen (int): Número de generación.
+        """
+
+        actual, pico = tracemalloc.get_traced_memory()
+        rss = rss_pico_kib()
+        rss_texto = f"{rss:.0f}" if rss is not None else "nan"
+        self.archivo.write(f"{corrida} {gen} {actual / 1024:.1f} {pico / 1024:.1f} {rss_texto}\n")
+
+        if self.archivo_sitios is not None:
+            sitios = tracemalloc.take_snapshot().filter_traces(self._filtros).statistics('lineno')
+            for rango, sitio in enumerate(sitios[:self.top], start=1):
+                origen = sitio.traceback[0]
+                self.archivo_sitios.write(
+                    f"{corrida} {gen} {rango} {sitio.size / 1024:.1f} {sitio.count} "
+                    f"{os.path.basename(origen.filename)}:{origen.lineno}\n")
+
+    def cerrar_corrida(self):
+        """
+        Registra los picos de la corrida.
+        Returns:
+            tuple[float, float | None]: (pico tracemalloc en KiB, RSS pico en KiB)
+        """
+
+        _, pico = tracemalloc.get_traced_memory()
+        picos = (pico / 1024, rss_pico_kib())
+        self.picos.append(picos)
+        return picos
+
+    def cerrar(self):
+        """Cierra los archivos y detiene tracemalloc si lo inició este monitor."""
+        for archivo in (self.archivo, self.archivo_sitios):
+            if archivo is not None and not archivo.closed:
+                archivo.close()
+        if self._iniciado_aqui and tracemalloc.is_tracing():
+            tracemalloc.stop()
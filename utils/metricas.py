@@ -0,0 +1,161 @@
+"""
+Endpoint local de métricas en formato de texto de Prometheus.
+
+Un servidor HTTP corre en un hilo daemon (por defecto solo en 127.0.0.1) y
+expone, por corrida, las evaluaciones acumuladas, las evaluaciones por segundo
+de la última generación, el mejor makespan, la generación actual y la tasa de
+aciertos del caché de evaluaciones, además de agregados sobre todas las
+corridas del proceso. Cada serie lleva las etiquetas motor, instancia, pid y
+corrida, de modo que varios procesos (uno por puerto) se agregan en Prometheus
+con sum/min by(...).
+
+Los motores llaman a actualizar() una vez por generación; el costo es tomar un
+lock y actualizar un diccionario.
+
+    python main.py --metricas-puerto 9100
+    curl -s localhost:9100/metrics
+"""
+
+import os
+import threading
+from time import perf_counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIJO = 'evosocial'
+
+# (nombre, tipo, ayuda, clave en el estado de cada corrida)
+_METRICAS_CORRIDA = (
+    ('evaluaciones_total', 'counter', 'Evaluaciones de la función objetivo', 'evals'),
+    ('evaluaciones_por_segundo', 'gauge', 'Evaluaciones por segundo en la última generación', 'evals_seg'),
+    ('mejor_makespan', 'gauge', 'Mejor makespan de la corrida (mingl)', 'mingl'),
+    ('generacion', 'gauge', 'Generación actual', 'gen'),
+    ('cache_tasa_aciertos', 'gauge', 'Tasa de aciertos del caché de evaluaciones', 'tasa_cache'),
+)
+
+
+def _etiquetas(**valores):
+    pares = ",".join(f'{clave}="{str(valor)}"' for clave, valor in valores.items())
+    return "{" + pares + "}"
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        cuerpo = self.server.metricas.exponer().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        # Sin log de accesos en consola
+        pass
+
+
+class ServidorMetricas:
+    """
+    Estado de las corridas y servidor HTTP que lo expone.
+    Args:
+        puerto (int): Puerto TCP (0 = uno libre elegido por el sistema).
+        host (str): Dirección de escucha (por defecto solo localhost).
+        motor (str): Etiqueta del motor ('puro' o 'deap').
+        instancia (str): Etiqueta de la instancia.
+    """
+
+    def __init__(self, puerto=9100, host='127.0.0.1', motor='', instancia=''):
+        self.motor = motor
+        self.instancia = instancia
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._corridas = {}
+        self._completadas = 0
+
+        self._servidor = ThreadingHTTPServer((host, puerto), _ManejadorMetricas)
+        self._servidor.daemon_threads = True
+        self._servidor.metricas = self
+        self.host, self.puerto = self._servidor.server_address[:2]
+        self._hilo = threading.Thread(target=self._servidor.serve_forever, name='evosocial-metricas', daemon=True)
+        self._hilo.start()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.puerto}/metrics"
+
+    def actualizar(self, corrida, gen, evals, mingl):
+        """
+        Registra el estado de una corrida al cerrar una generación.
+        Args:
+            corrida (int): Índice de la corrida.
+            gen (int): Generación actual.
+            evals (int): Evaluaciones acumuladas de la corrida.
+            mingl (float): Mejor makespan de la corrida.
+        """
+
+        ahora = perf_counter()
+        with self._lock:
+            estado = self._corridas.get(corrida)
+            if estado is None or gen < estado['gen']:
+                estado = self._corridas[corrida] = {'evals': 0, 'evals_seg': 0.0, 'mingl': mingl, 'gen': 0,
+                                                    'tasa_cache': None, '_t': ahora, '_evals': 0}
+            dt = ahora - estado['_t']
+            if dt > 0:
+                estado['evals_seg'] = (evals - estado['_evals']) / dt
+            estado.update({'evals': evals, 'mingl': mingl, 'gen': gen, '_t': ahora, '_evals': evals})
+
+    def actualizar_cache(self, corrida, aciertos, consultas):
+        """Registra la tasa de aciertos del caché de evaluaciones de una corrida."""
+
+        with self._lock:
+            if corrida in self._corridas and consultas > 0:
+                self._corridas[corrida]['tasa_cache'] = aciertos / consultas
+
+    def finalizar_corrida(self, corrida):
+        """Marca una corrida como terminada (su tasa de evaluaciones pasa a 0)."""
+
+        with self._lock:
+            if corrida in self._corridas:
+                self._corridas[corrida]['evals_seg'] = 0.0
+            self._completadas += 1
+
+    def exponer(self):
+        """Devuelve todas las métricas en formato de texto de Prometheus."""
+
+        base = {'motor': self.motor, 'instancia': self.instancia, 'pid': self.pid}
+        with self._lock:
+            corridas = {k: dict(v) for k, v in self._corridas.items()}
+            completadas = self._completadas
+
+        lineas = []
+        for nombre, tipo, ayuda, clave in _METRICAS_CORRIDA:
+            lineas.append(f"# HELP {PREFIJO}_{nombre} {ayuda}")
+            lineas.append(f"# TYPE {PREFIJO}_{nombre} {tipo}")
+            for corrida, estado in sorted(corridas.items()):
+                if estado[clave] is not None:
+                    lineas.append(f"{PREFIJO}_{nombre}{_etiquetas(**base, corrida=corrida)} {estado[clave]}")
+
+        # Agregados sobre todas las corridas del proceso
+        agregados = (
+            ('evaluaciones_agregadas_total', 'counter', 'Evaluaciones de todas las corridas',
+             sum(e['evals'] for e in corridas.values())),
+            ('evaluaciones_por_segundo_agregadas', 'gauge', 'Evaluaciones por segundo de todas las corridas',
+             sum(e['evals_seg'] for e in corridas.values())),
+            ('mejor_makespan_global', 'gauge', 'Mejor makespan entre todas las corridas',
+             min((e['mingl'] for e in corridas.values()), default=None)),
+            ('corridas_completadas_total', 'counter', 'Corridas terminadas', completadas),
+        )
+        for nombre, tipo, ayuda, valor in agregados:
+            if valor is None:
+                continue
+            lineas.append(f"# HELP {PREFIJO}_{nombre} {ayuda}")
+            lineas.append(f"# TYPE {PREFIJO}_{nombre} {tipo}")
+            lineas.append(f"{PREFIJO}_{nombre}{_etiquetas(**base)} {valor}")
+
+        return "\n".join(lineas) + "\n"
+
+    def cerrar(self):
+        """Detiene el servidor."""
+        self._servidor.shutdown()
+        self._servidor.server_close()
@@ -0,0 +1,55 @@
+"""
+Carga de los motores Evosocial (jssp_puro y jssp_deap) como módulos.
+Ambas implementaciones se llaman main.py y están pensadas para ejecutarse desde
+su propio directorio, por lo que se importan por ruta con nombres distintos.
+"""
+
+import os
+import sys
+import importlib.util
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIR_INSTANCIAS = os.path.join(RAIZ, 'instancias')
+
+_MOTORES = {
+    'puro': os.path.join(RAIZ, 'jssp_puro', 'main.py'),
+    'deap': os.path.join(RAIZ, 'jssp_deap', 'main.py'),
+}
+
+
+def cargar_motor(nombre):
+    """
+    Importa el main.py de un motor y lo devuelve como módulo.
+    El módulo se registra en sys.modules como 'evosocial_<nombre>', de modo que
+    cargas sucesivas devuelven el mismo objeto.
+    Args:
+        nombre (str): 'puro' o 'deap'.
+    Returns:
+        module: Módulo del motor.
+    Raises:
+        ValueError: Si el motor no existe.
+        ImportError: Si faltan dependencias del motor (por ejemplo deap).
+    """
+
+    if nombre not in _MOTORES:
+        raise ValueError(f"Motor desconocido: {nombre} (opciones: {', '.join(_MOTORES)})")
+
+    nombre_modulo = f"evosocial_{nombre}"
+    if nombre_modulo in sys.modules:
+        return sys.modules[nombre_modulo]
+
+    ruta = _MOTORES[nombre]
+    directorio = os.path.dirname(ruta)
+    # jssp_puro/main.py importa 'globals' desde su propio directorio
+    if directorio not in sys.path:
+        sys.path.insert(0, directorio)
+
+    spec = importlib.util.spec_from_file_location(nombre_modulo, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nombre_modulo] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    except BaseException:
+        del sys.modules[nombre_modulo]
+        raise
+    return modulo
@@ -0,0 +1,137 @@
+"""
+Perfilado de corridas Evosocial con cProfile y, en Python 3.12+, contadores de
+líneas basados en sys.monitoring.
+
+Por cada corrida perfilada se generan:
+    <base>.pstats        Estadísticas crudas de cProfile (pstats / snakeviz)
+    <base>_resumen.txt   Ranking de funciones por tiempo acumulado y propio,
+                         y, si se pidió, las líneas más ejecutadas del motor
+"""
+
+import io
+import os
+import sys
+import cProfile
+import linecache
+import pstats
+
+from utils.registro import log, SILENCIO, INFO
+
+# Solo se cuentan líneas de los motores
+DIRECTORIOS_MOTORES = ('jssp_puro', 'jssp_deap')
+
+
+class ContadorLineas:
+    """
+    Cuenta ejecuciones de líneas de los motores usando sys.monitoring (PEP 669).
+    Las ubicaciones que no pertenecen a los motores se deshabilitan en el primer
+    evento, por lo que el resto del código corre casi sin sobrecosto.
+    """
+
+    def __init__(self, directorios=DIRECTORIOS_MOTORES):
+        self.directorios = tuple(os.sep + d + os.sep for d in directorios)
+        self.conteos = {}
+        self.tool_id = None
+
+    @staticmethod
+    def disponible():
+        """True si el intérprete soporta sys.monitoring (Python 3.12+)."""
+        return hasattr(sys, 'monitoring')
+
+    def _on_line(self, code, linea):
+        if not any(d in code.co_filename for d in self.directorios):
+            return sys.monitoring.DISABLE
+        clave = (code.co_filename, linea, code.co_name)
+        self.conteos[clave] = self.conteos.get(clave, 0) + 1
+
+    def iniciar(self):
+        monitoring = sys.monitoring
+        # cProfile usa su propio tool id; se toma el primero libre
+        for tool_id in range(6):
+            try:
+                monitoring.use_tool_id(tool_id, "evosocial-lineas")
+            except ValueError:
+                continue
+            self.tool_id = tool_id
+            break
+        else:
+            raise RuntimeError("No hay tool ids de sys.monitoring disponibles")
+        monitoring.register_callback(self.tool_id, monitoring.events.LINE, self._on_line)
+        monitoring.set_events(self.tool_id, monitoring.events.LINE)
+
+    def detener(self):
+        if self.tool_id is None:
+            return
+        monitoring = sys.monitoring
+        monitoring.set_events(self.tool_id, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(self.tool_id, monitoring.events.LINE, None)
+        monitoring.free_tool_id(self.tool_id)
+        self.tool_id = None
+
+    def top(self, n):
+        """Devuelve las n líneas más ejecutadas como (conteo, archivo, línea, función)."""
+        ordenadas = sorted(self.conteos.items(), key=lambda item: item[1], reverse=True)
+        return [(conteo, archivo, linea, funcion) for (archivo, linea, funcion), conteo in ordenadas[:n]]
+
+
+def escribir_resumen(ruta, perfil, contador=None, top=30):
+    """
+    Escribe el ranking de funciones por tiempo acumulado y propio.
+    Args:
+        ruta (str): Archivo de texto de salida.
+        perfil (cProfile.Profile): Perfil ya detenido.
+        contador (ContadorLineas, optional): Contador de líneas a incluir.
+        top (int): Cantidad de entradas por ranking.
+    """
+
+    with open(ruta, 'w', encoding='utf-8') as f:
+        for orden, titulo in (('cumulative', 'tiempo acumulado'), ('tottime', 'tiempo propio')):
+            buffer = io.StringIO()
+            estadisticas = pstats.Stats(perfil, stream=buffer)
+            estadisticas.strip_dirs().sort_stats(orden).print_stats(top)
+            f.write(f"=== Top {top} funciones por {titulo} ({orden}) ===\n")
+            f.write(buffer.getvalue())
+            f.write("\n")
+
+        if contador is not None:
+            f.write(f"=== Top {top} líneas ejecutadas (sys.monitoring) ===\n")
+            for conteo, archivo, linea, funcion in contador.top(top):
+                fuente = linecache.getline(archivo, linea).strip()
+                f.write(f"{conteo:12d}  {os.path.basename(archivo)}:{linea} ({funcion})  {fuente}\n")
+
+
+def perfilar(funcion, ruta_base, lineas=False, top=30):
+    """
+    Ejecuta funcion() bajo cProfile y guarda <ruta_base>.pstats y <ruta_base>_resumen.txt.
+    Args:
+        funcion (callable): Función sin argumentos a perfilar (por ejemplo una corrida).
+        ruta_base (str): Ruta de salida sin extensión.
+        lineas (bool): Si es True y hay sys.monitoring, cuenta además las líneas
+            ejecutadas de los motores.
+        top (int): Cantidad de entradas en los rankings.
+    Returns:
+        Valor retornado por funcion().
+    """
+
+    contador = None
+    if lineas:
+        if ContadorLineas.disponible():
+            contador = ContadorLineas()
+        else:
+            log(SILENCIO, "!  Contadores de línea requieren Python 3.12+ (sys.monitoring); se omiten.")
+
+    perfil = cProfile.Profile()
+    if contador is not None:
+        contador.iniciar()
+    perfil.enable()
+    try:
+        resultado = funcion()
+    finally:
+        perfil.disable()
+        if contador is not None:
+            contador.detener()
+
+    perfil.dump_stats(f"{ruta_base}.pstats")
+    escribir_resumen(f"{ruta_base}_resumen.txt", perfil, contador, top)
+    log(INFO, f"- Perfil guardado: {ruta_base}.pstats / {ruta_base}_resumen.txt")
+    return resultado
@@ -0,0 +1,37 @@
+"""
+Niveles de verbosidad de los motores Evosocial.
+
+Por defecto los motores no escriben nada en consola (nivel SILENCIO), salvo
+errores y advertencias, que se imprimen siempre. Cada -v sube un nivel:
+
+    0 SILENCIO     solo errores y advertencias
+    1 INFO         configuración, inicio y fin de cada corrida, archivos generados
+    2 GENERACION   una línea por generación y cada nuevo mejor global
+    3 DEBUG        progreso dentro de la generación y cierre de archivos
+"""
+
+SILENCIO, INFO, GENERACION, DEBUG = 0, 1, 2, 3
+
+_nivel = SILENCIO
+
+
+def configurar_verbosidad(nivel):
+    """Fija el nivel de verbosidad global (se satura en DEBUG)."""
+    global _nivel
+    _nivel = max(SILENCIO, min(int(nivel), DEBUG))
+
+
+def verbosidad():
+    """Devuelve el nivel de verbosidad actual."""
+    return _nivel
+
+
+def activo(nivel):
+    """True si los mensajes de `nivel` se imprimen; permite evitar formatear mensajes caros."""
+    return _nivel >= nivel
+
+
+def log(nivel, *args, **kwargs):
+    """print() condicionado al nivel de verbosidad."""
+    if _nivel >= nivel:
+        print(*args, **kwargs)